@@ -0,0 +1,201 @@
+# Non-interactive command line for the ML-based ATSSystem
+# Usage:
+#   python ats_cli.py train resumes.csv [--mode full|streaming|cv|update]
+#   python ats_cli.py score resume.pdf resumes/ - [--workers 4]    ('-' reads resume text from stdin)
+#   python ats_cli.py info
+#   python ats_cli.py serve [--address 127.0.0.1:6071]    (warm model for inference_worker.InferenceClient)
+# Results are JSON lines on stdout; progress messages go to stderr.
+import argparse
+import contextlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional
+
+from config import ALLOWED_EXTENSIONS, INFERENCE_WORKER
+
+# Exit codes
+EXIT_OK = 0
+EXIT_FAILED = 1         # Training failed, or some documents could not be scored
+EXIT_USAGE = 2          # Bad arguments or unreadable input (also argparse's own code)
+EXIT_NO_MODEL = 3       # Scoring requested without a trained model
+
+SCORABLE_EXTENSIONS = tuple(f'.{extension}' for extension in ALLOWED_EXTENSIONS + ['htm'])
+
+_WORKER_SYSTEM = None
+
+def _quiet():
+    """Send the progress ATSSystem prints to stderr, keeping stdout for JSON lines"""
+    return contextlib.redirect_stdout(sys.stderr)
+
+def _load_system(model_file: str, model_dir: Optional[str]):
+    from ats_system_fixed import ATSSystem
+    with _quiet():
+        return ATSSystem(model_file, model_dir)
+
+def _emit(record: Dict):
+    print(json.dumps(record, default=str), flush=True)
+
+def _score_text(system, text: Optional[str], source: str) -> Dict:
+    with _quiet():
+        results = system.calculate_ats_score(text) if text else None
+    if results is None:
+        return {'source': source, 'error': 'No valid text found in resume'}
+    return {'source': source, **results}
+
+def _score_file(system, path: str) -> Dict:
+    with _quiet():
+        text = system.extract_text_from_file(path)
+    if text is None:
+        return {'source': path, 'error': 'Could not extract text from file'}
+    return _score_text(system, text, path)
+
+def _init_worker(model_file: str, model_dir: Optional[str]):
+    global _WORKER_SYSTEM
+    _WORKER_SYSTEM = _load_system(model_file, model_dir)
+
+def _score_file_in_worker(path: str) -> Dict:
+    return _score_file(_WORKER_SYSTEM, path)
+
+def collect_files(paths: List[str]) -> List[str]:
+    """Files to score: files as given, and every resume file under each directory, sorted"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, subdirectories, names in os.walk(path):
+                subdirectories[:] = sorted(name for name in subdirectories if not name.startswith('.'))
+                files.extend(os.path.join(directory, name) for name in sorted(names)
+                             if name.lower().endswith(SCORABLE_EXTENSIONS) and not name.startswith('.'))
+        else:
+            files.append(path)
+    return files
+
+def score_files(files: List[str], model_file: str, model_dir: Optional[str], workers: int, system=None) -> Iterator[Dict]:
+    """Score files in order, in a pool of worker processes each holding its own warm model"""
+    if workers <= 1 or len(files) <= 1:
+        system = system or _load_system(model_file, model_dir)
+        for path in files:
+            yield _score_file(system, path)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(model_file, model_dir)) as pool:
+        yield from pool.map(_score_file_in_worker, files)
+
+def command_train(args) -> int:
+    system = _load_system(args.model_file, args.model_dir)
+    with _quiet():
+        if args.mode == 'streaming':
+            trained = system.train_model_streaming(args.csv, args.chunk_size)
+        elif args.mode == 'update':
+            trained = system.update_model(args.csv, args.chunk_size)
+        elif args.mode == 'cv':
+            trained = system.train_model_cv(args.csv, args.folds, n_jobs=args.jobs)
+        else:
+            trained = system.train_model_from_csv(args.csv)
+    if not trained:
+        _emit({'trained': False, 'csv': args.csv})
+        return EXIT_FAILED
+    _emit({'trained': True, 'csv': args.csv, **_model_info(system)})
+    return EXIT_OK
+
+def command_score(args) -> int:
+    system = _load_system(args.model_file, args.model_dir)
+    if not system.is_trained:
+        print("No trained model found. Run 'ats_cli.py train <csv>' first.", file=sys.stderr)
+        return EXIT_NO_MODEL
+
+    paths = [path for path in args.inputs if path != '-']
+    missing = [path for path in paths if not os.path.exists(path)]
+    if missing:
+        print(f"Input not found: {', '.join(missing)}", file=sys.stderr)
+        return EXIT_USAGE
+
+    failed = 0
+    if '-' in args.inputs:
+        record = _score_text(system, sys.stdin.read(), '-')
+        failed += 'error' in record
+        _emit(record)
+    for record in score_files(collect_files(paths), args.model_file, args.model_dir, args.workers, system):
+        failed += 'error' in record
+        _emit(record)
+    return EXIT_FAILED if failed else EXIT_OK
+
+def _model_info(system) -> Dict:
+    info = {
+        'trained': system.is_trained,
+        'model_file': system.model_file,
+        'artifact': system.artifact.directory if system.artifact is not None else None
+    }
+    if system.is_trained:
+        info.update(training_date=system.training_date, accuracy=system.accuracy, categories=list(system.categories))
+    return info
+
+def command_info(args) -> int:
+    from ats_system_fixed import DOCX_AVAILABLE, PDF_AVAILABLE
+    system = _load_system(args.model_file, args.model_dir)
+    _emit({**_model_info(system), 'pdf_support': PDF_AVAILABLE, 'docx_support': DOCX_AVAILABLE})
+    return EXIT_OK
+
+def command_serve(args) -> int:
+    from inference_worker import InferenceWorker
+    system = _load_system(args.model_file, args.model_dir)
+    if not system.is_trained:
+        print("No trained model found. Run 'ats_cli.py train <csv>' first.", file=sys.stderr)
+        return EXIT_NO_MODEL
+
+    host, _, port = args.address.rpartition(':')
+    if not host or not port.isdigit():
+        print(f"Address must be host:port, not {args.address}", file=sys.stderr)
+        return EXIT_USAGE
+    try:
+        worker = InferenceWorker(system, (host, int(port)), args.window_ms, args.max_batch_size)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return EXIT_USAGE
+    print(f"Serving on {host}:{worker.address[1]}; clients authenticate with ATS_WORKER_AUTHKEY "
+          f"or the key in {INFERENCE_WORKER['authkey_file']}. Press Ctrl+C to stop", file=sys.stderr)
+    worker.serve_forever()
+    _emit(worker.stats())
+    return EXIT_OK
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='ats_cli.py', description="Train and run the ML-based ATS field classifier.")
+    parser.add_argument('--model-file', default='ats_model.pkl', help="Pickled model (default: %(default)s)")
+    parser.add_argument('--model-dir', default=None, help="Model artifact directory (default: the model file path without its extension)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    train = commands.add_parser('train', help="Train a model on a labeled resume CSV")
+    train.add_argument('csv', help="CSV with a resume text column and per-field score columns")
+    train.add_argument('--mode', choices=['full', 'streaming', 'cv', 'update'], default='full',
+                       help="full: in-memory forest; streaming: chunked out-of-core; cv: cross-validated search; "
+                            "update: add newly labeled rows to a streaming-trained model")
+    train.add_argument('--chunk-size', type=int, default=None, help="Rows per chunk in streaming and update modes")
+    train.add_argument('--folds', type=int, default=None, help="Folds in cv mode")
+    train.add_argument('--jobs', type=int, default=None, help="Worker processes in cv mode")
+    train.set_defaults(handler=command_train)
+
+    score = commands.add_parser('score', help="Score resume files, directories or stdin ('-')")
+    score.add_argument('inputs', nargs='+', help="Resume files, directories of resumes, or '-' for stdin")
+    score.add_argument('--workers', type=int, default=1, help="Worker processes for multi-file scoring")
+    score.set_defaults(handler=command_score)
+
+    info = commands.add_parser('info', help="Describe the current model")
+    info.set_defaults(handler=command_info)
+
+    default_host, default_port = INFERENCE_WORKER['address']
+    serve = commands.add_parser('serve', help="Keep the model warm and serve micro-batched predictions locally")
+    serve.add_argument('--address', default=f"{default_host}:{default_port}", help="host:port to listen on (default: %(default)s)")
+    serve.add_argument('--window-ms', type=float, default=INFERENCE_WORKER['batch_window_ms'],
+                       help="Time to collect a micro-batch after its first request (default: %(default)s)")
+    serve.add_argument('--max-batch-size', type=int, default=INFERENCE_WORKER['max_batch_size'],
+                       help="Requests per model call (default: %(default)s)")
+    serve.set_defaults(handler=command_serve)
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
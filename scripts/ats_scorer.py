@@ -1,27 +1,96 @@
 import re
-from typing import Dict, List, Tuple
-from skills_database import SKILLS_DATABASE
-from field_recommender import get_field_recommendation
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from skills_database import ALL_SKILLS, SKILL_IDS, SKILLS_DATABASE
+from field_recommender import FieldRecommender, get_field_recommendation
+from text_extractor import section_at, segment_sections
+from config import SECTION_SKILL_WEIGHTS, get_performance_profile
+from contact_extractor import extract_contacts
+from content_analyzer import analyze_content, content_quality_score
+
+# Format checks, in bit order, of CompactScoreResult.format_flags
+FORMAT_FLAGS = ('has_contact', 'has_summary', 'has_experience', 'has_education', 'has_skills_section', 'proper_length')
+
+# Required and preferred skill IDs of each field, in database order
+_FIELD_SKILL_IDS = {
+    field: (
+        tuple(SKILL_IDS[skill] for skill in field_data.get('required', [])),
+        tuple(SKILL_IDS[skill] for skill in field_data.get('preferred', []))
+    )
+    for field, field_data in SKILLS_DATABASE.items()
+}
+
+def _skill_mask(skill_ids) -> int:
+    """Bit mask with the bit of every skill ID set"""
+    mask = 0
+    for skill_id in skill_ids:
+        mask |= 1 << skill_id
+    return mask
+
+def _count_bits(mask: int) -> int:
+    """Number of set bits; int.bit_count() needs Python 3.10"""
+    return bin(mask).count('1')
 
 class ATSScorer:
-    def __init__(self, job_field: str):
+    def __init__(self, job_field: str, profile: Optional[str] = None):
         self.job_field = job_field
+        self.profile = profile
+        self.settings = get_performance_profile(profile)
         self.required_skills = SKILLS_DATABASE.get(job_field, {}).get('required', [])
         self.preferred_skills = SKILLS_DATABASE.get(job_field, {}).get('preferred', [])
         self.keywords = SKILLS_DATABASE.get(job_field, {}).get('keywords', [])
+        
+        # Skill membership as bit masks over the global SKILL_IDS
+        required_ids, preferred_ids = _FIELD_SKILL_IDS.get(job_field, ((), ()))
+        self.field_skill_ids = list(dict.fromkeys(required_ids + preferred_ids))
+        self.required_mask = _skill_mask(required_ids)
+        self.preferred_mask = _skill_mask(preferred_ids)
     
-    def calculate_ats_score(self, resume_text: str) -> Dict:
-        """Calculate comprehensive ATS score with improved scoring"""
-        resume_lower = resume_text.lower()
+    def calculate_ats_score(self, resume_text: str, field_recommendation: Optional[Dict] = None) -> Dict:
+        """Calculate comprehensive ATS score with improved scoring
+        
+        Pass a field_recommendation already computed for this resume to avoid
+        computing it again.
+        """
+        compact = self.calculate_compact_score(resume_text, field_recommendation)
+        return compact.to_dict(self.settings['recommendation_text'])
+    
+    def calculate_compact_score(self, resume_text: str,
+                                field_recommendation: Optional[Dict] = None) -> 'CompactScoreResult':
+        """Calculate the ATS score as a compact result; text is rendered only on access"""
+        stages = dict(self.score_stages(resume_text))
+        return self.combine_stages(resume_text, stages, field_recommendation)
+    
+    def score_stages(self, resume_text: str) -> Iterator[Tuple[str, Any]]:
+        """Score a resume one stage at a time, yielding each stage as soon as it is done
         
-        # Get field recommendation
-        field_recommendation = get_field_recommendation(resume_text)
+        Yields ('skills', (score, details)), ('format', (score, details)),
+        ('keywords', score) and ('content', score), so callers can show
+        partial results; combine_stages turns them into the final result.
+        """
+        resume_lower = resume_text.lower()
+        sections = segment_sections(resume_lower)
         
         # Calculate individual scores with improved algorithms
-        skills_score, skills_details = self._calculate_skills_score_improved(resume_lower)
-        format_score, format_details = self._calculate_format_score_improved(resume_text)
-        keyword_score = self._calculate_keyword_score_improved(resume_lower)
-        content_score = self._calculate_content_quality_score(resume_text)
+        yield 'skills', self._calculate_skills_score_improved(resume_lower, sections)
+        yield 'format', self._calculate_format_score_improved(resume_text, sections)
+        yield 'keywords', self._calculate_keyword_score_improved(resume_lower)
+        # Content flags are read from the original text; lowercasing changes the length of a few characters
+        if len(resume_lower) != len(resume_text):
+            sections = segment_sections(resume_text)
+        yield 'content', self._calculate_content_quality_score(resume_text, sections)
+    
+    def combine_stages(self, resume_text: str, stages: Dict[str, Any],
+                       field_recommendation: Optional[Dict] = None) -> 'CompactScoreResult':
+        """Weight the results of score_stages into the overall compact result"""
+        skills_score, skills_details = stages['skills']
+        format_score, format_details = stages['format']
+        keyword_score = stages['keywords']
+        content_score = stages['content']
+        
+        # Get field recommendation unless the caller already has one
+        if field_recommendation is None and self.settings['field_recommendation']:
+            field_recommendation = get_field_recommendation(resume_text, self.profile)
         
         # Calculate overall score with better weighting
         overall_score = int(
@@ -37,111 +106,133 @@ class ATSScorer:
         # Ensure score doesn't exceed 100
         overall_score = min(100, overall_score)
         
-        # Generate recommendations
-        recommendations = self._generate_recommendations(
-            skills_details, format_details, overall_score, field_recommendation
+        # Recommendations are generated from the compact result when first accessed
+        return CompactScoreResult.from_details(
+            self.job_field,
+            overall_score,
+            int(skills_score * 0.35),   # Out of 35
+            int(format_score * 0.25),   # Out of 25
+            int(keyword_score * 0.25),  # Out of 25
+            int(content_score * 0.15),  # Out of 15
+            skills_details,
+            format_details,
+            field_recommendation
         )
-        
-        return {
-            'overall_score': overall_score,
-            'skills_score': int(skills_score * 0.35),  # Out of 35
-            'format_score': int(format_score * 0.25),  # Out of 25
-            'keyword_score': int(keyword_score * 0.25), # Out of 25
-            'content_score': int(content_score * 0.15), # Out of 15
-            'found_skills': skills_details['found'],
-            'missing_skills': skills_details['missing'],
-            'format_details': format_details,
-            'recommendations': recommendations,
-            'field_recommendation': field_recommendation
-        }
     
-    def _calculate_skills_score_improved(self, resume_text: str) -> Tuple[float, Dict]:
-        """Improved skills matching with partial matching and variations"""
-        found_skills = []
-        missing_skills = []
-        
-        # Create skill variations for better matching
-        all_skills = self.required_skills + self.preferred_skills
-        
-        for skill in all_skills:
-            skill_found = False
-            skill_variations = self._get_skill_variations(skill)
-            
-            # Check for exact match or variations
-            for variation in skill_variations:
-                if variation.lower() in resume_text:
-                    if skill not in found_skills:
-                        found_skills.append(skill)
-                    skill_found = True
-                    break
-            
-            if not skill_found and skill in self.required_skills:
-                missing_skills.append(skill)
+    def _calculate_skills_score_improved(self, resume_text: str, sections: Dict = None) -> Tuple[float, Dict]:
+        """Improved skills matching with variations, weighted by the section each skill appears in"""
+        if sections is None:
+            sections = segment_sections(resume_text)
+        
+        # Matches are bitsets over SKILL_IDS, one per section weight
+        weight_bits = {}
+        skill_sections = {}
+        for skill_id in self.field_skill_ids:
+            skill = ALL_SKILLS[skill_id]
+            best_weight, best_section = self._find_skill_in_sections(skill, resume_text, sections)
+            if best_weight > 0:
+                weight_bits[best_weight] = weight_bits.get(best_weight, 0) | 1 << skill_id
+                skill_sections[skill] = best_section
+        
+        found_bits = 0
+        for bits in weight_bits.values():
+            found_bits |= bits
         
         # More generous scoring
-        required_found = sum(1 for skill in self.required_skills if skill in found_skills)
-        preferred_found = sum(1 for skill in self.preferred_skills if skill in found_skills)
+        required_found = sum(weight * _count_bits(bits & self.required_mask) for weight, bits in weight_bits.items())
+        preferred_found = sum(weight * _count_bits(bits & self.preferred_mask) for weight, bits in weight_bits.items())
         
         # Calculate score with bonus for having many skills
         base_score = 0
-        if len(self.required_skills) > 0:
-            base_score += (required_found / len(self.required_skills)) * 70  # 70% for required
+        if self.required_mask:
+            base_score += (required_found / _count_bits(self.required_mask)) * 70  # 70% for required
         
-        if len(self.preferred_skills) > 0:
-            base_score += (preferred_found / len(self.preferred_skills)) * 30  # 30% for preferred
+        if self.preferred_mask:
+            base_score += (preferred_found / _count_bits(self.preferred_mask)) * 30  # 30% for preferred
         
         # Bonus for having many skills
-        if len(found_skills) >= 8:
+        found_count = _count_bits(found_bits)
+        if found_count >= 8:
             base_score += 10  # Bonus for skill-rich resume
-        elif len(found_skills) >= 5:
+        elif found_count >= 5:
             base_score += 5
         
+        missing_bits = self.required_mask & ~found_bits
         return min(100, base_score), {
-            'found': found_skills,
-            'missing': missing_skills[:10]  # Limit missing skills display
+            'found': [ALL_SKILLS[skill_id] for skill_id in self.field_skill_ids if found_bits >> skill_id & 1],
+            'missing': [ALL_SKILLS[skill_id] for skill_id in self.field_skill_ids
+                        if missing_bits >> skill_id & 1][:10],  # Limit missing skills display
+            'found_bits': found_bits,
+            'sections': skill_sections
         }
     
-    def _calculate_format_score_improved(self, resume_text: str) -> Tuple[float, Dict]:
-        """Improved format scoring with more generous criteria"""
+    def _find_skill_in_sections(self, skill: str, resume_text: str, sections: Dict) -> Tuple[float, str]:
+        """Return the best section weight and section name where a skill occurs"""
+        best_weight, best_section = 0.0, ''
+        
+        variations = self._get_skill_variations(skill) if self.settings['fuzzy_skill_matching'] else [skill]
+        for variation in variations:
+            variation = variation.lower()
+            position = resume_text.find(variation)
+            while position != -1:
+                section = section_at(sections, position)
+                weight = SECTION_SKILL_WEIGHTS.get(section, 1.0)
+                if weight > best_weight:
+                    best_weight, best_section = weight, section
+                    if weight >= 1.0:
+                        return best_weight, best_section
+                position = resume_text.find(variation, position + 1)
+        
+        return best_weight, best_section
+    
+    def _calculate_format_score_improved(self, resume_text: str, sections: Dict = None) -> Tuple[float, Dict]:
+        """Format scoring based on detected section headings and the header block"""
         score = 0
         details = {}
+        resume_lower = resume_text.lower()
+        if sections is None:
+            sections = segment_sections(resume_lower)
         
-        # Contact information (more generous detection)
-        has_email = '@' in resume_text and ('.' in resume_text or '.com' in resume_text.lower())
-        has_phone = any(char.isdigit() for char in resume_text) and (
-            '(' in resume_text or '-' in resume_text or '.' in resume_text or 
-            'phone' in resume_text.lower() or 'tel' in resume_text.lower()
-        )
-        has_contact = has_email or has_phone
+        # Without any headings (e.g. flattened text) fall back to keyword presence
+        has_headings = any(section != 'contact' for section in sections)
+        
+        # Contact information is only looked for in the header block
+        if has_headings:
+            start, end = sections.get('contact', (0, 0))
+            header = resume_lower[start:end]
+        else:
+            header = resume_lower
+        contacts = extract_contacts(header)
+        has_contact = bool(contacts['emails'] or contacts['phones'] or contacts['linkedin'])
         
         if has_contact:
             score += 20  # Increased from 15
         details['has_contact'] = has_contact
         
-        # Professional summary/objective (more flexible)
+        # Professional summary/objective
         summary_keywords = ['summary', 'objective', 'profile', 'about', 'overview', 'introduction']
-        has_summary = any(keyword in resume_text.lower() for keyword in summary_keywords)
+        has_summary = self._has_section('summary', sections, has_headings, resume_lower, summary_keywords)
         if has_summary:
             score += 15  # Increased from 10
         details['has_summary'] = has_summary
         
-        # Work experience section (more flexible)
+        # Work experience section
         exp_keywords = ['experience', 'work', 'employment', 'career', 'professional', 'job', 'position']
-        has_experience = any(keyword in resume_text.lower() for keyword in exp_keywords)
+        has_experience = self._has_section('experience', sections, has_headings, resume_lower, exp_keywords)
         if has_experience:
             score += 25  # Increased from 20
         details['has_experience'] = has_experience
         
         # Education section
         edu_keywords = ['education', 'degree', 'university', 'college', 'school', 'bachelor', 'master', 'phd']
-        has_education = any(keyword in resume_text.lower() for keyword in edu_keywords)
+        has_education = self._has_section('education', sections, has_headings, resume_lower, edu_keywords)
         if has_education:
             score += 15  # Same
         details['has_education'] = has_education
         
-        # Skills section (more flexible)
+        # Skills section
         skill_keywords = ['skills', 'technical', 'competencies', 'technologies', 'tools', 'programming']
-        has_skills_section = any(keyword in resume_text.lower() for keyword in skill_keywords)
+        has_skills_section = self._has_section('skills', sections, has_headings, resume_lower, skill_keywords)
         if has_skills_section:
             score += 15  # Same
         details['has_skills_section'] = has_skills_section
@@ -158,6 +249,13 @@ class ATSScorer:
         
         return min(100, score), details
     
+    def _has_section(self, section: str, sections: Dict, has_headings: bool,
+                     resume_lower: str, fallback_keywords: List[str]) -> bool:
+        """Check for a section heading, or for its keywords when the text has no headings"""
+        if has_headings:
+            return section in sections
+        return any(keyword in resume_lower for keyword in fallback_keywords)
+    
     def _calculate_keyword_score_improved(self, resume_text: str) -> float:
         """Improved keyword scoring with partial matching"""
         found_keywords = 0
@@ -183,62 +281,19 @@ class ATSScorer:
             return min(100, score)
         return 0
     
-    def _calculate_content_quality_score(self, resume_text: str) -> float:
-        """New: Calculate content quality score"""
-        score = 0
-        text_lower = resume_text.lower()
-        
-        # Check for action verbs (indicates good resume writing)
-        action_verbs = [
-            'developed', 'created', 'managed', 'led', 'implemented', 'designed',
-            'built', 'improved', 'increased', 'reduced', 'achieved', 'delivered',
-            'collaborated', 'coordinated', 'analyzed', 'optimized', 'streamlined'
-        ]
-        
-        action_verb_count = sum(1 for verb in action_verbs if verb in text_lower)
-        if action_verb_count >= 5:
-            score += 30
-        elif action_verb_count >= 3:
-            score += 20
-        elif action_verb_count >= 1:
-            score += 10
-        
-        # Check for quantifiable achievements (numbers/percentages)
-        has_numbers = any(char.isdigit() for char in resume_text)
-        has_percentages = '%' in resume_text
-        
-        if has_numbers and has_percentages:
-            score += 25
-        elif has_numbers:
-            score += 15
-        
-        # Check for professional language
-        professional_terms = [
-            'responsible', 'leadership', 'team', 'project', 'client', 'customer',
-            'business', 'strategic', 'innovative', 'successful', 'efficient'
-        ]
-        
-        prof_term_count = sum(1 for term in professional_terms if term in text_lower)
-        if prof_term_count >= 3:
-            score += 20
-        elif prof_term_count >= 1:
-            score += 10
-        
-        # Check for industry certifications or awards
-        cert_keywords = ['certified', 'certification', 'award', 'recognition', 'achievement']
-        if any(keyword in text_lower for keyword in cert_keywords):
-            score += 15
-        
-        return min(100, score)
+    def _calculate_content_quality_score(self, resume_text: str, sections: Dict = None) -> float:
+        """Content quality from per-bullet action verbs, quantified impact and professional terms"""
+        return content_quality_score(analyze_content(resume_text, sections))
     
     def _apply_bonus_scoring(self, base_score: int, skills_details: Dict, format_details: Dict) -> int:
         """Apply bonus scoring for well-structured resumes"""
         bonus = 0
         
         # Bonus for skill-rich resumes
-        if len(skills_details['found']) >= 10:
+        found_count = len(skills_details['found'])
+        if found_count >= 10:
             bonus += 5
-        elif len(skills_details['found']) >= 7:
+        elif found_count >= 7:
             bonus += 3
         
         # Bonus for complete format
@@ -304,24 +359,25 @@ class ATSScorer:
         
         return list(set(variations))
     
-    def _generate_recommendations(self, skills_details: Dict, format_details: Dict, overall_score: int, field_recommendation: Dict) -> List[str]:
+    def _generate_recommendations(self, skills_details: Dict, format_details: Dict, overall_score: int, field_recommendation: Optional[Dict]) -> List[str]:
         """Generate improvement recommendations"""
         recommendations = []
         
-        # Field recommendation
+        # Field recommendation, unless the profile skipped it
         current_field_name = {
             'software_engineering': 'Software Engineering',
             'data_analyst': 'Data Analyst',
             'consultant': 'Consultant'
         }.get(self.job_field, self.job_field)
         
-        recommended_field = field_recommendation['recommended_field_name']
-        confidence = field_recommendation['confidence']
-        
-        if recommended_field != current_field_name and confidence in ['High', 'Medium']:
-            recommendations.append(
-                f"Consider applying for {recommended_field} roles - your profile shows a {field_recommendation['match_score']:.0f}% match"
-            )
+        if field_recommendation is not None:
+            recommended_field = field_recommendation['recommended_field_name']
+            confidence = field_recommendation['confidence']
+            
+            if recommended_field != current_field_name and confidence in ['High', 'Medium']:
+                recommendations.append(
+                    f"Consider applying for {recommended_field} roles - your profile shows a {field_recommendation['match_score']:.0f}% match"
+                )
         
         # Skills recommendations (more positive)
         if len(skills_details['missing']) > 0:
@@ -363,3 +419,124 @@ class ATSScorer:
             recommendations.append("Focus on adding relevant skills and improving content structure")
         
         return recommendations[:6]  # Limit to top 6 recommendations
+
+
+_FIELD_RECOMMENDER = FieldRecommender()
+_FIELD_KEYS = {name: field for field, name in _FIELD_RECOMMENDER.field_names.items()}
+_FIELD_SCORERS = {}     # One ATSScorer per job field, for rebuilding recommendation text
+
+class CompactScoreResult:
+    """An ATS score held in a few small ints: found skills as a bitset over SKILL_IDS and
+    format checks as bit flags. Skill names, format details and recommendation text are
+    rebuilt on access; to_dict() gives the calculate_ats_score dict."""
+    __slots__ = ('job_field', 'overall_score', 'skills_score', 'format_score', 'keyword_score',
+                 'content_score', 'skill_bits', 'format_flags', 'word_count', 'recommended_field',
+                 'confidence', 'field_scores', 'reasoning')
+
+    def __init__(self, job_field: str, overall_score: int, skills_score: int, format_score: int,
+                 keyword_score: int, content_score: int, skill_bits: int, format_flags: int,
+                 word_count: int, recommended_field: str, confidence: str,
+                 field_scores: Tuple[float, ...], reasoning: Tuple[str, ...]):
+        self.job_field = job_field
+        self.overall_score = overall_score
+        self.skills_score = skills_score
+        self.format_score = format_score
+        self.keyword_score = keyword_score
+        self.content_score = content_score
+        self.skill_bits = skill_bits
+        self.format_flags = format_flags
+        self.word_count = word_count
+        self.recommended_field = recommended_field
+        self.confidence = confidence
+        self.field_scores = field_scores          # In FieldRecommender.fields order
+        self.reasoning = reasoning
+
+    @classmethod
+    def from_details(cls, job_field: str, overall_score: int, skills_score: int, format_score: int,
+                     keyword_score: int, content_score: int, skills_details: Dict, format_details: Dict,
+                     field_recommendation: Optional[Dict]) -> 'CompactScoreResult':
+        """Pack the scorer's intermediate details"""
+        skill_bits = skills_details.get('found_bits')
+        if skill_bits is None:
+            skill_bits = _skill_mask(SKILL_IDS[skill] for skill in skills_details['found'])
+        format_flags = 0
+        for bit, flag in enumerate(FORMAT_FLAGS):
+            if format_details[flag]:
+                format_flags |= 1 << bit
+
+        if field_recommendation is None:
+            return cls(job_field, overall_score, skills_score, format_score, keyword_score, content_score,
+                       skill_bits, format_flags, format_details['word_count'], None, None, (), ())
+
+        all_scores = field_recommendation['all_scores']
+        field_scores = tuple(
+            all_scores.get(_FIELD_RECOMMENDER.field_names[field], 0.0) for field in _FIELD_RECOMMENDER.fields
+        )
+        # The same few reasoning sentences recur across resumes; share one copy of each
+        reasoning = tuple(sys.intern(reason) for reason in field_recommendation['reasoning'])
+
+        return cls(job_field, overall_score, skills_score, format_score, keyword_score, content_score,
+                   skill_bits, format_flags, format_details['word_count'],
+                   _FIELD_KEYS.get(field_recommendation['recommended_field_name'],
+                                   field_recommendation['recommended_field']),
+                   field_recommendation['confidence'], field_scores, reasoning)
+
+    def has_skill(self, skill: str) -> bool:
+        skill_id = SKILL_IDS.get(skill)
+        return skill_id is not None and bool(self.skill_bits >> skill_id & 1)
+
+    @property
+    def found_skills(self) -> List[str]:
+        required, preferred = _FIELD_SKILL_IDS.get(self.job_field, ((), ()))
+        return [ALL_SKILLS[skill_id] for skill_id in dict.fromkeys(required + preferred)
+                if self.skill_bits >> skill_id & 1]
+
+    @property
+    def missing_skills(self) -> List[str]:
+        required, _ = _FIELD_SKILL_IDS.get(self.job_field, ((), ()))
+        return [ALL_SKILLS[skill_id] for skill_id in required if not self.skill_bits >> skill_id & 1][:10]
+
+    @property
+    def format_details(self) -> Dict:
+        details = {flag: bool(self.format_flags >> bit & 1) for bit, flag in enumerate(FORMAT_FLAGS)}
+        details['word_count'] = self.word_count
+        return details
+
+    @property
+    def field_recommendation(self) -> Optional[Dict]:
+        if self.recommended_field is None:
+            return None
+        ranked = sorted(zip(_FIELD_RECOMMENDER.fields, self.field_scores), key=lambda x: x[1], reverse=True)
+        return {
+            'recommended_field': self.recommended_field,
+            'recommended_field_name': _FIELD_RECOMMENDER.field_names[self.recommended_field],
+            'confidence': self.confidence,
+            'match_score': ranked[0][1],
+            'all_scores': {_FIELD_RECOMMENDER.field_names[field]: score for field, score in ranked},
+            'reasoning': list(self.reasoning)
+        }
+
+    @property
+    def recommendations(self) -> List[str]:
+        if self.job_field not in _FIELD_SCORERS:
+            _FIELD_SCORERS[self.job_field] = ATSScorer(self.job_field)
+        return _FIELD_SCORERS[self.job_field]._generate_recommendations(
+            {'found': self.found_skills, 'missing': self.missing_skills},
+            self.format_details, self.overall_score, self.field_recommendation
+        )
+
+    def to_dict(self, recommendations: bool = True) -> Dict:
+        """The full result dict returned by ATSScorer.calculate_ats_score;
+        recommendation text is left empty when ``recommendations`` is False"""
+        return {
+            'overall_score': self.overall_score,
+            'skills_score': self.skills_score,
+            'format_score': self.format_score,
+            'keyword_score': self.keyword_score,
+            'content_score': self.content_score,
+            'found_skills': self.found_skills,
+            'missing_skills': self.missing_skills,
+            'format_details': self.format_details,
+            'recommendations': self.recommendations if recommendations else [],
+            'field_recommendation': self.field_recommendation
+        }
@@ -1,12 +1,16 @@
-import pandas as pd
 import numpy as np
-from sklearn.model_selection import train_test_split
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.metrics import accuracy_score, classification_report
+import os
 import re
 import pickle
+import time
 from datetime import datetime
+from itertools import islice
+from config import PREDICT_BATCH_SIZE, STREAMING_TRAINING, TRAINING_SETTINGS
+from model_artifact import ModelArtifact, export_artifact, retire_latest
+from text_extractor import EXTRACTORS, DocumentRejected, check_file_size, detect_format, extract_text_from_bytes
+
+# pandas and scikit-learn are imported by the methods that train or unpickle a model,
+# so scoring with an exported artifact starts without them
 
 # Try to import file handling libraries
 try:
@@ -23,16 +27,37 @@ except ImportError:
     DOCX_AVAILABLE = False
     print("⚠️ python-docx not available. DOCX support disabled.")
 
+# Resume text columns, in order of preference
+TEXT_COLUMNS = ['Resume_Text', 'resume_text', 'text', 'resume', 'Resume']
+
+# Score columns and the category each one labels
+SCORE_COLUMNS = {
+    'Software_Engineer_Score': 'software_engineering',
+    'Data_Analyst_Score': 'data_analyst',
+    'Consultant_Score': 'consultant'
+}
+
+# Every byte but a-z becomes a space; bytes of non-ASCII characters are never letters
+_NON_LETTERS = bytes.maketrans(bytes(byte for byte in range(256) if not ord('a') <= byte <= ord('z')),
+                               b' ' * (256 - 26))
+
+def _clean_letters(text):
+    """The runs of ASCII letters in lowercased text, joined by single spaces"""
+    return b' '.join(text.lower().encode('utf-8', 'surrogatepass').translate(_NON_LETTERS).split()).decode('ascii')
+
 class ATSSystem:
     """Complete ATS System - Works in Any Environment"""
     
-    def __init__(self):
+    def __init__(self, model_file='ats_model.pkl', model_dir=None):
         print("🎯 ATS Resume Screening System")
         print("="*50)
-        self.vectorizer = TfidfVectorizer(max_features=5000, stop_words='english')
+        self.vectorizer = None
         self.model = None
         self.is_trained = False
-        self.model_file = 'ats_model.pkl'
+        self.model_file = model_file
+        # Artifacts live next to their model file (ats_model.pkl -> ats_model/), so other model files never share them
+        self.model_dir = model_dir or os.path.splitext(model_file)[0]
+        self.artifact = None
         
         # Try to load existing model
         self.try_load_existing_model()
@@ -40,6 +65,19 @@ class ATSSystem:
     def try_load_existing_model(self):
         """Try to load existing trained model"""
         try:
+            # Exported artifacts are preferred: only the manifest is read until the first prediction
+            self.artifact = ModelArtifact.latest(self.model_dir)
+            if self.artifact is not None:
+                self.training_date = self.artifact.metadata.get('training_date', 'Unknown')
+                self.accuracy = self.artifact.metadata.get('accuracy', 0)
+                self.categories = self.artifact.classes
+                self.is_trained = True
+                
+                print(f"✅ Found existing trained model! (artifact {self.artifact.version})")
+                print(f"🗓️ Training date: {self.training_date}")
+                print(f"📈 Model accuracy: {self.accuracy:.2%}")
+                return
+            
             with open(self.model_file, 'rb') as f:
                 model_data = pickle.load(f)
             
@@ -80,17 +118,75 @@ class ATSSystem:
     
     def clean_text(self, text):
         """Clean resume text"""
-        if pd.isna(text) or not text:
-            return ""
+        if isinstance(text, str):
+            if not text:
+                return ""
+        else:
+            import pandas as pd
+            if pd.isna(text) or not text:
+                return ""
         
         text = str(text).lower()
         text = re.sub(r'[^a-zA-Z\s]', ' ', text)
         text = re.sub(r'\s+', ' ', text).strip()
         return text
     
-    def create_labels_from_scores(self, df):
+    def clean_text_series(self, texts):
+        """Clean a whole column of resume texts; same result as clean_text on each value
+        
+        clean_text leaves the runs of letters joined by single spaces, so each
+        text is lowercased, every other byte is blanked with one bytes.translate
+        and the runs are re-joined, without a regex pass.
+        """
+        import pandas as pd
+        
+        texts = texts.fillna("")
+        empty = ~texts.astype(bool)
+        cleaned = pd.Series([_clean_letters(text) for text in texts.astype(str)], index=texts.index, dtype=object)
+        return cleaned.mask(empty, "")
+    
+    def create_labels_from_scores(self, df, verbose=True):
         """Create category labels based on highest scores"""
-        print("🏷️ Creating labels from scores...")
+        import pandas as pd
+        
+        if verbose:
+            print("🏷️ Creating labels from scores...")
+        
+        # Convert score columns to numeric
+        score_columns = [col for col in SCORE_COLUMNS if col in df.columns]
+        
+        for col in score_columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+        
+        # Create category based on highest score, one column at a time. Like max() over
+        # the columns, a score replaces the best so far only when strictly greater, so
+        # ties keep the first column and NaN never wins unless it comes first.
+        if score_columns:
+            scores = df[score_columns].to_numpy(dtype=float)
+            best_scores = scores[:, 0].copy()
+            best_columns = np.zeros(len(df), dtype=np.intp)
+            for index in range(1, len(score_columns)):
+                greater = scores[:, index] > best_scores
+                best_scores[greater] = scores[greater, index]
+                best_columns[greater] = index
+            categories = np.array([SCORE_COLUMNS[col] for col in score_columns], dtype=object)
+            df['category'] = categories[best_columns]
+        else:
+            df['category'] = 'unknown'
+        
+        # Show distribution
+        if verbose:
+            print("📊 Category distribution:")
+            print(df['category'].value_counts())
+        
+        return df
+    
+    def create_labels_from_scores_rowwise(self, df, verbose=True):
+        """Row-by-row version of create_labels_from_scores, kept as its reference"""
+        import pandas as pd
+        
+        if verbose:
+            print("🏷️ Creating labels from scores...")
         
         # Convert score columns to numeric
         score_columns = ['Software_Engineer_Score', 'Data_Analyst_Score', 'Consultant_Score']
@@ -117,77 +213,129 @@ class ATSSystem:
         df['category'] = df.apply(get_best_category, axis=1)
         
         # Show distribution
-        print("📊 Category distribution:")
-        print(df['category'].value_counts())
+        if verbose:
+            print("📊 Category distribution:")
+            print(df['category'].value_counts())
         
         return df
     
+    def load_training_data(self, csv_filename):
+        """Load a labeled CSV into cleaned_text and category columns, or None if it is unusable"""
+        import pandas as pd
+        
+        print("📚 Loading dataset...")
+        
+        # Load dataset
+        df = pd.read_csv(csv_filename)
+        print(f"Dataset loaded: {df.shape[0]} rows, {df.shape[1]} columns")
+        print(f"Columns: {list(df.columns)}")
+        
+        # Check for resume text column
+        text_column = next((col for col in TEXT_COLUMNS if col in df.columns), None)
+        
+        if not text_column:
+            print("❌ Could not find resume text column!")
+            print("Looking for columns like: Resume_Text, resume_text, text, resume")
+            return None
+        
+        print(f"✅ Using '{text_column}' as resume text column")
+        
+        # Check for score columns
+        available_score_columns = [col for col in SCORE_COLUMNS if col in df.columns]
+        
+        if len(available_score_columns) < 2:
+            print("❌ Need at least 2 score columns for training!")
+            print(f"Available: {available_score_columns}")
+            print(f"Expected: {list(SCORE_COLUMNS)}")
+            return None
+        
+        print(f"✅ Using score columns: {available_score_columns}")
+        
+        # Create category labels from scores
+        df = self.create_labels_from_scores(df)
+        
+        print("🧹 Cleaning text data...")
+        # Clean the resume text
+        df['cleaned_text'] = self.clean_text_series(df[text_column])
+        
+        # Remove empty texts
+        df = df[df['cleaned_text'].str.len() > 10]  # At least 10 characters
+        print(f"After cleaning: {df.shape[0]} resumes")
+        
+        if df.shape[0] < 10:
+            print("❌ Not enough data for training! Need at least 10 resumes.")
+            return None
+        
+        # Check if we have enough samples for each category
+        category_counts = df['category'].value_counts()
+        print(f"Category counts: {dict(category_counts)}")
+        
+        if len(category_counts) < 2:
+            print("❌ Need at least 2 different categories for training!")
+            return None
+        
+        return df
+    
+    def save_model(self, model, vectorizer, accuracy, metadata=None):
+        """Make a trained model current and save it to model_file
+        
+        model_file is replaced in one step, so a concurrent load sees either
+        the previous model or this one. metadata is recorded in the artifact.
+        """
+        self.model = model
+        self.vectorizer = vectorizer
+        model_data = {
+            'model': self.model,
+            'vectorizer': self.vectorizer,
+            'training_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'accuracy': accuracy,
+            'categories': list(self.model.classes_)
+        }
+        
+        temporary = f"{self.model_file}.tmp-{os.getpid()}"
+        with open(temporary, 'wb') as f:
+            pickle.dump(model_data, f)
+        os.replace(temporary, self.model_file)
+        
+        print(f"💾 Model saved as: {self.model_file}")
+        
+        # Export the memory-mappable artifact that later runs load from
+        try:
+            directory = export_artifact(self.model, self.vectorizer, self.model_dir,
+                                        {'training_date': model_data['training_date'], 'accuracy': accuracy,
+                                         **(metadata or {})})
+            self.artifact = ModelArtifact(directory)
+            print(f"📦 Model artifact exported to: {directory}")
+        except ValueError as e:
+            # Served from model_file instead, so an older artifact must not shadow it
+            retire_latest(self.model_dir)
+            self.artifact = None
+            print(f"📝 No model artifact exported: {e}")
+        
+        # Update instance variables
+        self.training_date = model_data['training_date']
+        self.accuracy = accuracy
+        self.categories = list(self.model.classes_)
+        self.is_trained = True
+    
     def train_model_from_csv(self, csv_filename):
         """Train model from CSV file"""
-        print("📚 Loading dataset...")
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.metrics import accuracy_score
+        from sklearn.model_selection import train_test_split
         
         try:
-            # Load dataset
-            df = pd.read_csv(csv_filename)
-            print(f"Dataset loaded: {df.shape[0]} rows, {df.shape[1]} columns")
-            print(f"Columns: {list(df.columns)}")
-            
-            # Check for resume text column
-            text_column = None
-            possible_text_columns = ['Resume_Text', 'resume_text', 'text', 'resume', 'Resume']
-            
-            for col in possible_text_columns:
-                if col in df.columns:
-                    text_column = col
-                    break
-            
-            if not text_column:
-                print("❌ Could not find resume text column!")
-                print("Looking for columns like: Resume_Text, resume_text, text, resume")
-                return False
-            
-            print(f"✅ Using '{text_column}' as resume text column")
-            
-            # Check for score columns
-            score_columns = ['Software_Engineer_Score', 'Data_Analyst_Score', 'Consultant_Score']
-            available_score_columns = [col for col in score_columns if col in df.columns]
-            
-            if len(available_score_columns) < 2:
-                print("❌ Need at least 2 score columns for training!")
-                print(f"Available: {available_score_columns}")
-                print(f"Expected: {score_columns}")
-                return False
-            
-            print(f"✅ Using score columns: {available_score_columns}")
-            
-            # Create category labels from scores
-            df = self.create_labels_from_scores(df)
-            
-            print("🧹 Cleaning text data...")
-            # Clean the resume text
-            df['cleaned_text'] = df[text_column].apply(self.clean_text)
-            
-            # Remove empty texts
-            df = df[df['cleaned_text'].str.len() > 10]  # At least 10 characters
-            print(f"After cleaning: {df.shape[0]} resumes")
-            
-            if df.shape[0] < 10:
-                print("❌ Not enough data for training! Need at least 10 resumes.")
+            df = self.load_training_data(csv_filename)
+            if df is None:
                 return False
             
             print("🔤 Converting text to features...")
             # Convert text to TF-IDF features
-            X = self.vectorizer.fit_transform(df['cleaned_text'])
+            vectorizer = TfidfVectorizer(max_features=TRAINING_SETTINGS['max_features'], stop_words='english')
+            X = vectorizer.fit_transform(df['cleaned_text'])
             y = df['category']
             
-            # Check if we have enough samples for each category
-            category_counts = y.value_counts()
-            print(f"Category counts: {dict(category_counts)}")
-            
-            if len(category_counts) < 2:
-                print("❌ Need at least 2 different categories for training!")
-                return False
-            
             print("📊 Splitting data for training...")
             # Split data (adjust test_size if dataset is small)
             test_size = min(0.3, max(0.1, len(df) * 0.2 / len(df)))
@@ -204,35 +352,18 @@ class ATSSystem:
             
             print("🤖 Training model...")
             # Train Random Forest model
-            self.model = RandomForestClassifier(n_estimators=50, random_state=42)
-            self.model.fit(X_train, y_train)
+            model = RandomForestClassifier(n_estimators=50, random_state=42)
+            model.fit(X_train, y_train)
             
             # Test accuracy
-            y_pred = self.model.predict(X_test)
+            y_pred = model.predict(X_test)
             accuracy = accuracy_score(y_test, y_pred)
             
             print(f"✅ Model trained successfully!")
             print(f"📈 Accuracy: {accuracy:.2%}")
             
             # Save the model
-            model_data = {
-                'model': self.model,
-                'vectorizer': self.vectorizer,
-                'training_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'accuracy': accuracy,
-                'categories': list(self.model.classes_)
-            }
-            
-            with open(self.model_file, 'wb') as f:
-                pickle.dump(model_data, f)
-            
-            print(f"💾 Model saved as: {self.model_file}")
-            
-            # Update instance variables
-            self.training_date = model_data['training_date']
-            self.accuracy = accuracy
-            self.categories = list(self.model.classes_)
-            self.is_trained = True
+            self.save_model(model, vectorizer, accuracy)
             
             print("🎉 Training completed! Model is ready for use.")
             return True
@@ -241,22 +372,190 @@ class ATSSystem:
             print(f"❌ Error during training: {str(e)}")
             return False
     
+    def train_model_cv(self, csv_filename, folds=None, param_grid=None, n_jobs=None):
+        """Train the forest with k-fold cross-validated hyperparameter search on cached features"""
+        from model_training import train_with_cross_validation
+        
+        try:
+            report = train_with_cross_validation(self, csv_filename, folds, param_grid, n_jobs)
+            return report is not None
+        except Exception as e:
+            print(f"❌ Error during training: {str(e)}")
+            return False
+    
+    def train_model_streaming(self, csv_filename, chunk_size=None):
+        """Train model from a CSV too large for memory, one chunk at a time
+        
+        Features come from a stateless HashingVectorizer and the classifier is
+        updated with SGDClassifier.partial_fit, so memory stays bounded by the
+        chunk size. Accuracy is measured on each chunk before training on it.
+        """
+        from sklearn.feature_extraction.text import HashingVectorizer
+        from sklearn.linear_model import SGDClassifier
+        
+        settings = STREAMING_TRAINING
+        try:
+            columns = self._training_columns(csv_filename)
+            if columns is None:
+                return False
+            
+            # Every class must be known before the first partial_fit
+            classes = np.array(sorted(SCORE_COLUMNS[col] for col in columns[1]))
+            vectorizer = HashingVectorizer(n_features=settings['n_features'], stop_words='english',
+                                           alternate_sign=False)
+            model = SGDClassifier(loss='log_loss', alpha=settings['alpha'], random_state=42)
+            
+            trained, accuracy = self._partial_fit_csv(model, vectorizer, classes, csv_filename, columns,
+                                                      chunk_size, settings['epochs'])
+            if trained < 10:
+                print("❌ Not enough data for training! Need at least 10 resumes.")
+                return False
+            print(f"📈 Progressive validation accuracy: {accuracy:.2%}")
+            
+            # Save the model
+            self.save_model(model, vectorizer, accuracy)
+            
+            print("🎉 Training completed! Model is ready for use.")
+            return True
+            
+        except Exception as e:
+            print(f"❌ Error during training: {str(e)}")
+            return False
+    
+    def update_model(self, csv_filename, chunk_size=None):
+        """Update a streaming-trained model with newly labeled resumes only
+        
+        A copy of the current SGD model is trained on the new rows with
+        partial_fit; the hashed features need no refit. The copy is then saved
+        as a new artifact version, so the current model keeps serving until
+        the update is complete. Accuracy is measured on each chunk of new
+        rows before training on it.
+        """
+        import copy
+        
+        try:
+            if not self._load_training_state():
+                return False
+            if not hasattr(self.model, 'partial_fit') or not hasattr(self.vectorizer, 'n_features'):
+                print(f"❌ A {type(self.model).__name__} model cannot be updated incrementally. "
+                      "Train with streaming first.")
+                return False
+            
+            columns = self._training_columns(csv_filename)
+            if columns is None:
+                return False
+            
+            base_version = self.artifact.version if self.artifact is not None else None
+            model = copy.deepcopy(self.model)
+            trained, accuracy = self._partial_fit_csv(model, self.vectorizer, self.model.classes_, csv_filename,
+                                                      columns, chunk_size, epochs=1)
+            if not trained:
+                print("❌ No new labeled resumes to update with!")
+                return False
+            print(f"📈 Accuracy on new resumes before training on them: {accuracy:.2%}")
+            
+            self.save_model(model, self.vectorizer, accuracy,
+                            {'updated_from': base_version, 'update_rows': trained})
+            
+            print("🎉 Update completed! Model is ready for use.")
+            return True
+            
+        except Exception as e:
+            print(f"❌ Error during update: {str(e)}")
+            return False
+    
+    def _load_training_state(self):
+        """Load the trainable model from model_file when only the artifact was loaded"""
+        if self.model is not None:
+            return True
+        try:
+            with open(self.model_file, 'rb') as f:
+                model_data = pickle.load(f)
+        except FileNotFoundError:
+            print("❌ No trained model found! Please train first.")
+            return False
+        self.model = model_data['model']
+        self.vectorizer = model_data['vectorizer']
+        return True
+    
+    def _training_columns(self, csv_filename):
+        """The text column and score columns of a training CSV, read from its header"""
+        import pandas as pd
+        
+        columns = list(pd.read_csv(csv_filename, nrows=0).columns)
+        text_column = next((col for col in TEXT_COLUMNS if col in columns), None)
+        if not text_column:
+            print("❌ Could not find resume text column!")
+            print("Looking for columns like: Resume_Text, resume_text, text, resume")
+            return None
+        
+        available_score_columns = [col for col in SCORE_COLUMNS if col in columns]
+        if len(available_score_columns) < 2:
+            print("❌ Need at least 2 score columns for training!")
+            print(f"Available: {available_score_columns}")
+            print(f"Expected: {list(SCORE_COLUMNS)}")
+            return None
+        
+        print(f"✅ Using '{text_column}' as resume text column")
+        print(f"✅ Using score columns: {available_score_columns}")
+        return text_column, available_score_columns
+    
+    def _partial_fit_csv(self, model, vectorizer, classes, csv_filename, columns, chunk_size=None, epochs=1):
+        """Train model on a CSV chunk by chunk; returns the distinct rows trained and the progressive validation accuracy
+        
+        Rows labeled with a category outside classes are skipped. Once the
+        model has been fitted, each chunk of the first pass is scored before
+        it is trained on. Later epochs train on the same rows again, so only
+        the first pass is counted.
+        """
+        import pandas as pd
+        
+        chunk_size = chunk_size or STREAMING_TRAINING['chunk_size']
+        print(f"📚 Streaming dataset in chunks of {chunk_size} rows...")
+        text_column, score_columns = columns
+        
+        rows = chunks_read = trained = evaluated = correct = 0
+        start = time.perf_counter()
+        for epoch in range(epochs):
+            chunks = pd.read_csv(csv_filename, usecols=[text_column] + score_columns, chunksize=chunk_size)
+            for chunk in chunks:
+                rows += len(chunk)
+                chunks_read += 1
+                chunk = self.create_labels_from_scores(chunk, verbose=False)
+                chunk['cleaned_text'] = self.clean_text_series(chunk[text_column])
+                chunk = chunk[(chunk['cleaned_text'].str.len() > 10)   # At least 10 characters
+                              & chunk['category'].isin(classes)]
+                if chunk.empty:
+                    continue
+                
+                X = vectorizer.transform(chunk['cleaned_text'])
+                y = chunk['category'].to_numpy()
+                
+                # Progressive validation on the first pass: test on unseen rows, then train
+                if hasattr(model, 'classes_') and epoch == 0:
+                    evaluated += len(y)
+                    correct += int((model.predict(X) == y).sum())
+                model.partial_fit(X, y, classes=classes)
+                if epoch == 0:
+                    trained += len(y)
+                
+                if chunks_read % STREAMING_TRAINING['progress_every'] == 0:
+                    elapsed = time.perf_counter() - start
+                    print(f"  Epoch {epoch + 1}/{epochs}: {rows} rows read ({rows / elapsed:.0f} rows/s)")
+        elapsed = time.perf_counter() - start
+        
+        if trained:
+            print(f"✅ Model trained on {trained} resumes ({epochs} epochs) in {elapsed:.1f} s "
+                  f"({rows / elapsed:.0f} rows/s)")
+        return trained, correct / evaluated if evaluated else 0
+    
     def extract_text_from_pdf(self, pdf_file_path):
         """Extract text from PDF file"""
         if not PDF_AVAILABLE:
             print("❌ PDF support not available. Please install PyPDF2.")
             return None
         
-        try:
-            with open(pdf_file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text()
-                return text
-        except Exception as e:
-            print(f"❌ Error reading PDF: {str(e)}")
-            return None
+        return self.extract_text_from_file(pdf_file_path)
     
     def extract_text_from_docx(self, docx_file_path):
         """Extract text from Word document"""
@@ -264,37 +563,33 @@ class ATSSystem:
             print("❌ DOCX support not available. Please install python-docx.")
             return None
         
-        try:
-            doc = docx.Document(docx_file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text
-        except Exception as e:
-            print(f"❌ Error reading DOCX: {str(e)}")
-            return None
+        return self.extract_text_from_file(docx_file_path)
     
     def extract_text_from_file(self, file_path):
         """Extract text from any supported file format"""
-        file_extension = file_path.lower().split('.')[-1]
+        try:
+            check_file_size(os.path.getsize(file_path))
+            with open(file_path, 'rb') as f:
+                data = f.read()
+        except DocumentRejected as e:
+            print(f"❌ {str(e)}")
+            return None
+        except OSError as e:
+            print(f"❌ Error reading file: {str(e)}")
+            return None
         
-        print(f"📄 Reading {file_extension.upper()} file...")
+        file_format = detect_format(data)
+        print(f"📄 Reading {file_format.upper()} file...")
         
-        if file_extension == 'pdf':
-            return self.extract_text_from_pdf(file_path)
-        elif file_extension in ['docx', 'doc']:
-            return self.extract_text_from_docx(file_path)
-        elif file_extension == 'txt':
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return f.read()
-            except Exception as e:
-                print(f"❌ Error reading TXT: {str(e)}")
-                return None
-        else:
-            print(f"❌ Unsupported file format: {file_extension}")
-            print("Supported formats: PDF, DOCX, TXT")
+        try:
+            text = extract_text_from_bytes(data)
+        except DocumentRejected as e:
+            print(f"❌ {str(e)}")
+            if e.reason == 'unsupported_format':
+                print(f"Supported formats: {', '.join(fmt.upper() for fmt in EXTRACTORS)}")
             return None
+        
+        return text or None
     
     def calculate_ats_score(self, resume_text):
         """Calculate ATS score for the resume"""
@@ -311,12 +606,9 @@ class ATSSystem:
             print("❌ No valid text found in resume!")
             return None
         
-        # Convert to features
-        resume_features = self.vectorizer.transform([cleaned_text])
-        
-        # Get prediction and probabilities
-        prediction = self.model.predict(resume_features)[0]
-        probabilities = self.model.predict_proba(resume_features)[0]
+        # Arrays of an exported artifact are memory-mapped on the first prediction
+        predictions, probabilities = self._predict_cleaned([cleaned_text])
+        prediction, probabilities = predictions[0], probabilities[0]
         
         # Create results
         results = {
@@ -331,6 +623,76 @@ class ATSSystem:
         
         return results
     
+    def predict_batch(self, texts=None, chunk_size=None, csv_path=None):
+        """Score many resumes, yielding one result row per resume as each chunk finishes
+        
+        Pass either texts, an iterable of resume texts, or csv_path, the path
+        of a CSV with a resume text column, which is read chunk by chunk. A
+        single string is not taken as a path or a list: it raises ValueError.
+        Each chunk is transformed and predicted in one call. Rows carry the
+        position of the resume and the fields of calculate_ats_score, or an
+        'error' when the resume has no usable text.
+        """
+        if not self.is_trained:
+            raise ValueError("Model not trained! Please train the model first.")
+        if (texts is None) == (csv_path is None):
+            raise ValueError("Pass either texts or csv_path to predict_batch")
+        if isinstance(texts, str):
+            raise ValueError("texts must be an iterable of resume texts, not a single string; "
+                             "use csv_path= to score a CSV file")
+        chunk_size = chunk_size or PREDICT_BATCH_SIZE
+        
+        row = 0
+        if csv_path is None:
+            chunks = self._text_chunks(texts, chunk_size)
+        else:
+            chunks = self._csv_text_chunks(csv_path, chunk_size)
+        for texts in chunks:
+            cleaned = [_clean_letters(text) if isinstance(text, str) else self.clean_text(text) for text in texts]
+            usable = [index for index, text in enumerate(cleaned) if text]
+            predictions, probabilities = self._predict_cleaned([cleaned[index] for index in usable])
+            
+            results = [{'row': row + index, 'error': 'No valid text found in resume'} for index in range(len(texts))]
+            for index, prediction, scores in zip(usable, predictions, probabilities):
+                results[index] = {
+                    'row': row + index,
+                    'predicted_category': prediction,
+                    'confidence': float(scores.max()) * 100,
+                    'all_scores': {category: round(float(score) * 100, 1) for category, score in zip(self.categories, scores)}
+                }
+            yield from results
+            row += len(texts)
+    
+    def _csv_text_chunks(self, csv_path, chunk_size):
+        """Lists of up to chunk_size texts from the resume text column of a CSV"""
+        import pandas as pd
+        
+        columns = list(pd.read_csv(csv_path, nrows=0).columns)
+        text_column = next((col for col in TEXT_COLUMNS if col in columns), None)
+        if not text_column:
+            raise ValueError(f"Could not find resume text column in {csv_path}! "
+                             f"Looking for columns like: {', '.join(TEXT_COLUMNS)}")
+        for chunk in pd.read_csv(csv_path, usecols=[text_column], chunksize=chunk_size):
+            yield chunk[text_column].tolist()
+    
+    def _text_chunks(self, texts, chunk_size):
+        """Lists of up to chunk_size texts from an iterable"""
+        texts = iter(texts)
+        while True:
+            chunk = list(islice(texts, chunk_size))
+            if not chunk:
+                break
+            yield chunk
+    
+    def _predict_cleaned(self, cleaned_texts):
+        """Predicted categories and class probabilities of cleaned texts, in one model pass"""
+        if not cleaned_texts:
+            return [], np.empty((0, len(self.categories)))
+        if self.artifact is not None:
+            return self.artifact.predict(cleaned_texts)
+        probabilities = self.model.predict_proba(self.vectorizer.transform(cleaned_texts))
+        return list(self.model.classes_[probabilities.argmax(axis=1)]), probabilities
+    
     def display_ats_results(self, results):
         """Display ATS scoring results"""
         print("\n" + "="*60)
@@ -411,8 +773,11 @@ def main():
             print("\nChoose upload method:")
             print("1. Upload CSV in Google Colab")
             print("2. Enter CSV file path")
+            print("3. Enter CSV file path (stream a large file in chunks)")
+            print("4. Enter CSV file path (cross-validated search on all cores)")
+            print("5. Enter CSV file path (update a streamed model with newly labeled resumes)")
             
-            train_choice = input("Enter choice (1/2): ")
+            train_choice = input("Enter choice (1/2/3/4/5): ")
             
             if train_choice == "1":
                 csv_file = system.upload_file_colab("CSV file")
@@ -422,6 +787,18 @@ def main():
             elif train_choice == "2":
                 csv_path = input("Enter CSV file path: ")
                 system.train_model_from_csv(csv_path)
+            
+            elif train_choice == "3":
+                csv_path = input("Enter CSV file path: ")
+                system.train_model_streaming(csv_path)
+            
+            elif train_choice == "4":
+                csv_path = input("Enter CSV file path: ")
+                system.train_model_cv(csv_path)
+            
+            elif train_choice == "5":
+                csv_path = input("Enter CSV file path: ")
+                system.update_model(csv_path)
         
         elif choice == "2":
             if not system.is_trained:
@@ -511,6 +888,9 @@ def main():
                 print("⚠️  Model Status: NOT TRAINED")
             
             print(f"💾 Model File: {system.model_file}")
+            if system.artifact is not None:
+                print(f"📦 Model Artifact: {system.artifact.directory} "
+                      f"({'loaded' if system.artifact.is_loaded else 'loads on first prediction'})")
             print(f"📄 PDF Support: {'✅' if PDF_AVAILABLE else '❌'}")
             print(f"📄 DOCX Support: {'✅' if DOCX_AVAILABLE else '❌'}")
         
@@ -0,0 +1,97 @@
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ats_scorer import ATSScorer, CompactScoreResult
+from config import DEDUP_SETTINGS
+from dedup import MinHashLSH, minhash_signature
+from utils import RejectionReason, screen_resume_text
+
+class BatchScoringPipeline:
+    """Score many resumes for one job field, rejecting junk before full scoring
+    and reusing cached scores for near-duplicate resumes"""
+
+    def __init__(self, job_field: str, dedup: bool = DEDUP_SETTINGS['enabled'], profile: Optional[str] = None):
+        self.scorer = ATSScorer(job_field, profile)
+        self.recommendation_text = self.scorer.settings['recommendation_text']
+        self.rejections = Counter()
+        self.admitted = 0
+        self.duplicates = 0
+        self.gate_seconds = 0.0
+        self.dedup_seconds = 0.0
+        self.scoring_seconds = 0.0
+        self.index = MinHashLSH() if dedup else None
+        self._scored: List[Tuple[int, CompactScoreResult]] = []    # Input position and result of each scored resume
+
+    def score(self, resume_text: str) -> Dict:
+        """Gate one resume; returns the score results or a rejection record
+        
+        A near-duplicate's duplicate_of is the position, among every resume
+        passed to this pipeline, of the resume whose score it reuses.
+        """
+        position = self.admitted + sum(self.rejections.values())
+        start = time.perf_counter()
+        reason = screen_resume_text(resume_text)
+        self.gate_seconds += time.perf_counter() - start
+
+        if reason is not None:
+            self.rejections[reason] += 1
+            return {'rejected': True, 'rejection_reason': reason.value}
+
+        self.admitted += 1
+        signature = None
+        if self.index is not None:
+            start = time.perf_counter()
+            signature = minhash_signature(resume_text)
+            match = self.index.best_match(signature, DEDUP_SETTINGS['threshold'])
+            self.dedup_seconds += time.perf_counter() - start
+            if match is not None:
+                self.duplicates += 1
+                scored_id, similarity = match
+                original, cached = self._scored[scored_id]
+                return {**cached.to_dict(self.recommendation_text), 'duplicate_of': original, 'similarity': similarity}
+
+        start = time.perf_counter()
+        compact = self.scorer.calculate_compact_score(resume_text)
+        self.scoring_seconds += time.perf_counter() - start
+
+        if signature is not None:
+            # Cached scores are kept compact; the dict is rebuilt for each duplicate
+            self.index.add(len(self._scored), signature)
+            self._scored.append((position, compact))
+        return compact.to_dict(self.recommendation_text)
+
+    def run(self, texts: Iterable[str]) -> List[Dict]:
+        """Score every text in order"""
+        return [self.score(text) for text in texts]
+
+    def stats(self) -> Dict:
+        """Gate, dedup and scoring throughput, reported separately, plus rejection counts"""
+        screened = self.admitted + sum(self.rejections.values())
+        scored = self.admitted - self.duplicates
+        return {
+            'screened': screened,
+            'admitted': self.admitted,
+            'duplicates': self.duplicates,
+            'scored': scored,
+            'rejected': {reason.value: self.rejections[reason] for reason in RejectionReason},
+            'gate_seconds': self.gate_seconds,
+            'gate_docs_per_second': screened / self.gate_seconds if self.gate_seconds else 0.0,
+            'dedup_seconds': self.dedup_seconds,
+            'dedup_docs_per_second': self.admitted / self.dedup_seconds if self.dedup_seconds else 0.0,
+            'scoring_seconds': self.scoring_seconds,
+            'scoring_docs_per_second': scored / self.scoring_seconds if self.scoring_seconds else 0.0
+        }
+
+    def report(self) -> str:
+        """Human-readable summary of the run"""
+        stats = self.stats()
+        rejected = ', '.join(f"{reason}: {count}" for reason, count in stats['rejected'].items() if count)
+        return (
+            f"Screened {stats['screened']} documents: {stats['admitted']} admitted, "
+            f"{stats['screened'] - stats['admitted']} rejected ({rejected or 'none'}), "
+            f"{stats['duplicates']} near-duplicates reused a cached score\n"
+            f"Gate: {stats['gate_docs_per_second']:.0f} docs/s | "
+            f"Dedup: {stats['dedup_docs_per_second']:.0f} docs/s | "
+            f"Scoring: {stats['scoring_docs_per_second']:.0f} docs/s"
+        )
@@ -0,0 +1,590 @@
+# Performance benchmarks for the ATS pipeline
+# Usage: python benchmarks.py [name ...]   (runs every benchmark when no name is given)
+import sys
+import time
+
+import config
+from text_extractor import clean_text, extract_text_from_bytes
+
+# Text with the artifacts PDF extraction typically produces
+SAMPLE_EXTRACTED_TEXT = (
+    "PROFESSIONAL  EXPERIENCE\r\n"
+    "Senior Software Engineer – Tech Solutions Inc. | Jan 2020 — Present\r\n"
+    "●  Developed and main­tained high-trafﬁc web applica-\n  tions using Python\n"
+    " Led a team of 5 engineers, improving efﬁciency by 40%\t\t\n\n\n"
+    "• Collaborated with “product” and design teams on workﬂows\n"
+)
+
+def _best_time(func, repeats: int) -> float:
+    """Return the best wall-clock time of several runs"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def benchmark_normalization(size_mb: float = 4.0, repeats: int = 5):
+    """Measure clean_text throughput in MB/s of UTF-8 input"""
+    copies = int(size_mb * 1024 * 1024 / len(SAMPLE_EXTRACTED_TEXT.encode('utf-8'))) + 1
+    text = SAMPLE_EXTRACTED_TEXT * copies
+    megabytes = len(text.encode('utf-8')) / (1024 * 1024)
+
+    elapsed = _best_time(lambda: clean_text(text), repeats)
+    print(f"Normalization: {megabytes:.1f} MB in {elapsed * 1000:.1f} ms -> {megabytes / elapsed:.1f} MB/s")
+
+    # A typical resume-sized document
+    resume = SAMPLE_EXTRACTED_TEXT * 10
+    per_doc = _best_time(lambda: [clean_text(resume) for _ in range(1000)], repeats) / 1000
+    print(f"Normalization: {per_doc * 1e6:.1f} µs per {len(resume)}-character resume")
+
+def benchmark_pdf_extraction(pages: int = 40, repeats: int = 3):
+    """Compare serial and parallel per-page extraction of a long PDF"""
+    from test_text_extractor import make_pdf
+
+    line = "Developed data pipelines in Python and SQL for research groups " * 20
+    data = make_pdf([f"Page {number} {line}" for number in range(pages)])
+
+    serial = _best_time(lambda: extract_text_from_bytes(data, parallel=False), repeats)
+    extract_text_from_bytes(data, parallel=True)  # Warm up the process pool
+    parallel = _best_time(lambda: extract_text_from_bytes(data, parallel=True), repeats)
+    identical = extract_text_from_bytes(data, parallel=True) == extract_text_from_bytes(data, parallel=False)
+
+    print(f"PDF extraction ({pages} pages): serial {serial * 1000:.1f} ms, "
+          f"parallel {parallel * 1000:.1f} ms (workers: {config.PDF_PARALLEL_WORKERS or 'cpu_count'}), "
+          f"identical output: {identical}")
+
+def benchmark_timeline(resumes: int = 20000, repeats: int = 3):
+    """Measure per-resume cost of the experience timeline, single and batched"""
+    from experience_timeline import build_timeline, total_experience_months_batch
+
+    resume = (
+        "Jane Smith\njane@email.com\nEXPERIENCE\n"
+        "Senior Engineer | Acme | Jan 2019 - Present\n• Built APIs in Python\n"
+        "Engineer | Beta Corp | 03/2016 - 06/2019\n• Maintained SQL reports\n"
+        "Intern | Gamma | 2015 to 2016\nEDUCATION\nBS Computer Science | 2012-2016\n"
+    )
+    texts = [resume] * resumes
+
+    single = _best_time(lambda: [build_timeline(text) for text in texts], repeats)
+    batch = _best_time(lambda: total_experience_months_batch(texts), repeats)
+    print(f"Timeline: {single / resumes * 1e6:.1f} µs per resume, "
+          f"{batch / resumes * 1e6:.1f} µs per resume batched ({resumes} resumes)")
+
+def benchmark_resume_store(resumes: int = 50000):
+    """Measure parse speed and bytes per resume held in the columnar store"""
+    import tracemalloc
+    from resume_parser import ResumeStore, parse_resume
+
+    resume = (
+        "Jane Smith\njane@email.com\nEXPERIENCE\n"
+        "Senior Data Analyst | Acme Corp | Jan 2020 - Present\n• Built Tableau dashboards and SQL pipelines\n"
+        "Data Analyst at Beta Inc (2017 - 2020)\n• Automated Excel reports with Python\n"
+        "EDUCATION\nMS Statistics, State University | 2015-2017\nSKILLS\nPython, R, SQL, Tableau, Excel\n"
+    )
+    start = time.perf_counter()
+    parsed = parse_resume(resume)
+    store = ResumeStore()
+    tracemalloc.start()
+    for _ in range(resumes):
+        store.append(parsed)
+    in_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    elapsed = time.perf_counter() - start
+    serialized = len(store.to_bytes())
+
+    parse_time = _best_time(lambda: parse_resume(resume), 200)
+    print(f"Resume store: parse {parse_time * 1e6:.0f} µs, {in_memory / resumes:.0f} bytes per resume in memory, "
+          f"{serialized / resumes:.0f} bytes serialized ({resumes} resumes in {elapsed:.1f} s)")
+
+def benchmark_gate(documents: int = 2000):
+    """Run a bulk batch with ~10% junk and report gate and scoring throughput separately"""
+    from batch_pipeline import BatchScoringPipeline
+    from test_batch_pipeline import COVER_LETTER, RESUME
+
+    junk = ["", COVER_LETTER, "%PDF-1.4 0x00 ###### //// 1234 5678 " * 20]
+    texts = [junk[index % len(junk)] if index % 10 == 0 else RESUME for index in range(documents)]
+
+    pipeline = BatchScoringPipeline('data_analyst', dedup=False)
+    pipeline.run(texts)
+    print(pipeline.report())
+
+def benchmark_dedup(unique: int = 200, copies: int = 5):
+    """Score a corpus where each resume was submitted several times with small edits"""
+    from batch_pipeline import BatchScoringPipeline
+    from test_dedup import LONG_RESUME
+
+    # Distinct resumes get their own shuffled bullets; copies differ by one word
+    import random
+    words = LONG_RESUME.split()
+    texts = []
+    for number in range(unique):
+        shuffle = random.Random(number)
+        bullets = "\n".join("• " + " ".join(shuffle.sample(words, 12)) for _ in range(25))
+        base = LONG_RESUME + "\n" + bullets
+        texts.extend(base.replace("Power BI", f"Power BI {copy}") for copy in range(copies))
+
+    for dedup in (False, True):
+        pipeline = BatchScoringPipeline('data_analyst', dedup=dedup)
+        start = time.perf_counter()
+        pipeline.run(texts)
+        elapsed = time.perf_counter() - start
+        stats = pipeline.stats()
+        print(f"Dedup {'on ' if dedup else 'off'}: {len(texts)} resumes in {elapsed:.2f} s "
+              f"({len(texts) / elapsed:.0f} docs/s), {stats['scored']} fully scored, "
+              f"scoring {stats['scoring_seconds']:.2f} s + dedup {stats['dedup_seconds']:.2f} s")
+
+def benchmark_score_results(results: int = 20000):
+    """Compare memory held by full result dicts and compact score results"""
+    import tracemalloc
+    from ats_scorer import ATSScorer
+    from test_batch_pipeline import RESUME
+
+    scorer = ATSScorer('data_analyst')
+    for name, score in (('dict', scorer.calculate_ats_score), ('compact', scorer.calculate_compact_score)):
+        # Small edits keep each result distinct, as in a real corpus
+        texts = [RESUME.replace("Acme Corp", f"Company {number}") for number in range(results)]
+        tracemalloc.start()
+        held = [score(text) for text in texts]
+        in_memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"Score results ({name}): {in_memory / len(held):.0f} bytes per result ({results} results)")
+
+def benchmark_skill_membership(vocabulary: int = 30000, repeats: int = 3):
+    """Compare list scans and bit masks for counting required/preferred hits in a large taxonomy"""
+    import random
+
+    shuffle = random.Random(0)
+    skills = [f"skill {number}" for number in range(vocabulary)]
+    required = shuffle.sample(skills, vocabulary // 10)
+    preferred = shuffle.sample(skills, vocabulary // 10)
+    found = shuffle.sample(required + preferred, vocabulary // 20)
+
+    def list_counts():
+        return (sum(1 for skill in required if skill in found),
+                sum(1 for skill in preferred if skill in found),
+                [skill for skill in required if skill not in found])
+
+    skill_ids = {skill: skill_id for skill_id, skill in enumerate(skills)}
+    required_mask = sum(1 << skill_ids[skill] for skill in required)
+    preferred_mask = sum(1 << skill_ids[skill] for skill in set(preferred))
+    found_bits = sum(1 << skill_ids[skill] for skill in set(found))
+
+    def mask_counts():
+        missing = required_mask & ~found_bits
+        return (bin(found_bits & required_mask).count('1'), bin(found_bits & preferred_mask).count('1'),
+                [skills[skill_id] for skill_id in range(vocabulary) if missing >> skill_id & 1])
+
+    lists = _best_time(list_counts, 1)
+    masks = _best_time(mask_counts, repeats)
+    print(f"Skill membership ({vocabulary} skills): list scans {lists * 1000:.1f} ms, "
+          f"bit masks {masks * 1000:.1f} ms, same counts: {list_counts()[:2] == mask_counts()[:2]}")
+
+def benchmark_content(repeats: int = 500):
+    """Per-resume cost of the content analyzer against the old scans: one per vocabulary word plus a digit scan"""
+    from content_analyzer import ACTION_VERBS, CERTIFICATION_TERMS, PROFESSIONAL_TERMS, analyze_content
+    from test_dedup import LONG_RESUME
+
+    def scan(vocabulary):
+        text_lower = LONG_RESUME.lower()
+        return [word in text_lower for word in vocabulary], any(char.isdigit() for char in LONG_RESUME)
+
+    vocabulary = list(ACTION_VERBS | PROFESSIONAL_TERMS | CERTIFICATION_TERMS)
+    scans = _best_time(lambda: [scan(vocabulary) for _ in range(repeats)], 3) / repeats
+    # A taxonomy-sized vocabulary costs one more scan per word; the analyzer's cost does not grow
+    large = vocabulary * 10
+    large_scans = _best_time(lambda: [scan(large) for _ in range(repeats)], 3) / repeats
+    analyzer = _best_time(lambda: [analyze_content(LONG_RESUME) for _ in range(repeats)], 3) / repeats
+    print(f"Content: substring scans {scans * 1e6:.0f} µs ({len(vocabulary)} words), "
+          f"{large_scans * 1e6:.0f} µs ({len(large)} words); per-bullet analyzer {analyzer * 1e6:.0f} µs")
+
+def benchmark_profiles(pages: int = 6, repeats: int = 20):
+    """End-to-end extraction and scoring time of a multi-page PDF resume under each profile"""
+    from ats_scorer import ATSScorer
+    from test_text_extractor import make_pdf
+
+    line = "Developed data pipelines in Python and SQL and built Tableau dashboards for clients "
+    data = make_pdf(["EXPERIENCE " + line * 8] + [line * 12] * (pages - 1))
+
+    for profile in config.PERFORMANCE_PROFILES:
+        scorer = ATSScorer('data_analyst', profile)
+        # Small edits defeat the field recommendation cache, as in a real stream of resumes
+        per_resume = _best_time(
+            lambda: [scorer.calculate_ats_score(extract_text_from_bytes(data, profile=profile) + str(number))
+                     for number in range(repeats)], 3) / repeats
+        print(f"Profile {profile}: {per_resume * 1000:.1f} ms per {pages}-page resume")
+
+def benchmark_streaming_training(rows: int = 100000, chunk_size: int = 5000):
+    """Out-of-core training throughput and peak traced memory, which should not grow with the CSV"""
+    import contextlib
+    import io
+    import os
+    import tempfile
+    import tracemalloc
+    from ats_system_fixed import ATSSystem
+    from test_ats_system import make_training_csv
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in (rows // 5, rows):
+            csv_path = os.path.join(directory, f'resumes_{size}.csv')
+            make_training_csv(csv_path, size)
+            with contextlib.redirect_stdout(io.StringIO()):
+                system = ATSSystem(os.path.join(directory, 'ats_model.pkl'), os.path.join(directory, 'ats_model'))
+                tracemalloc.start()
+                start = time.perf_counter()
+                system.train_model_streaming(csv_path, chunk_size)
+                elapsed = time.perf_counter() - start
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+            print(f"Streaming training: {size} rows in {elapsed:.1f} s ({size / elapsed:.0f} rows/s), "
+                  f"peak {peak / 1024 / 1024:.0f} MB traced, accuracy {system.accuracy:.2%}")
+
+def benchmark_incremental_update(history: int = 50000, new: int = 500, chunk_size: int = 5000):
+    """Time to add newly labeled rows by retraining on the whole history against update_model on the new rows only"""
+    import contextlib
+    import io
+    import os
+    import tempfile
+    import pandas as pd
+    from ats_system_fixed import ATSSystem
+    from test_ats_system import make_training_csv
+
+    with tempfile.TemporaryDirectory() as directory:
+        history_path, new_path = os.path.join(directory, 'history.csv'), os.path.join(directory, 'new.csv')
+        combined_path = os.path.join(directory, 'combined.csv')
+        make_training_csv(history_path, history)
+        make_training_csv(new_path, new, seed=1)
+        pd.concat([pd.read_csv(history_path), pd.read_csv(new_path)]).to_csv(combined_path, index=False)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            system = ATSSystem(os.path.join(directory, 'ats_model.pkl'), os.path.join(directory, 'ats_model'))
+            system.train_model_streaming(history_path, chunk_size)
+            start = time.perf_counter()
+            system.train_model_streaming(combined_path, chunk_size)
+            retrain = time.perf_counter() - start
+            start = time.perf_counter()
+            system.train_model_from_csv(combined_path)
+            forest = time.perf_counter() - start
+
+            system.train_model_streaming(history_path, chunk_size)
+            system = ATSSystem(os.path.join(directory, 'ats_model.pkl'), os.path.join(directory, 'ats_model'))
+            start = time.perf_counter()
+            system.update_model(new_path, chunk_size)
+            update = time.perf_counter() - start
+        print(f"Adding {new} rows to {history}: forest retrain {forest:.2f} s, full streaming retrain {retrain:.2f} s, "
+              f"update_model {update:.2f} s including model load and artifact export "
+              f"({system.artifact.version}, accuracy on new rows {system.accuracy:.2%})")
+
+def benchmark_preprocessing(rows: int = 200000):
+    """Row-wise and vectorized text cleaning and labeling of a training frame, with an equivalence check"""
+    import contextlib
+    import io
+    import numpy as np
+    import pandas as pd
+    from ats_system_fixed import ATSSystem
+    from test_dedup import LONG_RESUME
+
+    generator = np.random.RandomState(0)
+    scores = generator.randint(0, 100, size=(rows, 3)).astype(float)
+    scores[generator.rand(rows, 3) < 0.05] = np.nan  # Missing scores, as in real dumps
+    texts = [LONG_RESUME[number % 500:] for number in range(rows)]
+    frame = pd.DataFrame({'Resume_Text': texts, 'Software_Engineer_Score': scores[:, 0],
+                          'Data_Analyst_Score': scores[:, 1], 'Consultant_Score': scores[:, 2]})
+    with contextlib.redirect_stdout(io.StringIO()):
+        system = ATSSystem()
+
+    timings, outputs = {}, {}
+    for name, clean, label in (
+            ('row-wise', lambda: frame['Resume_Text'].apply(system.clean_text),
+             lambda: system.create_labels_from_scores_rowwise(frame.copy(), verbose=False)['category']),
+            ('vectorized', lambda: system.clean_text_series(frame['Resume_Text']),
+             lambda: system.create_labels_from_scores(frame.copy(), verbose=False)['category'])):
+        start = time.perf_counter()
+        cleaned = clean()
+        middle = time.perf_counter()
+        labels = label()
+        timings[name] = (middle - start, time.perf_counter() - middle)
+        outputs[name] = (cleaned, labels)
+
+    identical = all(first.equals(second) for first, second in zip(outputs['row-wise'], outputs['vectorized']))
+    for name, (clean_seconds, label_seconds) in timings.items():
+        print(f"Preprocessing ({name}, {rows} rows): clean_text {clean_seconds:.2f} s, labels {label_seconds:.2f} s")
+    print(f"Preprocessing: identical output: {identical}")
+
+def benchmark_cv_training(rows: int = 3000, folds: int = 5):
+    """Feature cache miss and hit, and grid search time on one core and on every core"""
+    import contextlib
+    import io
+    import os
+    import tempfile
+    from model_training import train_with_cross_validation
+    from test_ats_system import make_system, make_training_csv
+
+    grid = {'n_estimators': [25, 50], 'max_depth': [None, 30]}
+    print(f"CV training: {os.cpu_count()} CPUs, {rows} rows, {folds} folds, 4 parameter sets")
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'resumes.csv')
+        make_training_csv(csv_path, rows)
+        for n_jobs in (1, -1):
+            with contextlib.redirect_stdout(io.StringIO()):
+                report = train_with_cross_validation(make_system(directory), csv_path, folds, grid, n_jobs,
+                                                     os.path.join(directory, 'cache'),
+                                                     os.path.join(directory, 'report.json'))
+            print(f"CV training (n_jobs={n_jobs}): features {report['feature_seconds']:.2f} s "
+                  f"(cache {report['feature_cache']}), search {report['search_seconds']:.2f} s, "
+                  f"refit {report['refit_seconds']:.2f} s, best accuracy {report['candidates'][0]['mean_accuracy']:.2%}")
+
+def benchmark_model_artifact(rows: int = 3000, repeats: int = 5):
+    """Construction and first-prediction time of ATSSystem from the pickle and from the artifact"""
+    import contextlib
+    import io
+    import os
+    import tempfile
+    from ats_system_fixed import ATSSystem
+    from model_artifact import export_artifact, retire_latest
+    from test_ats_system import make_training_csv
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'resumes.csv')
+        make_training_csv(csv_path, rows)
+        with contextlib.redirect_stdout(io.StringIO()):
+            trained = ATSSystem(os.path.join(directory, 'ats_model.pkl'), os.path.join(directory, 'ats_model'))
+            trained.train_model_from_csv(csv_path)
+
+        def load():
+            return ATSSystem(trained.model_file, trained.model_dir)
+
+        text = "Built tableau dashboards and sql reporting with pandas"
+        for name in ('pickle', 'artifact'):
+            if name == 'pickle':
+                retire_latest(trained.model_dir)
+            else:
+                export_artifact(trained.model, trained.vectorizer, trained.model_dir)
+            with contextlib.redirect_stdout(io.StringIO()):
+                construct = _best_time(load, repeats)
+                first = _best_time(lambda: load().calculate_ats_score(text), repeats) - construct
+            print(f"Model artifact ({name}): construct {construct * 1000:.1f} ms, "
+                  f"first prediction {first * 1000:.1f} ms")
+
+def benchmark_inference(rows: int = 3000, documents: int = 200):
+    """Cold start and per-document latency of the scikit-learn path against the NumPy predictor"""
+    import contextlib
+    import io
+    import os
+    import subprocess
+    import tempfile
+    from ats_system_fixed import ATSSystem
+    from model_artifact import ModelArtifact, retire_latest
+    from test_ats_system import make_training_csv
+    from test_dedup import LONG_RESUME
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'resumes.csv')
+        make_training_csv(csv_path, rows)
+        with contextlib.redirect_stdout(io.StringIO()):
+            system = ATSSystem(os.path.join(directory, 'ats_model.pkl'), os.path.join(directory, 'ats_model'))
+            system.train_model_from_csv(csv_path)
+        model, vectorizer = system.model, system.vectorizer
+        predictor = ModelArtifact.latest(system.model_dir).predictor
+        text = system.clean_text(LONG_RESUME)
+
+        per_doc = {
+            'scikit-learn predict + predict_proba': lambda: (model.predict(vectorizer.transform([text])),
+                                                             model.predict_proba(vectorizer.transform([text]))),
+            'scikit-learn predict_proba + argmax': lambda: model.predict_proba(vectorizer.transform([text])).argmax(),
+            'NumPy predictor': lambda: predictor.predict([text])
+        }
+        for name, predict in per_doc.items():
+            latency = _best_time(lambda: [predict() for _ in range(documents)], 3) / documents
+            print(f"Inference ({name}): {latency * 1000:.2f} ms per document")
+
+        # Fresh interpreters: import and first prediction, from the artifact and from the pickle
+        script = ("import contextlib, io\n"
+                  "with contextlib.redirect_stdout(io.StringIO()):\n"
+                  "    from ats_system_fixed import ATSSystem\n"
+                  f"    system = ATSSystem({system.model_file!r}, {system.model_dir!r})\n"
+                  "    system.calculate_ats_score('sql tableau dashboards')\n")
+        for name in ('artifact', 'pickle'):
+            if name == 'pickle':
+                retire_latest(system.model_dir)
+            cold = _best_time(lambda: subprocess.run([sys.executable, '-c', script], check=True), 3)
+            print(f"Inference cold start ({name}): {cold * 1000:.0f} ms to the first prediction in a new process")
+
+def benchmark_batch_prediction(rows: int = 3000, documents: int = 2000):
+    """Documents per second of calculate_ats_score in a loop against predict_batch, on both model paths"""
+    import contextlib
+    import io
+    import os
+    import tempfile
+    from ats_system_fixed import ATSSystem
+    from test_ats_system import make_training_csv
+    from test_dedup import LONG_RESUME
+
+    texts = [LONG_RESUME.replace("Acme Corp", f"Company {number}") for number in range(documents)]
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'resumes.csv')
+        make_training_csv(csv_path, rows)
+        with contextlib.redirect_stdout(io.StringIO()):
+            system = ATSSystem(os.path.join(directory, 'ats_model.pkl'), os.path.join(directory, 'ats_model'))
+            system.train_model_from_csv(csv_path)
+        artifact = system.artifact
+
+        for name in ('scikit-learn', 'artifact'):
+            system.artifact = artifact if name == 'artifact' else None
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                for text in texts:
+                    system.calculate_ats_score(text)
+                loop = time.perf_counter() - start
+            start = time.perf_counter()
+            for _ in system.predict_batch(texts):
+                pass
+            batch = time.perf_counter() - start
+            print(f"Batch prediction ({name}): per-document loop {documents / loop:.0f} docs/s, "
+                  f"predict_batch {documents / batch:.0f} docs/s ({config.PREDICT_BATCH_SIZE} per chunk)")
+
+def benchmark_hybrid(rows: int = 3000, documents: int = 1000):
+    """Time per document and stage split of the rule/model cascade against rules or the model alone"""
+    import contextlib
+    import io
+    import os
+    import random
+    import tempfile
+    from ats_system_fixed import ATSSystem
+    from field_recommender import get_field_recommendation
+    from hybrid_classifier import HybridFieldClassifier
+    from skills_database import SKILLS_DATABASE
+    from test_ats_system import FIELD_WORDS, make_training_csv
+
+    # Distinct resumes, more than the recommendation cache holds, drawing most of their
+    # words from one field (its skills database entries and training vocabulary) and a share from the others
+    shuffle = random.Random(1)
+    vocabularies = []
+    for field, words in zip(('software_engineering', 'data_analyst', 'consultant'), FIELD_WORDS.values()):
+        field_data = SKILLS_DATABASE[field]
+        vocabularies.append(words.split() + field_data['required'] + field_data['preferred'] + field_data['keywords'])
+    texts = []
+    for number in range(documents):
+        main = vocabularies[number % len(vocabularies)]
+        mix = shuffle.choice((0.5, 0.9))     # Share of words from the main field
+        words = []
+        for _ in range(60):
+            vocabulary = main if shuffle.random() < mix else shuffle.choice(vocabularies)
+            words.append(shuffle.choice(vocabulary))
+        texts.append(f"Resume {number}\nExperience\n" + " ".join(words))
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'resumes.csv')
+        make_training_csv(csv_path, rows)
+        with contextlib.redirect_stdout(io.StringIO()):
+            system = ATSSystem(os.path.join(directory, 'ats_model.pkl'), os.path.join(directory, 'ats_model'))
+            system.train_model_from_csv(csv_path)
+        artifact = system.artifact
+
+        start = time.perf_counter()
+        for text in texts:
+            get_field_recommendation(text)
+        rules = time.perf_counter() - start
+        print(f"Rules only: {rules / documents * 1000:.3f} ms/doc")
+
+        for name in ('scikit-learn', 'artifact'):
+            system.artifact = artifact if name == 'artifact' else None
+            start = time.perf_counter()
+            for _ in system.predict_batch(texts):
+                pass
+            model = time.perf_counter() - start
+
+            classifier = HybridFieldClassifier(system, audit_every=1)
+            start = time.perf_counter()
+            classifier.classify_batch(texts)
+            audited = time.perf_counter() - start
+            stats = classifier.stats()
+
+            classifier = HybridFieldClassifier(system)
+            start = time.perf_counter()
+            classifier.classify_batch(texts)
+            hybrid = time.perf_counter() - start
+            print(f"Model only ({name}): {model / documents * 1000:.3f} ms/doc; "
+                  f"hybrid {hybrid / documents * 1000:.3f} ms/doc with {classifier.stats()['model_call_rate']:.1%} "
+                  f"sent to the model (rules and model both run: {audited / documents * 1000:.3f} ms/doc, "
+                  f"agreement {stats['agreement_rate']:.1%})")
+
+def benchmark_inference_worker(rows: int = 3000, clients: int = 8, requests: int = 50):
+    """Per-request model loading against a warm worker, without and with micro-batching, under concurrent clients"""
+    import contextlib
+    import io
+    import os
+    import tempfile
+    import threading
+    from ats_system_fixed import ATSSystem
+    from inference_worker import InferenceClient, InferenceWorker
+    from test_ats_system import make_training_csv
+    from test_dedup import LONG_RESUME
+
+    texts = [LONG_RESUME.replace("Acme Corp", f"Company {number}") for number in range(requests)]
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'resumes.csv')
+        model_file, model_dir = os.path.join(directory, 'ats_model.pkl'), os.path.join(directory, 'ats_model')
+        make_training_csv(csv_path, rows)
+        with contextlib.redirect_stdout(io.StringIO()):
+            ATSSystem(model_file, model_dir).train_model_from_csv(csv_path)
+
+            start = time.perf_counter()
+            for text in texts[:10]:
+                ATSSystem(model_file, model_dir).calculate_ats_score(text)
+            cold = (time.perf_counter() - start) / 10
+        print(f"Model loaded per request: {cold * 1000:.1f} ms/request")
+
+        for window, max_batch_size in ((0.0, 1), (5.0, 64)):
+            with contextlib.redirect_stdout(io.StringIO()):
+                worker = InferenceWorker(ATSSystem(model_file, model_dir), ('127.0.0.1', 0), window, max_batch_size,
+                                         authkey=b'benchmark').start()
+
+            def client_loop():
+                with InferenceClient(worker.address, b'benchmark') as client:
+                    for text in texts:
+                        client.predict(text)
+
+            threads = [threading.Thread(target=client_loop) for _ in range(clients)]
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - start
+            stats = worker.stats()
+            worker.close()
+            latency = stats['latency_ms']
+            print(f"Warm worker, {window:g} ms window: {clients * requests / elapsed:.0f} requests/s from {clients} clients, "
+                  f"mean batch {stats['mean_batch_size']:.1f}, {stats['model_ms_per_batch']:.1f} ms/model call, "
+                  f"latency p50 {latency['p50']:.1f} / p90 {latency['p90']:.1f} / p99 {latency['p99']:.1f} ms")
+
+BENCHMARKS = {
+    'normalization': benchmark_normalization,
+    'pdf_extraction': benchmark_pdf_extraction,
+    'timeline': benchmark_timeline,
+    'resume_store': benchmark_resume_store,
+    'gate': benchmark_gate,
+    'dedup': benchmark_dedup,
+    'score_results': benchmark_score_results,
+    'skill_membership': benchmark_skill_membership,
+    'content': benchmark_content,
+    'profiles': benchmark_profiles,
+    'streaming_training': benchmark_streaming_training,
+    'incremental_update': benchmark_incremental_update,
+    'preprocessing': benchmark_preprocessing,
+    'cv_training': benchmark_cv_training,
+    'model_artifact': benchmark_model_artifact,
+    'inference': benchmark_inference,
+    'batch_prediction': benchmark_batch_prediction,
+    'hybrid': benchmark_hybrid,
+    'inference_worker': benchmark_inference_worker,
+}
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"Unknown benchmark: {name}. Available: {', '.join(BENCHMARKS)}")
+            sys.exit(1)
+        BENCHMARKS[name]()
@@ -1,8 +1,51 @@
 # Configuration settings for the ATS system
+import os
+from typing import Dict, Optional
 
 # File upload settings
 MAX_FILE_SIZE_MB = 10
-ALLOWED_EXTENSIONS = ['pdf', 'docx']
+ALLOWED_EXTENSIONS = ['pdf', 'docx', 'txt', 'html', 'rtf']
+MAX_PAGES = 40                      # Declared PDF page count limit
+MAX_DOCX_UNCOMPRESSED_MB = 50       # Total uncompressed size of a DOCX archive
+MAX_DOCX_COMPRESSION_RATIO = 100    # Zip-bomb guard: uncompressed / compressed size
+
+# PDF extraction settings
+PDF_PARALLEL_EXTRACTION = False     # Split long PDFs across a process pool
+PDF_PARALLEL_MIN_PAGES = 12         # Shorter documents stay on the serial path
+PDF_PARALLEL_WORKERS = None         # None uses os.cpu_count()
+
+# Performance profiles: 'thorough' for interactive use, 'fast' for bulk runs.
+# PERFORMANCE_PROFILE (or the ATS_PERFORMANCE_PROFILE environment variable) sets
+# the profile of the process; extract_text_from_bytes, ATSScorer and
+# FieldRecommender also take a profile name per request.
+PERFORMANCE_PROFILES = {
+    'thorough': {
+        'max_pages': None,                  # PDF pages extracted; None reads every page
+        'max_words': None,                  # Words kept for scoring; None keeps them all
+        'docx_tables': True,                # Extract DOCX tables as well as paragraphs
+        'fuzzy_skill_matching': True,       # Match skill variations ("js", "reactjs", "k8s")
+        'field_recommendation': True,       # Recommend the best-matching job field
+        'recommendation_text': True,        # Improvement recommendations and field reasoning
+        'field_cache_size': 256             # Field recommendations cached by resume text
+    },
+    'fast': {
+        'max_pages': 3,
+        'max_words': 2000,                  # Above the 1200-word length check, so scores keep the penalty
+        'docx_tables': False,
+        'fuzzy_skill_matching': False,
+        'field_recommendation': False,
+        'recommendation_text': False,
+        'field_cache_size': 0
+    }
+}
+PERFORMANCE_PROFILE = os.environ.get('ATS_PERFORMANCE_PROFILE', 'thorough')
+
+def get_performance_profile(profile: Optional[str] = None) -> Dict:
+    """Settings of the named profile, or of the process profile when no name is given"""
+    name = profile or PERFORMANCE_PROFILE
+    if name not in PERFORMANCE_PROFILES:
+        raise ValueError(f"Unknown performance profile: {name}. Available: {', '.join(PERFORMANCE_PROFILES)}")
+    return PERFORMANCE_PROFILES[name]
 
 # Scoring weights
 SCORING_WEIGHTS = {
@@ -11,6 +54,18 @@ SCORING_WEIGHTS = {
     'keywords': 0.2     # 20% weight for keyword density
 }
 
+# Weight of a skill match by the resume section it was found in.
+# Text outside any detected section counts as 'other'.
+SECTION_SKILL_WEIGHTS = {
+    'skills': 1.0,
+    'experience': 1.0,
+    'projects': 1.0,
+    'other': 1.0,
+    'summary': 0.75,
+    'education': 0.5,
+    'contact': 0.0      # e.g. "github.com/..." in the header is not Git experience
+}
+
 # ATS Score thresholds
 SCORE_THRESHOLDS = {
     'excellent': 85,
@@ -31,6 +86,84 @@ FORMAT_REQUIREMENTS = {
     ]
 }
 
+# First-stage gate that rejects junk before full scoring
+VALIDATION_GATE = {
+    'min_words': 50,
+    'min_letter_ratio': 0.5,        # Letters / non-space characters
+    'min_stopword_ratio': 0.02,     # English stopwords / words
+    'max_non_ascii_ratio': 0.3,     # Non-ASCII letters / letters
+    'min_section_signals': 1,       # Distinct resume section words
+    'cover_letter_signals': 2,      # Salutation/closing words that mark a cover letter
+    'cover_letter_max_sections': 1  # A cover letter has at most this many section words
+}
+
+# Near-duplicate detection in bulk runs: MinHash over word shingles, indexed with LSH.
+# 16 bands of 8 rows make resumes at 0.9 similarity near-certain candidates
+# while pairs below 0.5 rarely collide.
+DEDUP_SETTINGS = {
+    'enabled': True,
+    'shingle_size': 5,      # Words per shingle
+    'num_perm': 128,        # Signature length
+    'bands': 16,            # LSH bands; num_perm must divide evenly
+    'threshold': 0.9,       # Estimated Jaccard similarity that reuses a cached score
+    'seed': 1
+}
+
+# Cross-validated training of the ATSSystem forest (model_training.py).
+# Every parameter combination is scored on every fold, one fold per worker process.
+TRAINING_SETTINGS = {
+    'max_features': 5000,               # TF-IDF vocabulary size
+    'folds': 5,
+    'param_grid': {
+        'n_estimators': [50, 100],
+        'max_depth': [None, 30],
+        'min_samples_leaf': [1, 2]
+    },
+    'n_jobs': -1,                       # Worker processes; -1 uses every core
+    'cache_dir': '.ats_feature_cache',  # Fitted vectorizers and feature matrices by dataset hash
+    'report_file': 'training_report.json'
+}
+
+# Cascaded field classification (hybrid_classifier.py): the rule-based FieldRecommender
+# decides unless it is unsure, and only then is the ATSSystem model run
+HYBRID_CLASSIFIER = {
+    'escalate_confidence': ['Low'],     # Rule confidence levels sent to the model
+    'margin': 15.0,                     # Also escalate when the top two field scores are closer than this
+    'audit_every': 0                    # Also run the model on every Nth rule decision to measure agreement; 0 disables
+}
+
+# Exported ATSSystem models (model_artifact.py): one directory per version under
+# 'directory', each a manifest plus .npy arrays memory-mapped on the first prediction.
+# ATSSystem keeps the artifacts of each model file beside it: ats_model.pkl -> ats_model/
+MODEL_ARTIFACT = {
+    'directory': 'ats_model',       # Default root of the model_artifact functions, matching ats_model.pkl
+    'verify_checksums': True        # Check every array against its manifest SHA-256 when loading
+}
+
+PREDICT_BATCH_SIZE = 256           # Resumes per model call in ATSSystem.predict_batch
+
+# Long-lived inference worker (inference_worker.py) that keeps the model loaded.
+# Requests arriving within batch_window_ms of the first waiting one share a model call.
+INFERENCE_WORKER = {
+    'address': ('127.0.0.1', 6071),     # Local TCP address to listen on
+    'batch_window_ms': 5.0,
+    'max_batch_size': 64,               # A full batch is sent without waiting out the window
+    'latency_samples': 10000,           # Most recent request latencies kept for percentiles
+    'authkey_file': os.path.join(os.path.expanduser('~'), '.ats_worker_authkey')   # Generated, user-only, when no key is set
+}
+# Shared secret every client must present; the worker never runs without one
+INFERENCE_WORKER_AUTHKEY = os.environ.get('ATS_WORKER_AUTHKEY', '').encode() or None
+
+# Out-of-core training of ATSSystem on CSVs too large to load at once.
+# Memory is bounded by chunk_size rows plus an n_features x classes weight matrix.
+STREAMING_TRAINING = {
+    'chunk_size': 10000,        # CSV rows read, featurized and trained per step
+    'n_features': 2 ** 18,      # Hashed feature space; fixed, so no vocabulary is kept
+    'alpha': 1e-5,              # SGD regularization strength
+    'epochs': 1,                # Passes over the CSV
+    'progress_every': 10        # Chunks between progress lines
+}
+
 # Common ATS-friendly formats
 ATS_FRIENDLY_TIPS = [
     "Use standard section headings (Experience, Education, Skills)",
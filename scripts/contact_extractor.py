@@ -0,0 +1,76 @@
+import re
+from typing import Dict, Iterable, List, NamedTuple
+
+class ContactMatch(NamedTuple):
+    value: str
+    start: int
+    end: int
+
+_US_STATES = (
+    'AL|AK|AZ|AR|CA|CO|CT|DE|DC|FL|GA|HI|ID|IL|IN|IA|KS|KY|LA|ME|MD|MA|MI|MN|MS|MO|MT|NE|NV|NH|NJ|NM|'
+    'NY|NC|ND|OH|OK|OR|PA|RI|SC|SD|TN|TX|UT|VT|VA|WA|WV|WI|WY'
+)
+_COUNTRIES = (
+    'USA|United States|UK|United Kingdom|Canada|India|Germany|France|Spain|Italy|Netherlands|Ireland|'
+    'Australia|New Zealand|Singapore|Japan|China|Brazil|Mexico|Switzerland|Sweden|Poland|Pakistan|'
+    'Nigeria|Kenya|South Africa|UAE|United Arab Emirates'
+)
+
+# Every contact entity in one alternation, so a resume is scanned exactly once.
+# Locations are case-sensitive ("Austin, TX"); everything else ignores case.
+_CONTACT_PATTERN = re.compile(
+    r'(?P<email>[\w.+-]+@[\w-]+(?:\.[\w-]+)*\.[a-z]{2,})'
+    r'|(?P<linkedin>(?:https?://)?(?:[a-z]{2,3}\.)?linkedin\.com/(?:in|pub)/[\w%-]+/?)'
+    r'|(?P<github>(?:https?://)?(?:www\.)?github\.com/[\w-]+/?)'
+    r'|(?P<phone>(?<![\w@/.+-])\+?\(?\d[\d ().-]{7,18}\d(?![\w@]))'
+    r'|(?P<location>(?-i:\b[A-Z][a-z]+(?:[ -][A-Z][a-z]+)*, ?(?:(?:' + _US_STATES + r')(?: \d{5})?|'
+    + _COUNTRIES + r')\b))',
+    re.IGNORECASE
+)
+
+_ENTITY_KEYS = {
+    'email': 'emails',
+    'phone': 'phones',
+    'linkedin': 'linkedin',
+    'github': 'github',
+    'location': 'locations'
+}
+
+_YEAR_RANGE = re.compile(r'\b(?:19|20)\d\d ?[-.] ?(?:19|20)\d\d\b')
+_TRAILING_YEAR = re.compile(r' +(?:19|20)\d\d$')
+
+def _count_digits(text: str) -> int:
+    return sum(char.isdigit() for char in text)
+
+def _trim_trailing_years(candidate: str) -> str:
+    """Drop space-separated years the phone pattern ran into, as long as a full number remains"""
+    year = _TRAILING_YEAR.search(candidate)
+    while year and _count_digits(candidate[:year.start()]) >= 10:
+        candidate = candidate[:year.start()]
+        year = _TRAILING_YEAR.search(candidate)
+    return candidate
+
+def _is_phone_number(candidate: str) -> bool:
+    """Phone numbers have 10-15 digits and contain no year range like '2016-2018'"""
+    return 10 <= _count_digits(candidate) <= 15 and not _YEAR_RANGE.search(candidate)
+
+def extract_contacts(text: str) -> Dict[str, List[ContactMatch]]:
+    """Extract emails, phone numbers, LinkedIn/GitHub URLs and locations with offsets"""
+    contacts = {key: [] for key in _ENTITY_KEYS.values()}
+
+    for match in _CONTACT_PATTERN.finditer(text):
+        kind = match.lastgroup
+        value = match.group(kind).strip()
+        end = match.end()
+        if kind == 'phone':
+            value = _trim_trailing_years(value)
+            if not _is_phone_number(value):
+                continue
+            end = match.start() + len(value)
+        contacts[_ENTITY_KEYS[kind]].append(ContactMatch(value, match.start(), end))
+
+    return contacts
+
+def extract_contacts_batch(texts: Iterable[str]) -> List[Dict[str, List[ContactMatch]]]:
+    """Extract contact entities from many texts"""
+    return [extract_contacts(text) for text in texts]
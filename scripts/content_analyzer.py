@@ -0,0 +1,166 @@
+import re
+import string
+from array import array
+from bisect import bisect_left
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+ACTION_VERBS = frozenset([
+    'developed', 'created', 'managed', 'led', 'implemented', 'designed',
+    'built', 'improved', 'increased', 'reduced', 'achieved', 'delivered',
+    'collaborated', 'coordinated', 'analyzed', 'optimized', 'streamlined'
+])
+
+PROFESSIONAL_TERMS = frozenset([
+    'responsible', 'leadership', 'team', 'project', 'client', 'customer',
+    'business', 'strategic', 'innovative', 'successful', 'efficient'
+])
+
+CERTIFICATION_TERMS = frozenset(['certified', 'certification', 'award', 'recognition', 'achievement'])
+
+# Per-line flag bits
+BULLET = 1              # Line starts with a bullet marker or list number
+LEADING_VERB = 2        # First word is an action verb
+ACTION_VERB = 4         # An action verb appears anywhere in the line
+NUMBER = 8              # A figure other than a year
+PERCENT = 16            # A percentage
+PROFESSIONAL = 32       # At least one professional term
+CERTIFICATION = 64      # A certification or award
+LISTING = 128           # In a contact, skills or education section: not an achievement bullet
+
+QUANTIFIED = NUMBER | PERCENT
+
+# Every vocabulary word, with plurals, as UTF-8 bytes mapped to its flag and canonical form
+_VOCABULARY = {
+    **{(term + 's').encode(): (CERTIFICATION, term) for term in CERTIFICATION_TERMS},
+    **{term.encode(): (CERTIFICATION, term) for term in CERTIFICATION_TERMS},
+    **{(term + 's').encode(): (PROFESSIONAL, term) for term in PROFESSIONAL_TERMS},
+    **{term.encode(): (PROFESSIONAL, term) for term in PROFESSIONAL_TERMS},
+    **{verb.encode(): (ACTION_VERB, verb) for verb in ACTION_VERBS}
+}
+_VOCABULARY_WORDS = frozenset(_VOCABULARY)
+_ACTION_VERB_WORDS = frozenset(verb.encode() for verb in ACTION_VERBS)
+
+_BULLET_CHARS = '•●▪◦○■►✓*-'
+_NUMBERED = re.compile(r'\d{1,2}[.)]\s')
+
+# Lines are split into words on bytes: ASCII punctuation other than '%' and every
+# non-ASCII byte (bullet glyphs, accents) become spaces and ASCII capitals become
+# lowercase in one translate call, so offsets stay those of the original text
+_WORD_BREAKS = bytes.maketrans(
+    bytes(byte for byte in range(256) if byte >= 128 or (chr(byte) in string.punctuation and byte != ord('%')))
+    + string.ascii_uppercase.encode(),
+    b' ' * (128 + len(string.punctuation) - 1) + string.ascii_lowercase.encode()
+)
+_NON_DIGITS = bytes(byte for byte in range(256) if not chr(byte).isdigit())
+_FIGURE = re.compile(rb'\d+')
+
+def _is_year(figure: bytes) -> bool:
+    return len(figure) == 4 and figure[:2] in (b'19', b'20')
+
+# Sections whose lines list facts rather than describe achievements
+_LISTING_SECTIONS = ('contact', 'skills', 'education')
+
+class ContentAnalysis(NamedTuple):
+    line_starts: array              # Offset of each non-empty line
+    line_ends: array
+    flags: bytearray                # Flag bits of each line
+    action_verbs: FrozenSet[str]    # Distinct action verbs in the resume
+    professional_terms: FrozenSet[str]
+    units: List[int]                # Indexes of the lines judged as achievement bullets
+
+    def count(self, flag: int) -> int:
+        """Number of bullets with any of the given flag bits"""
+        return sum(1 for index in self.units if self.flags[index] & flag)
+
+    def weak_bullets(self, text: str) -> List[str]:
+        """Bullets that neither lead with an action verb nor quantify their impact"""
+        return [
+            text[self.line_starts[index]:self.line_ends[index]].strip()
+            for index in self.units
+            if self.flags[index] & BULLET and not self.flags[index] & (LEADING_VERB | QUANTIFIED)
+        ]
+
+def analyze_content(text: str, sections: Optional[Dict[str, Tuple[int, int]]] = None) -> ContentAnalysis:
+    """Walk the resume once, tagging each line with its content flags
+
+    sections are the spans from text_extractor.segment_sections; lines in
+    the contact, skills and education sections are tagged LISTING.
+    """
+    line_starts, line_ends = array('I'), array('I')
+    flags = bytearray()
+    action_verbs, professional_terms = set(), set()
+
+    # Each line is handled with a few C-level bytes and set operations
+    # instead of one probe of the whole text per vocabulary word
+    start = 0
+    word_lines = text.encode('utf-8').translate(_WORD_BREAKS).split(b'\n')
+    for line, word_line in zip(text.split('\n'), word_lines):
+        end = start + len(line)
+        words = word_line.split()
+        if words:
+            stripped = line.lstrip()
+            numbered = stripped[0].isdigit() and _NUMBERED.match(stripped)
+            line_flags = BULLET if numbered or stripped[0] in _BULLET_CHARS else 0
+            for word in _VOCABULARY_WORDS.intersection(words):
+                flag, canonical = _VOCABULARY[word]
+                line_flags |= flag
+                if flag == ACTION_VERB:
+                    action_verbs.add(canonical)
+                elif flag == PROFESSIONAL:
+                    professional_terms.add(canonical)
+            if words[1 if numbered and len(words) > 1 else 0] in _ACTION_VERB_WORDS:
+                line_flags |= LEADING_VERB
+            if b'%' in word_line:
+                line_flags |= PERCENT
+            # A list number is a bullet marker, not a figure
+            figures = b' '.join(words[1:]) if numbered else word_line
+            if figures.translate(None, _NON_DIGITS) and not all(map(_is_year, _FIGURE.findall(figures))):
+                line_flags |= NUMBER
+            line_starts.append(start)
+            line_ends.append(end)
+            flags.append(line_flags)
+        start = end + 1
+
+    # Tag the lines of the listing sections
+    for name in _LISTING_SECTIONS:
+        if sections and name in sections:
+            section_start, section_end = sections[name]
+            for index in range(bisect_left(line_starts, section_start), bisect_left(line_starts, section_end)):
+                flags[index] |= LISTING
+
+    # Achievement bullets: every bullet line outside the listing sections, or every such line when none are marked
+    lines = [index for index, line_flags in enumerate(flags) if not line_flags & LISTING]
+    units = [index for index in lines if flags[index] & BULLET] or lines
+
+    return ContentAnalysis(line_starts, line_ends, flags, frozenset(action_verbs), frozenset(professional_terms), units)
+
+def content_quality_score(analysis: ContentAnalysis) -> float:
+    """Aggregate per-bullet flags into a 0-100 content quality score"""
+    score = 0
+
+    # Bullets that open with an action verb; verbs elsewhere earn partial credit
+    strong_bullets = analysis.count(LEADING_VERB)
+    if strong_bullets >= 5:
+        score += 30
+    elif strong_bullets >= 3:
+        score += 20
+    elif strong_bullets >= 1 or analysis.action_verbs:
+        score += 10
+
+    # Bullets with quantified impact; percentages count for more
+    if analysis.count(PERCENT) and analysis.count(QUANTIFIED) >= 2:
+        score += 25
+    elif analysis.count(QUANTIFIED):
+        score += 15
+
+    # Professional language
+    if len(analysis.professional_terms) >= 3:
+        score += 20
+    elif analysis.professional_terms:
+        score += 10
+
+    # Industry certifications or awards anywhere in the resume
+    if any(flags & CERTIFICATION for flags in analysis.flags):
+        score += 15
+
+    return min(100, score)
@@ -0,0 +1,113 @@
+import re
+import zlib
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from config import DEDUP_SETTINGS
+
+_WORD = re.compile(r'\w+')
+
+# Per-position multipliers that combine word hashes into a shingle hash (odd, 64-bit)
+_POSITION_MULTIPLIERS = np.array([
+    0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93,
+    0xFF51AFD7ED558CCD, 0xC4CEB9FE1A85EC53, 0x94D049BB133111EB, 0xBF58476D1CE4E5B9
+], dtype=np.uint64)
+
+_SHIFT = np.uint64(32)
+
+def _shingle_hashes(text: str, size: int) -> np.ndarray:
+    """Distinct 64-bit hashes of every run of `size` lowercase words; short texts are one shingle"""
+    words = _WORD.findall(text.lower())
+    if not words:
+        return np.empty(0, dtype=np.uint64)
+    # crc32 is stable across processes, unlike the built-in str hash
+    word_hashes = np.fromiter((zlib.crc32(word.encode('utf-8')) for word in words),
+                              dtype=np.uint64, count=len(words))
+    size = min(size, len(words))
+    count = len(words) - size + 1
+    hashes = np.zeros(count, dtype=np.uint64)
+    for position in range(size):
+        hashes += word_hashes[position:position + count] * _POSITION_MULTIPLIERS[position]
+    return np.unique(hashes)
+
+def _permutations(num_perm: int, seed: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Deterministic multiply-shift hash parameters shared by every signature"""
+    generator = np.random.RandomState(seed)
+    a = generator.randint(0, 1 << 62, size=num_perm, dtype=np.int64).astype(np.uint64) * np.uint64(2) + np.uint64(1)
+    b = generator.randint(0, 1 << 62, size=num_perm, dtype=np.int64).astype(np.uint64)
+    return a, b
+
+_PERMUTATIONS = {}
+
+def minhash_signature(text: str, num_perm: int = DEDUP_SETTINGS['num_perm'],
+                      shingle_size: int = DEDUP_SETTINGS['shingle_size'],
+                      seed: int = DEDUP_SETTINGS['seed']) -> np.ndarray:
+    """MinHash signature (uint32 array of num_perm values) over the word shingles of text"""
+    if shingle_size > len(_POSITION_MULTIPLIERS):
+        raise ValueError(f"shingle_size must be at most {len(_POSITION_MULTIPLIERS)}")
+    key = (num_perm, seed)
+    if key not in _PERMUTATIONS:
+        _PERMUTATIONS[key] = _permutations(num_perm, seed)
+    a, b = _PERMUTATIONS[key]
+
+    hashes = _shingle_hashes(text, shingle_size)
+    if not len(hashes):
+        return np.full(num_perm, 0xFFFFFFFF, dtype=np.uint32)
+
+    # Multiply-shift hashing: uint64 arithmetic wraps and the high 32 bits are the hash.
+    # The shift is monotonic, so it is applied once to each minimum rather than to every value.
+    permuted = np.multiply.outer(a, hashes)
+    permuted += b[:, None]
+    return (permuted.min(axis=1) >> _SHIFT).astype(np.uint32)
+
+def estimate_similarity(first: np.ndarray, second: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two signatures"""
+    return float(np.count_nonzero(first == second)) / len(first)
+
+class MinHashLSH:
+    """Locality-sensitive index over MinHash signatures, split into bands"""
+
+    def __init__(self, num_perm: int = DEDUP_SETTINGS['num_perm'], bands: int = DEDUP_SETTINGS['bands']):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [{} for _ in range(bands)]
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)]
+
+    def add(self, key: Hashable, signature: np.ndarray):
+        """Index a signature under key"""
+        self._signatures[key] = signature
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            buckets.setdefault(band_key, []).append(key)
+
+    def candidates(self, signature: np.ndarray) -> Set[Hashable]:
+        """Keys sharing at least one band with signature"""
+        found = set()
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            found.update(buckets.get(band_key, ()))
+        return found
+
+    def query(self, signature: np.ndarray, threshold: float = DEDUP_SETTINGS['threshold']) -> List[Tuple[Hashable, float]]:
+        """Candidates whose estimated similarity reaches threshold, most similar first"""
+        matches = []
+        for key in self.candidates(signature):
+            similarity = estimate_similarity(signature, self._signatures[key])
+            if similarity >= threshold:
+                matches.append((key, similarity))
+        matches.sort(key=lambda match: -match[1])
+        return matches
+
+    def best_match(self, signature: np.ndarray,
+                   threshold: float = DEDUP_SETTINGS['threshold']) -> Optional[Tuple[Hashable, float]]:
+        """The most similar indexed key at or above threshold, if any"""
+        matches = self.query(signature, threshold)
+        return matches[0] if matches else None
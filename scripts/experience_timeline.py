@@ -0,0 +1,175 @@
+import re
+from datetime import date
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from text_extractor import segment_sections
+
+_MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+def _date_pattern(prefix: str) -> str:
+    """Pattern for 'Jan 2019', 'January 2019', '01/2019' or '2019'"""
+    return (
+        rf'(?:(?P<{prefix}month>jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|'
+        rf'aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?,?\s+'
+        rf'|(?P<{prefix}mnum>0?[1-9]|1[0-2])\s*/\s*)?'
+        rf'(?P<{prefix}year>(?:19|20)\d\d)'
+    )
+
+# A start date, a separator and an end date or 'Present'
+_DATE_RANGE = re.compile(
+    r'\b' + _date_pattern('s') +
+    r'\s*(?:-|–|—|to|until|till|through)\s*' +
+    r'(?:' + _date_pattern('e') + r'|(?P<present>present|current|now|today|date))\b',
+    re.IGNORECASE
+)
+
+# Fallback for resumes that only state "5+ years of experience"
+_YEARS_STATEMENT = re.compile(r'\b(\d{1,2})\+?\s*(?:years|yrs)\b', re.IGNORECASE)
+
+# Characters trimmed from a role line once the date range is removed
+_ROLE_TRIM = ' |-,()•\t'
+
+# Month indexes are year * 12 + month - 1; documents are offset by this much
+# when merging a batch so that intervals never merge across documents
+_DOC_OFFSET = 100000
+
+class Role(NamedTuple):
+    title: str
+    start: int      # Month index, inclusive
+    end: int        # Month index, exclusive
+
+    @property
+    def months(self) -> int:
+        return self.end - self.start
+
+def _month_index(match, prefix: str, is_end: bool) -> int:
+    """Convert the matched date parts into a month index"""
+    year = int(match.group(prefix + 'year'))
+    month_name = match.group(prefix + 'month')
+    month_number = match.group(prefix + 'mnum')
+    if month_name:
+        return year * 12 + _MONTHS[month_name[:3].lower()] - 1 + is_end
+    if month_number:
+        return year * 12 + int(month_number) - 1 + is_end
+    # Year-only dates: "2020-2024" counts as four years
+    return year * 12
+
+def _today_index(today: Optional[date]) -> int:
+    today = today or date.today()
+    return today.year * 12 + today.month
+
+def _range_months(match, now: int) -> Optional[Tuple[int, int]]:
+    """Month interval of a matched date range, clipped to today; None if it starts in the future"""
+    start = _month_index(match, 's', False)
+    if start >= now:
+        return None
+    end = now if match.group('present') else _month_index(match, 'e', True)
+    return start, min(max(end, start + 1), now)
+
+def parse_date_range(text: str, today: Optional[date] = None) -> Optional[Tuple[int, int, int, int]]:
+    """Find the first date range in text as (start_month, end_month, match_start, match_end)"""
+    now = _today_index(today)
+    for match in _DATE_RANGE.finditer(text):
+        interval = _range_months(match, now)
+        if interval is not None:
+            return interval[0], interval[1], match.start(), match.end()
+    return None
+
+def _experience_text(text: str) -> str:
+    """Restrict the search to the experience section when one is detected"""
+    spans = segment_sections(text)
+    if 'experience' in spans:
+        start, end = spans['experience']
+        return text[start:end]
+    if 'education' in spans:
+        # No experience heading: at least keep study dates out of the timeline
+        start, end = spans['education']
+        return text[:start] + "\n" + text[end:]
+    return text
+
+def find_roles(text: str, today: Optional[date] = None) -> List[Role]:
+    """Find every employment date range, with the role line it belongs to"""
+    text = _experience_text(text)
+    now = _today_index(today)
+    roles = []
+
+    for match in _DATE_RANGE.finditer(text):
+        interval = _range_months(match, now)
+        if interval is None:
+            continue
+        start, end = interval
+
+        line_start = text.rfind('\n', 0, match.start()) + 1
+        line_end = text.find('\n', match.end())
+        line_end = len(text) if line_end == -1 else line_end
+        title = (text[line_start:match.start()] + ' ' + text[match.end():line_end]).strip(_ROLE_TRIM)
+        roles.append(Role(' '.join(title.split()), start, end))
+
+    return roles
+
+def merge_intervals(intervals: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Merge overlapping or touching month intervals"""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+def build_timeline(text: str, today: Optional[date] = None) -> Dict:
+    """Build a merged, non-overlapping employment timeline for one resume"""
+    roles = find_roles(text, today)
+    merged = merge_intervals((role.start, role.end) for role in roles)
+    total_months = sum(end - start for start, end in merged)
+    return {
+        'roles': roles,
+        'merged': merged,
+        'total_months': total_months,
+        'total_years': round(total_months / 12, 1)
+    }
+
+def total_experience_months_batch(texts: List[str], today: Optional[date] = None) -> np.ndarray:
+    """Total merged experience in months for each text, merged for the whole batch at once"""
+    doc_ids, starts, ends = [], [], []
+    for doc_id, text in enumerate(texts):
+        for role in find_roles(text, today):
+            doc_ids.append(doc_id)
+            starts.append(role.start)
+            ends.append(role.end)
+
+    totals = np.zeros(len(texts), dtype=np.int64)
+    if not doc_ids:
+        return totals
+
+    doc_ids = np.asarray(doc_ids, dtype=np.int64)
+    order = np.lexsort((starts, doc_ids))
+    doc_ids = doc_ids[order]
+    offsets = doc_ids * _DOC_OFFSET
+    starts = np.asarray(starts, dtype=np.int64)[order] + offsets
+    ends = np.asarray(ends, dtype=np.int64)[order] + offsets
+
+    # An interval opens a new merged segment when it starts after every earlier interval ended
+    running_end = np.maximum.accumulate(ends)
+    opens = np.empty(len(starts), dtype=bool)
+    opens[0] = True
+    opens[1:] = starts[1:] > running_end[:-1]
+
+    segment_starts = np.flatnonzero(opens)
+    segment_ends = np.maximum.reduceat(ends, segment_starts)
+    np.add.at(totals, doc_ids[segment_starts], segment_ends - starts[segment_starts])
+    return totals
+
+def years_of_experience(text: str, today: Optional[date] = None) -> int:
+    """Whole years of experience from the timeline, or from an explicit 'N years' statement"""
+    total_months = build_timeline(text, today)['total_months']
+    if total_months:
+        return total_months // 12
+    statement = _YEARS_STATEMENT.search(text)
+    return int(statement.group(1)) if statement else 0
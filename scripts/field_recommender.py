@@ -1,8 +1,11 @@
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from skills_database import SKILLS_DATABASE
+import config
 
 class FieldRecommender:
-    def __init__(self):
+    def __init__(self, profile: Optional[str] = None):
+        self.settings = config.get_performance_profile(profile)
         self.fields = ['software_engineering', 'data_analyst', 'consultant']
         self.field_names = {
             'software_engineering': 'Software Engineering',
@@ -40,6 +43,7 @@ class FieldRecommender:
                 for field, score in sorted_fields
             },
             'reasoning': self._generate_reasoning(resume_lower, best_field)
+                         if self.settings['recommendation_text'] else []
         }
     
     def _calculate_field_match_score(self, resume_text: str, field: str) -> float:
@@ -134,7 +138,20 @@ class FieldRecommender:
         
         return reasoning[:3]  # Return top 3 reasons
 
-def get_field_recommendation(resume_text: str) -> Dict:
+# One LRU cache of recommendations per profile, keyed by resume text
+_CACHED_RECOMMENDERS = {}
+
+def get_field_recommendation(resume_text: str, profile: Optional[str] = None) -> Dict:
     """Get field recommendation for a resume"""
-    recommender = FieldRecommender()
-    return recommender.recommend_best_field(resume_text)
+    recommender = FieldRecommender(profile)
+    cache_size = recommender.settings['field_cache_size']
+    if not cache_size:
+        return recommender.recommend_best_field(resume_text)
+    
+    key = profile or config.PERFORMANCE_PROFILE
+    if key not in _CACHED_RECOMMENDERS:
+        _CACHED_RECOMMENDERS[key] = lru_cache(maxsize=cache_size)(recommender.recommend_best_field)
+    recommendation = _CACHED_RECOMMENDERS[key](resume_text)
+    # Callers get their own copy of the cached result
+    return {**recommendation, 'all_scores': dict(recommendation['all_scores']),
+            'reasoning': list(recommendation['reasoning'])}
@@ -0,0 +1,130 @@
+# Pure-NumPy inference for a TF-IDF + random forest model; scikit-learn is not imported
+import re
+from typing import Dict, List, Mapping, Tuple
+
+import numpy as np
+
+def _forest_arrays(model) -> Dict[str, np.ndarray]:
+    """Concatenate the trees of a fitted forest into flat node arrays with global child indexes"""
+    if not hasattr(model, 'estimators_') or not all(hasattr(tree, 'tree_') for tree in model.estimators_):
+        raise ValueError(f"Only random forest models can be exported, not {type(model).__name__}")
+    trees = [estimator.tree_ for estimator in model.estimators_]
+    if trees[0].value.shape[1] != 1:
+        raise ValueError("Multi-output forests cannot be exported")
+    offsets = np.cumsum([0] + [tree.node_count for tree in trees])
+
+    value = np.concatenate([tree.value[:, 0, :] for tree in trees]).astype(np.float64)
+    value /= np.maximum(value.sum(axis=1, keepdims=True), np.finfo(np.float64).tiny)
+    return {
+        'tree_roots': offsets[:-1].astype(np.int64),
+        'children_left': np.concatenate([np.where(tree.children_left >= 0, tree.children_left + offset, -1)
+                                         for tree, offset in zip(trees, offsets)]).astype(np.int64),
+        'children_right': np.concatenate([np.where(tree.children_right >= 0, tree.children_right + offset, -1)
+                                          for tree, offset in zip(trees, offsets)]).astype(np.int64),
+        'feature': np.concatenate([tree.feature for tree in trees]).astype(np.int32),     # -2 at leaves
+        'threshold': np.concatenate([tree.threshold for tree in trees]).astype(np.float64),
+        'value': value      # Class probabilities of each node
+    }
+
+def _vectorizer_arrays(vectorizer) -> Dict[str, np.ndarray]:
+    """Vocabulary sorted by term, with its feature columns, and the IDF weights"""
+    if not hasattr(vectorizer, 'vocabulary_') or not hasattr(vectorizer, 'use_idf'):
+        raise ValueError(f"Only fitted TF-IDF vectorizers can be exported, not {type(vectorizer).__name__}")
+    if (vectorizer.analyzer != 'word' or tuple(vectorizer.ngram_range) != (1, 1)
+            or vectorizer.tokenizer is not None or vectorizer.preprocessor is not None):
+        raise ValueError("Only word unigram TF-IDF vectorizers with the default tokenizer can be exported")
+    # Options ForestPredictor.transform does not reproduce
+    if vectorizer.binary or vectorizer.strip_accents is not None or not vectorizer.use_idf \
+            or np.dtype(vectorizer.dtype) != np.float64:
+        raise ValueError("TF-IDF vectorizers with binary, strip_accents, use_idf=False or a dtype other than "
+                         "float64 cannot be exported")
+    terms = sorted(vectorizer.vocabulary_)
+    return {
+        'vocabulary_terms': np.array(terms, dtype=str),
+        'vocabulary_columns': np.array([vectorizer.vocabulary_[term] for term in terms], dtype=np.int32),
+        'idf': np.asarray(vectorizer.idf_, dtype=np.float64)
+    }
+
+def flatten_model(model, vectorizer) -> Tuple[Dict[str, np.ndarray], Dict]:
+    """Plain arrays and settings that ForestPredictor needs, from a fitted TfidfVectorizer
+    and RandomForestClassifier; raises ValueError for any other kind of model"""
+    arrays = {**_vectorizer_arrays(vectorizer), **_forest_arrays(model)}
+    settings = {
+        'classes': [str(label) for label in model.classes_],
+        'lowercase': bool(vectorizer.lowercase),
+        'token_pattern': vectorizer.token_pattern,
+        'sublinear_tf': bool(vectorizer.sublinear_tf),
+        'norm': vectorizer.norm,
+        'n_features': int(len(vectorizer.idf_))
+    }
+    return arrays, settings
+
+class ForestPredictor:
+    """TF-IDF transform and forest class probabilities over flat NumPy arrays"""
+
+    def __init__(self, arrays: Mapping[str, np.ndarray], settings: Dict):
+        self.arrays = arrays
+        self.settings = settings
+        self.classes = settings['classes']
+        self._token_pattern = re.compile(settings['token_pattern'])
+
+    def transform(self, texts: List[str]) -> np.ndarray:
+        """TF-IDF features of texts as a dense float32 matrix, the precision the trees split on"""
+        arrays, settings = self.arrays, self.settings
+        terms, columns = arrays['vocabulary_terms'], arrays['vocabulary_columns']
+
+        # Every document's known tokens, looked up in the sorted vocabulary at once
+        rows, tokens = [], []
+        for row, text in enumerate(texts):
+            found = self._token_pattern.findall(text.lower() if settings['lowercase'] else text)
+            tokens.extend(found)
+            rows.extend([row] * len(found))
+        features = np.zeros((len(texts), settings['n_features']), dtype=np.float64)
+        if tokens:
+            tokens = np.array(tokens, dtype=str)
+            positions = np.minimum(np.searchsorted(terms, tokens), len(terms) - 1)
+            known = terms[positions] == tokens
+            np.add.at(features, (np.array(rows)[known], columns[positions[known]]), 1)
+
+        if settings['sublinear_tf']:
+            counted = features > 0
+            np.log(features, out=features, where=counted)
+            features[counted] += 1
+        features *= arrays['idf']
+        if settings['norm'] == 'l2':
+            norms = np.sqrt(np.einsum('ij,ij->i', features, features))
+        elif settings['norm'] == 'l1':
+            norms = np.abs(features).sum(axis=1)
+        else:
+            norms = np.ones(len(texts))
+        features /= np.where(norms > 0, norms, 1)[:, None]
+        return features.astype(np.float32)
+
+    def predict_proba(self, texts: List[str]) -> np.ndarray:
+        """Class probabilities of texts, averaged over the trees, in the order of classes
+        
+        Every (document, tree) pair descends together, one tree level per
+        step, so the forest is walked once for all documents.
+        """
+        features = self.transform(texts)
+        arrays = self.arrays
+        left, right = arrays['children_left'], arrays['children_right']
+        feature, threshold = arrays['feature'], arrays['threshold']
+        roots = np.asarray(arrays['tree_roots'])
+
+        nodes = np.tile(roots, len(texts))
+        documents = np.repeat(np.arange(len(texts)), len(roots))
+        active = np.flatnonzero(feature[nodes] >= 0)
+        while len(active):
+            current = nodes[active]
+            go_left = features[documents[active], feature[current]] <= threshold[current]
+            nodes[active] = np.where(go_left, left[current], right[current])
+            active = active[feature[nodes[active]] >= 0]
+
+        leaf_values = arrays['value'][nodes].reshape(len(texts), len(roots), len(self.classes))
+        return leaf_values.mean(axis=1)
+
+    def predict(self, texts: List[str]) -> Tuple[List[str], np.ndarray]:
+        """Most probable class of each text, and the probabilities it came from, in one pass"""
+        probabilities = self.predict_proba(texts)
+        return [self.classes[index] for index in probabilities.argmax(axis=1)], probabilities
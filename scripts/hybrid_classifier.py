@@ -0,0 +1,126 @@
+# Cascaded field classification: cheap rules first, the ML model only when the rules are unsure
+import time
+from typing import Dict, Iterable, List, Optional
+
+from config import HYBRID_CLASSIFIER
+from field_recommender import FieldRecommender, get_field_recommendation
+
+RULES = 'rules'
+MODEL = 'model'
+
+class HybridFieldClassifier:
+    """Classify resumes by field with FieldRecommender, escalating unsure cases to ATSSystem"""
+
+    def __init__(self, system=None, profile: Optional[str] = None, margin: Optional[float] = None,
+                 escalate_confidence: Optional[Iterable[str]] = None, audit_every: Optional[int] = None):
+        self._system = system
+        self.profile = profile
+        self.margin = HYBRID_CLASSIFIER['margin'] if margin is None else margin
+        self.escalate_confidence = set(HYBRID_CLASSIFIER['escalate_confidence']
+                                       if escalate_confidence is None else escalate_confidence)
+        self.audit_every = HYBRID_CLASSIFIER['audit_every'] if audit_every is None else audit_every
+        self.field_names = FieldRecommender(profile).field_names
+
+        self.classified = 0
+        self.decided = {RULES: 0, MODEL: 0}
+        self.escalations_without_model = 0
+        self.compared = 0           # Resumes where both stages produced a field
+        self.agreements = 0
+        self.audits = 0
+        self.rule_seconds = 0.0
+        self.model_seconds = 0.0
+
+    @property
+    def system(self):
+        """The ATSSystem model, loaded when the first resume is escalated"""
+        if self._system is None:
+            from ats_system_fixed import ATSSystem
+            self._system = ATSSystem()
+        return self._system
+
+    def needs_model(self, recommendation: Dict) -> bool:
+        """Whether the rule-based recommendation is too unsure to stand on its own"""
+        scores = sorted(recommendation['all_scores'].values(), reverse=True)
+        top_two_margin = scores[0] - scores[1] if len(scores) > 1 else float('inf')
+        return recommendation['confidence'] in self.escalate_confidence or top_two_margin < self.margin
+
+    def classify(self, resume_text: str) -> Dict:
+        """Field of one resume, with the stage that decided it"""
+        return self.classify_batch([resume_text])[0]
+
+    def classify_batch(self, texts: List[str]) -> List[Dict]:
+        """Fields of many resumes; escalated resumes go to the model in one batch"""
+        start = time.perf_counter()
+        results = []
+        model_rows = []     # Indexes of the results the model is run on
+        for text in texts:
+            recommendation = get_field_recommendation(text, self.profile)
+            escalate = self.needs_model(recommendation)
+            self.classified += 1
+            audit = not escalate and self.audit_every and self.classified % self.audit_every == 0
+            if escalate or audit:
+                model_rows.append(len(results))
+            results.append({
+                'field': recommendation['recommended_field'],
+                'field_name': recommendation['recommended_field_name'],
+                'stage': RULES,
+                'escalated': escalate,
+                'rule_field': recommendation['recommended_field'],
+                'rule_confidence': recommendation['confidence'],
+                'model_field': None,
+                'model_confidence': None
+            })
+        self.rule_seconds += time.perf_counter() - start
+
+        if model_rows and not self.system.is_trained:
+            self.escalations_without_model += sum(results[index]['escalated'] for index in model_rows)
+            model_rows = []
+        if model_rows:
+            start = time.perf_counter()
+            predictions = self.system.predict_batch([texts[index] for index in model_rows])
+            for index, prediction in zip(model_rows, predictions):
+                result = results[index]
+                if 'error' in prediction:
+                    continue
+                result['model_field'] = str(prediction['predicted_category'])
+                result['model_confidence'] = prediction['confidence']
+                self.compared += 1
+                self.agreements += result['model_field'] == result['rule_field']
+                if result['escalated']:
+                    result['field'] = result['model_field']
+                    result['field_name'] = self.field_names.get(result['field'], result['field'])
+                    result['stage'] = MODEL
+                else:
+                    self.audits += 1
+            self.model_seconds += time.perf_counter() - start
+
+        for result in results:
+            self.decided[result['stage']] += 1
+        return results
+
+    def stats(self) -> Dict:
+        """Stage counts, model call rate, agreement between stages and time spent in each"""
+        classified = max(self.classified, 1)
+        return {
+            'classified': self.classified,
+            'decided_by_rules': self.decided[RULES],
+            'decided_by_model': self.decided[MODEL],
+            'escalations_without_model': self.escalations_without_model,
+            'audits': self.audits,
+            'model_call_rate': (self.decided[MODEL] + self.audits) / classified,
+            'agreement_rate': self.agreements / self.compared if self.compared else None,
+            'rule_seconds': self.rule_seconds,
+            'model_seconds': self.model_seconds
+        }
+
+    def report(self) -> str:
+        stats = self.stats()
+        agreement = 'n/a' if stats['agreement_rate'] is None else f"{stats['agreement_rate']:.1%}"
+        return "\n".join([
+            f"Classified: {stats['classified']}",
+            f"Decided by rules: {stats['decided_by_rules']}, by model: {stats['decided_by_model']} "
+            f"(audits: {stats['audits']}, escalations without a model: {stats['escalations_without_model']})",
+            f"Model call rate: {stats['model_call_rate']:.1%}",
+            f"Agreement when both ran: {agreement}",
+            f"Time: rules {stats['rule_seconds']:.3f} s, model {stats['model_seconds']:.3f} s"
+        ])
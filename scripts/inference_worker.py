@@ -0,0 +1,231 @@
+# Long-lived inference worker: holds an ATSSystem model warm and micro-batches concurrent requests
+import os
+import queue
+import secrets
+import stat
+import threading
+import time
+from collections import Counter, deque
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener, answer_challenge, deliver_challenge
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from config import INFERENCE_WORKER, INFERENCE_WORKER_AUTHKEY
+
+def load_authkey(path: str = INFERENCE_WORKER['authkey_file']) -> bytes:
+    """The worker's shared secret: ATS_WORKER_AUTHKEY if set, else the key in path,
+    which is generated and made readable by the current user only on first use"""
+    if INFERENCE_WORKER_AUTHKEY:
+        return INFERENCE_WORKER_AUTHKEY
+    try:
+        handle = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        if os.stat(path).st_mode & (stat.S_IRWXG | stat.S_IRWXO):
+            raise ValueError(f"Inference worker key file {path} must be accessible by its owner only (chmod 600)")
+        with open(path, 'rb') as f:
+            key = f.read().strip()
+        if not key:
+            raise ValueError(f"Inference worker key file {path} is empty")
+        return key
+    key = secrets.token_hex(32).encode()
+    with os.fdopen(handle, 'wb') as f:
+        f.write(key)
+    return key
+
+class _Request(NamedTuple):
+    connection: object
+    lock: threading.Lock        # Serializes sends on the connection
+    request_id: int
+    text: str
+    received: float
+
+class InferenceWorker:
+    """Serve field predictions over a local socket, one model call per micro-batch
+    
+    Each connection is read by its own thread. A single batching thread takes
+    the first waiting request, collects whatever else arrives within the batch
+    window (up to max_batch_size), and scores them with one predict_batch call.
+    """
+
+    def __init__(self, system, address: Tuple[str, int] = INFERENCE_WORKER['address'],
+                 batch_window_ms: float = INFERENCE_WORKER['batch_window_ms'],
+                 max_batch_size: int = INFERENCE_WORKER['max_batch_size'],
+                 authkey: Optional[bytes] = None):
+        self.system = system
+        self.batch_window = batch_window_ms / 1000
+        self.max_batch_size = max_batch_size
+        # Connections carry pickles, so nothing is read from a client before it authenticates.
+        # The handshake runs on the connection's own thread, so slow clients do not hold up accept().
+        self._authkey = authkey or load_authkey()
+        self.listener = Listener(address, backlog=128)
+        self.address = self.listener.address
+        self._requests = queue.Queue()
+        self._stopped = threading.Event()
+        self._threads = []
+
+        self._stats_lock = threading.Lock()
+        self.requests = 0
+        self.batch_sizes = Counter()
+        self.model_seconds = 0.0
+        self.latencies = deque(maxlen=INFERENCE_WORKER['latency_samples'])
+
+    def start(self) -> 'InferenceWorker':
+        """Load the model, then accept connections and batch requests on background threads"""
+        # Artifacts map their arrays on the first prediction; pay that before the first request
+        list(self.system.predict_batch(["warm up"]))
+        for target in (self._accept_loop, self._batch_loop):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def serve_forever(self):
+        """Serve until interrupted"""
+        self.start()
+        try:
+            while not self._stopped.wait(1):
+                pass
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+
+    def close(self):
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        # A blocked accept() does not notice the listener closing, so connect once to wake it
+        try:
+            Client(self.address, authkey=self._authkey).close()
+        except Exception:
+            pass
+        self.listener.close()
+        for thread in self._threads:
+            thread.join(timeout=1)
+
+    def _accept_loop(self):
+        while True:
+            try:
+                connection = self.listener.accept()
+            except OSError:
+                # Closed listener, or a client that disconnected while queued
+                if self._stopped.is_set():
+                    return
+                continue
+            if self._stopped.is_set():
+                connection.close()
+                return
+            threading.Thread(target=self._read_loop, args=(connection,), daemon=True).start()
+
+    def _read_loop(self, connection):
+        lock = threading.Lock()
+        try:
+            deliver_challenge(connection, self._authkey)
+            answer_challenge(connection, self._authkey)
+            while not self._stopped.is_set():
+                message = connection.recv()
+                if not isinstance(message, dict):
+                    with lock:
+                        connection.send({'id': None, 'error': "Requests must be dicts with an 'id' and a 'text'"})
+                elif message.get('type') == 'stats':
+                    with lock:
+                        connection.send({'id': message.get('id'), 'stats': self.stats()})
+                else:
+                    self._requests.put(_Request(connection, lock, message.get('id'), message.get('text') or '',
+                                                time.perf_counter()))
+        except (AuthenticationError, EOFError, OSError):
+            pass
+        finally:
+            connection.close()
+
+    def _next_batch(self) -> List[_Request]:
+        """The first waiting request and those arriving within the window after it"""
+        batch = [self._requests.get(timeout=0.5)]
+        deadline = batch[0].received + self.batch_window
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                batch.append(self._requests.get(timeout=remaining) if remaining > 0 else self._requests.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _batch_loop(self):
+        while not self._stopped.is_set():
+            try:
+                batch = self._next_batch()
+            except queue.Empty:
+                continue
+
+            start = time.perf_counter()
+            try:
+                results = list(self.system.predict_batch([request.text for request in batch], chunk_size=len(batch)))
+            except Exception as e:
+                results = [{'error': f"Prediction failed: {e}"}] * len(batch)
+            finished = time.perf_counter()
+
+            # Stats are recorded before replying, so a client asking right after its reply sees its request
+            with self._stats_lock:
+                self.requests += len(batch)
+                self.batch_sizes[len(batch)] += 1
+                self.model_seconds += finished - start
+                self.latencies.extend(finished - request.received for request in batch)
+
+            for request, result in zip(batch, results):
+                result = {key: value for key, value in result.items() if key != 'row'}
+                try:
+                    with request.lock:
+                        request.connection.send({'id': request.request_id, **result})
+                except OSError:
+                    pass    # The client went away
+
+    def stats(self) -> Dict:
+        """Request and batch counts, batch size distribution, and percentiles in milliseconds of the
+        latency from a request arriving to its prediction being ready"""
+        with self._stats_lock:
+            batches = sum(self.batch_sizes.values())
+            latencies = np.array(self.latencies) * 1000
+            return {
+                'requests': self.requests,
+                'batches': batches,
+                'mean_batch_size': self.requests / batches if batches else 0,
+                'batch_sizes': dict(sorted(self.batch_sizes.items())),
+                'model_ms_per_batch': self.model_seconds * 1000 / batches if batches else 0,
+                'latency_ms': {
+                    f'p{percentile}': float(np.percentile(latencies, percentile)) if len(latencies) else None
+                    for percentile in (50, 90, 99)
+                }
+            }
+
+class InferenceClient:
+    """Connection to an InferenceWorker; each thread should use its own client"""
+
+    def __init__(self, address: Tuple[str, int] = INFERENCE_WORKER['address'],
+                 authkey: Optional[bytes] = None):
+        self.connection = Client(address, authkey=authkey or load_authkey())
+        self._next_id = 0
+
+    def _call(self, message: Dict) -> Dict:
+        self._next_id += 1
+        self.connection.send({'id': self._next_id, **message})
+        reply = self.connection.recv()
+        reply.pop('id', None)
+        return reply
+
+    def predict(self, resume_text: str) -> Dict:
+        """Predicted category, confidence and all scores of one resume, or an 'error'"""
+        return self._call({'type': 'predict', 'text': resume_text})
+
+    def stats(self) -> Dict:
+        return self._call({'type': 'stats'})['stats']
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self) -> 'InferenceClient':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
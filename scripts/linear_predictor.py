@@ -0,0 +1,131 @@
+# Pure-NumPy inference for a hashing-features + linear model; scikit-learn is not imported
+import re
+from functools import lru_cache
+from typing import Dict, List, Mapping, Tuple
+
+import numpy as np
+
+_MASK = 0xFFFFFFFF
+
+def _rotate(value: int, bits: int) -> int:
+    return ((value << bits) | (value >> (32 - bits))) & _MASK
+
+def _scramble(block: int) -> int:
+    return (_rotate((block * 0xCC9E2D51) & _MASK, 15) * 0x1B873593) & _MASK
+
+@lru_cache(maxsize=1 << 16)
+def murmurhash3_32(token: str) -> int:
+    """Signed 32-bit MurmurHash3 (seed 0) of a token's UTF-8 bytes, as HashingVectorizer computes it"""
+    data = token.encode('utf-8')
+    length = len(data)
+    rounded = length & ~3
+    h = 0
+    for start in range(0, rounded, 4):
+        h ^= _scramble(int.from_bytes(data[start:start + 4], 'little'))
+        h = (_rotate(h, 13) * 5 + 0xE6546B64) & _MASK
+    if length & 3:
+        h ^= _scramble(int.from_bytes(data[rounded:], 'little'))
+    h ^= length
+    h ^= h >> 16
+    h = (h * 0x85EBCA6B) & _MASK
+    h ^= h >> 13
+    h = (h * 0xC2B2AE35) & _MASK
+    h ^= h >> 16
+    return h - (1 << 32) if h & 0x80000000 else h
+
+def _hashing_settings(vectorizer) -> Tuple[Dict[str, np.ndarray], Dict]:
+    """Stop words and settings of a HashingVectorizer"""
+    if not hasattr(vectorizer, 'n_features') or not hasattr(vectorizer, 'alternate_sign'):
+        raise ValueError(f"Only hashing vectorizers can be exported with a linear model, not {type(vectorizer).__name__}")
+    if (vectorizer.analyzer != 'word' or tuple(vectorizer.ngram_range) != (1, 1) or vectorizer.tokenizer is not None
+            or vectorizer.preprocessor is not None or vectorizer.strip_accents is not None):
+        raise ValueError("Only word unigram hashing vectorizers with the default tokenizer can be exported")
+    stop_words = sorted(vectorizer.get_stop_words() or ())
+    arrays = {'stop_words': np.array(stop_words, dtype=str) if stop_words else np.empty(0, dtype='<U1')}
+    settings = {
+        'lowercase': bool(vectorizer.lowercase),
+        'token_pattern': vectorizer.token_pattern,
+        'n_features': int(vectorizer.n_features),
+        'alternate_sign': bool(vectorizer.alternate_sign),
+        'binary': bool(vectorizer.binary),
+        'norm': vectorizer.norm
+    }
+    return arrays, settings
+
+def flatten_linear_model(model, vectorizer) -> Tuple[Dict[str, np.ndarray], Dict]:
+    """Plain arrays and settings that LinearPredictor needs, from a fitted HashingVectorizer
+    and logistic-loss SGDClassifier; raises ValueError for any other kind of model"""
+    if not hasattr(model, 'coef_') or getattr(model, 'loss', 'log_loss') != 'log_loss':
+        raise ValueError(f"Only logistic linear models can be exported, not {type(model).__name__}")
+    arrays, settings = _hashing_settings(vectorizer)
+    arrays['coef'] = np.asarray(model.coef_, dtype=np.float64)
+    arrays['intercept'] = np.asarray(model.intercept_, dtype=np.float64)
+    settings['classes'] = [str(label) for label in model.classes_]
+    return arrays, settings
+
+class LinearPredictor:
+    """Hashed token counts and one-vs-rest logistic probabilities over flat NumPy arrays"""
+
+    def __init__(self, arrays: Mapping[str, np.ndarray], settings: Dict):
+        self.arrays = arrays
+        self.settings = settings
+        self.classes = settings['classes']
+        self._token_pattern = re.compile(settings['token_pattern'])
+        self._stop_words = frozenset(arrays['stop_words'].tolist())
+
+    def transform(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Hashed features of texts as (rows, columns, values) of the stored entries
+
+        The hashed space is too wide for dense rows, so the sparse entries are
+        returned instead, each (row, column) pair once.
+        """
+        settings = self.settings
+        n_features = settings['n_features']
+        rows, hashes = [], []
+        for row, text in enumerate(texts):
+            tokens = self._token_pattern.findall(text.lower() if settings['lowercase'] else text)
+            found = [murmurhash3_32(token) for token in tokens if token not in self._stop_words]
+            hashes.extend(found)
+            rows.extend([row] * len(found))
+        if not hashes:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0)
+
+        hashes = np.array(hashes, dtype=np.int64)
+        columns = np.abs(hashes) % n_features
+        signs = np.where(hashes < 0, -1.0, 1.0) if settings['alternate_sign'] else np.ones(len(hashes))
+
+        # Sum repeated tokens of a document into one entry, as the sparse matrix does
+        keys, inverse = np.unique(np.array(rows, dtype=np.int64) * n_features + columns, return_inverse=True)
+        values = np.bincount(inverse, weights=signs)
+        rows, columns = keys // n_features, keys % n_features
+
+        if settings['binary']:
+            values = np.ones(len(values))
+        if settings['norm'] in ('l1', 'l2'):
+            magnitudes = np.abs(values) if settings['norm'] == 'l1' else values * values
+            norms = np.bincount(rows, weights=magnitudes, minlength=len(texts))
+            if settings['norm'] == 'l2':
+                norms = np.sqrt(norms)
+            values = values / np.where(norms > 0, norms, 1)[rows]
+        return rows, columns, values
+
+    def predict_proba(self, texts: List[str]) -> np.ndarray:
+        """Class probabilities of texts, in the order of classes"""
+        rows, columns, values = self.transform(texts)
+        coef, intercept = self.arrays['coef'], self.arrays['intercept']
+        decision = np.zeros((len(texts), coef.shape[0]))
+        np.add.at(decision, rows, coef[:, columns].T * values[:, None])
+        decision += intercept
+        probabilities = 1 / (1 + np.exp(-decision))
+        if probabilities.shape[1] == 1:
+            return np.hstack([1 - probabilities, probabilities])
+
+        # One-vs-rest scores normalized over the classes; all-zero rows become uniform
+        totals = probabilities.sum(axis=1)
+        probabilities[totals == 0] = 1
+        return probabilities / probabilities.sum(axis=1, keepdims=True)
+
+    def predict(self, texts: List[str]) -> Tuple[List[str], np.ndarray]:
+        """Most probable class of each text, and the probabilities it came from, in one pass"""
+        probabilities = self.predict_proba(texts)
+        return [self.classes[index] for index in probabilities.argmax(axis=1)], probabilities
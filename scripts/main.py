@@ -1,10 +1,15 @@
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
-import os
-from text_extractor import extract_text_from_file
+from text_extractor import DocumentRejected, check_file_size, extract_text_from_bytes
 from ats_scorer import ATSScorer
 from skills_database import SKILLS_DATABASE
 from field_recommender import get_field_recommendation
-import tempfile
+
+# Runs the field recommendation while the scoring stages render; shared by all sessions
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ats-field")
+
+SCORE_STAGES = ('skills', 'format', 'keywords', 'content')
 
 def main():
     st.set_page_config(
@@ -33,200 +38,247 @@ def main():
     
     # File upload
     uploaded_file = st.file_uploader(
-        "Upload Resume (PDF or DOCX)",
-        type=['pdf', 'docx'],
-        help="Upload your resume in PDF or DOCX format"
+        "Upload Resume (PDF, DOCX, TXT, HTML or RTF)",
+        type=['pdf', 'docx', 'txt', 'html', 'htm', 'rtf'],
+        help="Upload your resume in PDF, DOCX, TXT, HTML or RTF format"
     )
     
     if uploaded_file is not None:
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            tmp_file_path = tmp_file.name
-        
         try:
-            # Extract text from resume
-            with st.spinner("Extracting text from resume..."):
-                resume_text = extract_text_from_file(tmp_file_path)
+            # Streamlit has already buffered the upload; reject oversized files before parsing them
+            check_file_size(uploaded_file.size)
+            cache = get_resume_cache(uploaded_file.getvalue())
+            
+            # Extract text from resume once per uploaded file
+            status = st.empty()
+            if 'text' not in cache:
+                with st.spinner("Extracting text from resume..."):
+                    cache['text'] = extract_text_from_bytes(uploaded_file.getvalue())
+            resume_text = cache['text']
             
             if resume_text:
-                st.success("✅ Resume text extracted successfully!")
-                
-                # Show field recommendation first if enabled
-                if show_field_recommendation:
-                    with st.spinner("Analyzing best field match..."):
-                        field_rec = get_field_recommendation(resume_text)
-                    display_field_recommendation(field_rec, job_field)
-                
-                # Initialize ATS Scorer
+                status.success("✅ Resume text extracted successfully!")
                 scorer = ATSScorer(job_field.lower().replace(" ", "_"))
                 
-                # Calculate ATS Score
-                with st.spinner("Analyzing resume and calculating ATS score..."):
-                    score_results = scorer.calculate_ats_score(resume_text)
+                # Start the field recommendation in the background; the scorer reuses it
+                if (show_field_recommendation or scorer.settings['field_recommendation']) and 'field_future' not in cache:
+                    cache['field_future'] = _EXECUTOR.submit(get_field_recommendation, resume_text)
                 
-                # Display results
-                display_results(score_results, resume_text, job_field)
+                field_slot = st.empty() if show_field_recommendation else None
+                display_results_progressively(scorer, cache, job_field, field_slot)
             else:
-                st.error("❌ Failed to extract text from the resume. Please check the file format.")
+                status.error("❌ Failed to extract text from the resume. Please check the file format.")
+        
+        except DocumentRejected as e:
+            st.error(f"❌ Resume rejected: {str(e)}")
         
         except Exception as e:
             st.error(f"❌ Error processing resume: {str(e)}")
-        
-        finally:
-            # Clean up temporary file
-            if os.path.exists(tmp_file_path):
-                os.unlink(tmp_file_path)
 
-def display_field_recommendation(field_rec: dict, selected_field: str):
-    """Display field recommendation section"""
-    st.header("🎯 Best Field Match Analysis")
-    
-    recommended_field = field_rec['recommended_field_name']
-    confidence = field_rec['confidence']
-    match_score = field_rec['match_score']
+def get_resume_cache(data: bytes) -> dict:
+    """Per-session results of the uploaded file, reset when a different file is uploaded"""
+    key = hashlib.sha1(data).hexdigest()
+    if st.session_state.get('resume_key') != key:
+        st.session_state['resume_key'] = key
+        st.session_state['resume_cache'] = {'stages': {}, 'results': {}}
+    return st.session_state['resume_cache']
+
+def display_results_progressively(scorer: ATSScorer, cache: dict, job_field: str, field_slot=None):
+    """Render each section as soon as its stage is done; finished stages are reused on reruns"""
+    resume_text = cache['text']
+    field_future = cache.get('field_future')
     
-    # Create columns for display
-    col1, col2, col3 = st.columns([2, 1, 1])
+    st.header("📊 ATS Score Analysis")
+    scores_slot = st.empty()
+    st.header("📋 Detailed Analysis")
+    skills_slot = st.empty()
+    format_slot = st.empty()
+    recommendations_slot = st.empty()
     
-    with col1:
-        # Color code based on confidence
-        if confidence == "High":
-            st.success(f"🎉 **Recommended Field:** {recommended_field}")
-        elif confidence == "Medium":
-            st.info(f"👍 **Recommended Field:** {recommended_field}")
-        else:
-            st.warning(f"⚠️ **Recommended Field:** {recommended_field}")
+    # Scoring stages are cached per job field, since skills depend on it
+    stages = cache['stages'].setdefault(job_field, {})
+    if len(stages) < len(SCORE_STAGES):
+        stages.clear()
+        display_scores(scores_slot, stages)
+        for stage, result in scorer.score_stages(resume_text):
+            stages[stage] = result
+            render_stage(stage, stages, scores_slot, skills_slot, format_slot)
+            if field_slot is not None and field_future.done():
+                display_field_recommendation(field_slot, field_future.result(), job_field)
+                field_slot = None
+    else:
+        for stage in SCORE_STAGES:
+            render_stage(stage, stages, scores_slot, skills_slot, format_slot)
     
-    with col2:
-        st.metric("Match Score", f"{match_score:.0f}%")
+    # Recommendations need the field recommendation, so they come last
+    field_rec = None
+    if field_future is not None:
+        with recommendations_slot.container():
+            with st.spinner("Analyzing best field match..."):
+                field_rec = field_future.result()
+        if field_slot is not None:
+            display_field_recommendation(field_slot, field_rec, job_field)
     
-    with col3:
-        st.metric("Confidence", confidence)
+    result_key = (job_field, field_rec is not None)
+    if result_key not in cache['results']:
+        compact = scorer.combine_stages(resume_text, stages, field_rec)
+        cache['results'][result_key] = compact.to_dict(scorer.settings['recommendation_text'])
+    score_results = cache['results'][result_key]
+    display_scores(scores_slot, stages, score_results)
+    display_recommendations(recommendations_slot, score_results)
     
-    # Show comparison with selected field
-    if recommended_field != selected_field:
-        st.info(f"💡 **Note:** You selected '{selected_field}' but your resume shows a stronger match for '{recommended_field}' roles.")
-    else:
-        st.success(f"✅ **Perfect Match:** Your resume aligns well with {selected_field} roles!")
-    
-    # Show all field scores
-    with st.expander("📊 All Field Scores", expanded=False):
-        for field_name, score in field_rec['all_scores'].items():
-            progress_color = "green" if score >= 70 else "orange" if score >= 50 else "red"
-            st.write(f"**{field_name}:** {score:.1f}%")
-            st.progress(score / 100)
-    
-    # Show reasoning
-    if field_rec['reasoning']:
-        with st.expander("🔍 Why This Field?", expanded=True):
-            for reason in field_rec['reasoning']:
-                st.write(f"• {reason}")
+    # Resume Preview
+    with st.expander("📄 Resume Text Preview"):
+        st.text_area("Extracted Text", resume_text[:2000] + "..." if len(resume_text) > 2000 else resume_text, height=300)
 
-def display_results(score_results, resume_text, job_field):
-    # Main ATS Score Display with improved layout
-    st.header("📊 ATS Score Analysis")
+def render_stage(stage: str, stages: dict, scores_slot, skills_slot, format_slot):
+    """Redraw the placeholders that depend on a finished scoring stage"""
+    display_scores(scores_slot, stages)
+    if stage == 'skills':
+        display_skills(skills_slot, stages['skills'][1])
+    elif stage == 'format':
+        display_format(format_slot, stages['format'][1])
+
+def display_field_recommendation(slot, field_rec: dict, selected_field: str):
+    """Display field recommendation section"""
+    with slot.container():
+        st.header("🎯 Best Field Match Analysis")
     
-    # Overall score with better visualization
-    overall_score = score_results['overall_score']
-    
-    # Color code the overall score
-    if overall_score >= 80:
-        score_color = "green"
-        score_emoji = "🎉"
-        score_message = "Excellent ATS Compatibility!"
-    elif overall_score >= 70:
-        score_color = "blue"
-        score_emoji = "👍"
-        score_message = "Good ATS Compatibility"
-    elif overall_score >= 60:
-        score_color = "orange"
-        score_emoji = "⚠️"
-        score_message = "Fair ATS Compatibility"
-    else:
-        score_color = "red"
-        score_emoji = "❌"
-        score_message = "Needs Improvement"
-    
-    # Display main score
-    col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
-    
-    with col1:
-        st.metric(
-            label=f"{score_emoji} Overall ATS Score",
-            value=f"{overall_score}/100",
-            delta=score_message
-        )
-    
-    with col2:
-        st.metric(
-            label="🔧 Skills",
-            value=f"{score_results['skills_score']}/35"
-        )
-    
-    with col3:
-        st.metric(
-            label="📝 Format",
-            value=f"{score_results['format_score']}/25"
-        )
-    
-    with col4:
-        st.metric(
-            label="🎯 Keywords",
-            value=f"{score_results['keyword_score']}/25"
-        )
-    
-    # Progress bar for overall score
-    st.progress(overall_score / 100)
-    
-    # Detailed Analysis
-    st.header("📋 Detailed Analysis")
+        recommended_field = field_rec['recommended_field_name']
+        confidence = field_rec['confidence']
+        match_score = field_rec['match_score']
+    
+        # Create columns for display
+        col1, col2, col3 = st.columns([2, 1, 1])
     
-    # Skills Analysis
-    with st.expander("🔧 Skills Analysis", expanded=True):
-        col1, col2 = st.columns(2)
-        
         with col1:
-            st.subheader("✅ Found Skills")
-            if score_results['found_skills']:
-                for skill in score_results['found_skills']:
-                    st.write(f"• {skill}")
+            # Color code based on confidence
+            if confidence == "High":
+                st.success(f"🎉 **Recommended Field:** {recommended_field}")
+            elif confidence == "Medium":
+                st.info(f"👍 **Recommended Field:** {recommended_field}")
             else:
-                st.write("No relevant skills found")
-        
+                st.warning(f"⚠️ **Recommended Field:** {recommended_field}")
+    
         with col2:
-            st.subheader("💡 Suggested Skills")
-            if score_results['missing_skills']:
-                for skill in score_results['missing_skills'][:8]:  # Show top 8
-                    st.write(f"• {skill}")
-            else:
-                st.write("All key skills found!")
+            st.metric("Match Score", f"{match_score:.0f}%")
     
-    # Format Analysis
-    with st.expander("📄 Format & Structure Analysis"):
-        format_details = score_results['format_details']
+        with col3:
+            st.metric("Confidence", confidence)
+    
+        # Show comparison with selected field
+        if recommended_field != selected_field:
+            st.info(f"💡 **Note:** You selected '{selected_field}' but your resume shows a stronger match for '{recommended_field}' roles.")
+        else:
+            st.success(f"✅ **Perfect Match:** Your resume aligns well with {selected_field} roles!")
+    
+        # Show all field scores
+        with st.expander("📊 All Field Scores", expanded=False):
+            for field_name, score in field_rec['all_scores'].items():
+                progress_color = "green" if score >= 70 else "orange" if score >= 50 else "red"
+                st.write(f"**{field_name}:** {score:.1f}%")
+                st.progress(score / 100)
+    
+        # Show reasoning
+        if field_rec['reasoning']:
+            with st.expander("🔍 Why This Field?", expanded=True):
+                for reason in field_rec['reasoning']:
+                    st.write(f"• {reason}")
+
+def display_scores(slot, stages: dict, score_results: dict = None):
+    """Stage scores as they finish, and the overall score once every stage is done"""
+    with slot.container():
+        # Display main score
+        col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
         
-        col1, col2 = st.columns(2)
         with col1:
-            st.write("**Contact Information:**", "✅" if format_details['has_contact'] else "❌")
-            st.write("**Professional Summary:**", "✅" if format_details['has_summary'] else "❌")
-            st.write("**Work Experience:**", "✅" if format_details['has_experience'] else "❌")
+            if score_results is None:
+                st.metric(label="⏳ Overall ATS Score", value="…", delta="Analyzing resume...", delta_color="off")
+            else:
+                overall_score = score_results['overall_score']
+                
+                # Color code the overall score
+                if overall_score >= 80:
+                    score_emoji = "🎉"
+                    score_message = "Excellent ATS Compatibility!"
+                elif overall_score >= 70:
+                    score_emoji = "👍"
+                    score_message = "Good ATS Compatibility"
+                elif overall_score >= 60:
+                    score_emoji = "⚠️"
+                    score_message = "Fair ATS Compatibility"
+                else:
+                    score_emoji = "❌"
+                    score_message = "Needs Improvement"
+                
+                st.metric(
+                    label=f"{score_emoji} Overall ATS Score",
+                    value=f"{overall_score}/100",
+                    delta=score_message
+                )
         
+        # Same weighting as ATSScorer.combine_stages
         with col2:
-            st.write("**Education Section:**", "✅" if format_details['has_education'] else "❌")
-            st.write("**Skills Section:**", "✅" if format_details['has_skills_section'] else "❌")
-            st.write("**Proper Length:**", "✅" if format_details['proper_length'] else "❌")
-            st.write(f"**Word Count:** {format_details['word_count']} words")
-    
+            value = f"{int(stages['skills'][0] * 0.35)}/35" if 'skills' in stages else "…"
+            st.metric(label="🔧 Skills", value=value)
+        
+        with col3:
+            value = f"{int(stages['format'][0] * 0.25)}/25" if 'format' in stages else "…"
+            st.metric(label="📝 Format", value=value)
+        
+        with col4:
+            value = f"{int(stages['keywords'] * 0.25)}/25" if 'keywords' in stages else "…"
+            st.metric(label="🎯 Keywords", value=value)
+        
+        # Progress bar for overall score
+        if score_results is not None:
+            st.progress(score_results['overall_score'] / 100)
+
+def display_skills(slot, skills_details: dict):
+    # Skills Analysis
+    with slot.container():
+        with st.expander("🔧 Skills Analysis", expanded=True):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.subheader("✅ Found Skills")
+                if skills_details['found']:
+                    for skill in skills_details['found']:
+                        st.write(f"• {skill}")
+                else:
+                    st.write("No relevant skills found")
+            
+            with col2:
+                st.subheader("💡 Suggested Skills")
+                if skills_details['missing']:
+                    for skill in skills_details['missing'][:8]:  # Show top 8
+                        st.write(f"• {skill}")
+                else:
+                    st.write("All key skills found!")
+
+def display_format(slot, format_details: dict):
+    # Format Analysis
+    with slot.container():
+        with st.expander("📄 Format & Structure Analysis"):
+            col1, col2 = st.columns(2)
+            with col1:
+                st.write("**Contact Information:**", "✅" if format_details['has_contact'] else "❌")
+                st.write("**Professional Summary:**", "✅" if format_details['has_summary'] else "❌")
+                st.write("**Work Experience:**", "✅" if format_details['has_experience'] else "❌")
+            
+            with col2:
+                st.write("**Education Section:**", "✅" if format_details['has_education'] else "❌")
+                st.write("**Skills Section:**", "✅" if format_details['has_skills_section'] else "❌")
+                st.write("**Proper Length:**", "✅" if format_details['proper_length'] else "❌")
+                st.write(f"**Word Count:** {format_details['word_count']} words")
+
+def display_recommendations(slot, score_results: dict):
     # Recommendations
-    with st.expander("💡 Recommendations for Improvement", expanded=True):
-        recommendations = score_results['recommendations']
-        for i, rec in enumerate(recommendations, 1):
-            st.write(f"{i}. {rec}")
-    
-    # Resume Preview
-    with st.expander("📄 Resume Text Preview"):
-        st.text_area("Extracted Text", resume_text[:2000] + "..." if len(resume_text) > 2000 else resume_text, height=300)
+    with slot.container():
+        with st.expander("💡 Recommendations for Improvement", expanded=True):
+            recommendations = score_results['recommendations']
+            for i, rec in enumerate(recommendations, 1):
+                st.write(f"{i}. {rec}")
 
 if __name__ == "__main__":
     main()
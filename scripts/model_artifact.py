@@ -0,0 +1,157 @@
+# Versioned model artifacts: a TF-IDF random forest or hashed-feature linear model as memory-mapped arrays
+import hashlib
+import json
+import os
+import re
+import tempfile
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from config import MODEL_ARTIFACT
+from forest_predictor import ForestPredictor, flatten_model
+from linear_predictor import LinearPredictor, flatten_linear_model
+
+FORMAT_VERSION = 1
+MANIFEST_FILE = 'manifest.json'
+LATEST_FILE = 'LATEST'      # Name of the version directory currently served
+
+# Predictor and vectorizer type of each model type
+MODEL_TYPES = {
+    'random_forest': (ForestPredictor, 'tfidf'),
+    'linear': (LinearPredictor, 'hashing')
+}
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _write_atomic(path: str, content: str):
+    """Replace a small text file so readers see either the old or the new content"""
+    handle, temporary = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    with os.fdopen(handle, 'w') as f:
+        f.write(content)
+    os.replace(temporary, path)
+
+def latest_version(root: str) -> Optional[str]:
+    """Name of the version directory currently served from root, if any"""
+    try:
+        with open(os.path.join(root, LATEST_FILE)) as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+def _next_version(root: str) -> str:
+    numbers = [int(name[1:]) for name in os.listdir(root) if re.fullmatch(r'v\d+', name)]
+    return f"v{max(numbers, default=0) + 1:04d}"
+
+def _flatten(model, vectorizer) -> Tuple[str, Dict[str, np.ndarray], Dict]:
+    """Model type, arrays and settings of a fitted model and its vectorizer"""
+    if hasattr(model, 'estimators_'):
+        return ('random_forest', *flatten_model(model, vectorizer))
+    if hasattr(model, 'coef_'):
+        return ('linear', *flatten_linear_model(model, vectorizer))
+    raise ValueError(f"Only random forest and linear models can be exported, not {type(model).__name__}")
+
+def export_artifact(model, vectorizer, root: str = MODEL_ARTIFACT['directory'],
+                    metadata: Optional[Dict] = None) -> str:
+    """Write a fitted model and vectorizer as a new artifact version: a TF-IDF
+    random forest, or a hashing vectorizer with a logistic SGD classifier
+    
+    The version is written to a temporary directory and renamed into place,
+    then LATEST is switched to it, so the previous version stays servable
+    until the new one is complete. Returns the new version directory.
+    """
+    model_type, arrays, settings = _flatten(model, vectorizer)
+    os.makedirs(root, exist_ok=True)
+    staging = tempfile.mkdtemp(dir=root, prefix='.tmp-')
+
+    files = {}
+    for name, array in arrays.items():
+        path = os.path.join(staging, f'{name}.npy')
+        np.save(path, array, allow_pickle=False)
+        files[name] = {'sha256': _sha256(path), 'shape': list(array.shape), 'dtype': array.dtype.str}
+
+    version = _next_version(root)
+    manifest = {
+        'format_version': FORMAT_VERSION,
+        'version': version,
+        'created': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'model_type': model_type,
+        'classes': settings.pop('classes'),
+        'vectorizer': {'type': MODEL_TYPES[model_type][1], **settings},
+        'metadata': metadata or {},
+        'files': files
+    }
+    with open(os.path.join(staging, MANIFEST_FILE), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    directory = os.path.join(root, version)
+    os.rename(staging, directory)
+    _write_atomic(os.path.join(root, LATEST_FILE), version)
+    return directory
+
+def retire_latest(root: str = MODEL_ARTIFACT['directory']):
+    """Stop serving any artifact from root; version directories are kept"""
+    try:
+        os.remove(os.path.join(root, LATEST_FILE))
+    except FileNotFoundError:
+        pass
+
+class ModelArtifact:
+    """An exported model: the manifest is read at construction, the arrays on first use"""
+
+    def __init__(self, directory: str, verify: Optional[bool] = None):
+        self.directory = directory
+        self.verify = MODEL_ARTIFACT['verify_checksums'] if verify is None else verify
+        with open(os.path.join(directory, MANIFEST_FILE)) as f:
+            self.manifest = json.load(f)
+        if self.manifest.get('format_version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported model artifact format: {self.manifest.get('format_version')}")
+        if self.manifest.get('model_type') not in MODEL_TYPES:
+            raise ValueError(f"Unsupported model type in artifact: {self.manifest.get('model_type')}")
+        self.version = self.manifest['version']
+        self.model_type = self.manifest['model_type']
+        self.classes = self.manifest['classes']
+        self.metadata = self.manifest['metadata']
+        self._predictor = None
+
+    @classmethod
+    def latest(cls, root: str = MODEL_ARTIFACT['directory']) -> Optional['ModelArtifact']:
+        """The artifact currently served from root, or None when nothing has been exported"""
+        version = latest_version(root)
+        return cls(os.path.join(root, version)) if version else None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._predictor is not None
+
+    @property
+    def predictor(self) -> Union[ForestPredictor, LinearPredictor]:
+        """Predictor over read-only memory maps of every array, checked against the manifest on first access"""
+        if self._predictor is None:
+            arrays = {}
+            for name, info in self.manifest['files'].items():
+                path = os.path.join(self.directory, f'{name}.npy')
+                if self.verify and _sha256(path) != info['sha256']:
+                    raise ValueError(f"Checksum mismatch in model artifact {self.version}: {name}.npy")
+                arrays[name] = np.load(path, mmap_mode='r', allow_pickle=False)
+            predictor = MODEL_TYPES[self.model_type][0]
+            self._predictor = predictor(arrays, {**self.manifest['vectorizer'], 'classes': self.classes})
+        return self._predictor
+
+    @property
+    def arrays(self) -> Dict[str, np.ndarray]:
+        return self.predictor.arrays
+
+    def predict_proba(self, texts: List[str]) -> np.ndarray:
+        """Class probabilities of texts, in the order of classes"""
+        return self.predictor.predict_proba(texts)
+
+    def predict(self, texts: List[str]) -> Tuple[List[str], np.ndarray]:
+        """Most probable class of each text and the class probabilities, in one pass"""
+        return self.predictor.predict(texts)
@@ -0,0 +1,171 @@
+# Cross-validated, parallel training of the ATSSystem forest on cached TF-IDF features
+import hashlib
+import json
+import os
+import pickle
+import time
+from itertools import product
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from joblib import Parallel, delayed
+from scipy import sparse
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.model_selection import KFold, StratifiedKFold
+
+from config import TRAINING_SETTINGS
+
+def dataset_hash(csv_filename: str, vectorizer: TfidfVectorizer) -> str:
+    """SHA-256 of the CSV bytes and the vectorizer parameters"""
+    digest = hashlib.sha256(repr(sorted(vectorizer.get_params().items())).encode('utf-8'))
+    with open(csv_filename, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def load_features(system, csv_filename: str, cache_dir: str) -> Optional[Tuple[TfidfVectorizer, sparse.csr_matrix, np.ndarray, bool]]:
+    """Fitted vectorizer, feature matrix and labels of a CSV, from the cache when present
+    
+    Returns None when the CSV cannot be used for training; the last item is
+    True on a cache hit.
+    """
+    vectorizer = TfidfVectorizer(max_features=TRAINING_SETTINGS['max_features'], stop_words='english')
+    key = dataset_hash(csv_filename, vectorizer)
+    vectorizer_path = os.path.join(cache_dir, f'{key}.vectorizer.pkl')
+    features_path = os.path.join(cache_dir, f'{key}.features.npz')
+    labels_path = os.path.join(cache_dir, f'{key}.labels.npy')
+
+    if all(os.path.exists(path) for path in (vectorizer_path, features_path, labels_path)):
+        print(f"⚡ Using cached features for dataset {key[:12]}")
+        with open(vectorizer_path, 'rb') as f:
+            vectorizer = pickle.load(f)
+        return vectorizer, sparse.load_npz(features_path), np.load(labels_path), True
+
+    df = system.load_training_data(csv_filename)
+    if df is None:
+        return None
+
+    print("🔤 Converting text to features...")
+    X = vectorizer.fit_transform(df['cleaned_text'])
+    y = df['category'].to_numpy(dtype=str)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(vectorizer_path, 'wb') as f:
+        pickle.dump(vectorizer, f)
+    sparse.save_npz(features_path, X)
+    np.save(labels_path, y)
+    return vectorizer, X, y, False
+
+def parameter_candidates(param_grid: Dict[str, List]) -> List[Dict]:
+    """Every combination of the grid's values"""
+    names = list(param_grid)
+    return [dict(zip(names, values)) for values in product(*(param_grid[name] for name in names))]
+
+def _evaluate_fold(params: Dict, fold: int, X: sparse.csr_matrix, y: np.ndarray,
+                   train_index: np.ndarray, test_index: np.ndarray) -> Dict:
+    """Fit one candidate on one fold's training rows and score it on the rest; runs in a worker"""
+    start = time.perf_counter()
+    model = RandomForestClassifier(random_state=42, n_jobs=1, **params)
+    model.fit(X[train_index], y[train_index])
+    fitted = time.perf_counter()
+    accuracy = float((model.predict(X[test_index]) == y[test_index]).mean())
+    return {
+        'params': params,
+        'fold': fold,
+        'train_rows': len(train_index),
+        'test_rows': len(test_index),
+        'fit_seconds': round(fitted - start, 4),
+        'predict_seconds': round(time.perf_counter() - fitted, 4),
+        'accuracy': accuracy
+    }
+
+def cross_validate(X: sparse.csr_matrix, y: np.ndarray, param_grid: Dict[str, List],
+                   folds: int, n_jobs: int) -> List[Dict]:
+    """Score every parameter combination on every fold, spread over worker processes"""
+    _, counts = np.unique(y, return_counts=True)
+    if counts.min() >= folds:
+        splits = list(StratifiedKFold(n_splits=folds, shuffle=True, random_state=42).split(X, y))
+    else:
+        # Too few resumes in some category to stratify
+        splits = list(KFold(n_splits=folds, shuffle=True, random_state=42).split(X))
+
+    # X and y go to every job; joblib memory-maps their large arrays instead of copying them
+    return Parallel(n_jobs=n_jobs, backend='loky')(
+        delayed(_evaluate_fold)(params, fold, X, y, train_index, test_index)
+        for params in parameter_candidates(param_grid)
+        for fold, (train_index, test_index) in enumerate(splits)
+    )
+
+def summarize(fold_results: List[Dict]) -> List[Dict]:
+    """Mean accuracy and timing per parameter combination, best first"""
+    by_params = {}
+    for result in fold_results:
+        by_params.setdefault(json.dumps(result['params'], sort_keys=True), []).append(result)
+    summary = [{
+        'params': results[0]['params'],
+        'mean_accuracy': float(np.mean([result['accuracy'] for result in results])),
+        'std_accuracy': float(np.std([result['accuracy'] for result in results])),
+        'mean_fit_seconds': float(np.mean([result['fit_seconds'] for result in results]))
+    } for results in by_params.values()]
+    summary.sort(key=lambda candidate: -candidate['mean_accuracy'])
+    return summary
+
+def train_with_cross_validation(system, csv_filename: str, folds: Optional[int] = None,
+                                param_grid: Optional[Dict[str, List]] = None, n_jobs: Optional[int] = None,
+                                cache_dir: Optional[str] = None, report_file: Optional[str] = None) -> Optional[Dict]:
+    """Search the grid with k-fold cross-validation, then refit the best forest on all rows
+    
+    The best model is saved through system.save_model and a per-fold timing
+    and accuracy report is written to report_file. Returns the report, or
+    None when the CSV cannot be used for training.
+    """
+    settings = TRAINING_SETTINGS
+    folds = folds or settings['folds']
+    param_grid = param_grid or settings['param_grid']
+    n_jobs = n_jobs or settings['n_jobs']
+    cache_dir = cache_dir or settings['cache_dir']
+    report_file = report_file or settings['report_file']
+
+    start = time.perf_counter()
+    features = load_features(system, csv_filename, cache_dir)
+    if features is None:
+        return None
+    vectorizer, X, y, cache_hit = features
+    feature_seconds = time.perf_counter() - start
+
+    candidates = len(parameter_candidates(param_grid))
+    print(f"📊 Cross-validating {candidates} parameter sets x {folds} folds (n_jobs={n_jobs})...")
+    start = time.perf_counter()
+    fold_results = cross_validate(X, y, param_grid, folds, n_jobs)
+    search_seconds = time.perf_counter() - start
+    summary = summarize(fold_results)
+    best = summary[0]
+    print(f"✅ Best parameters: {best['params']} "
+          f"(accuracy {best['mean_accuracy']:.2%} ± {best['std_accuracy']:.2%})")
+
+    print("🤖 Training final model on all resumes...")
+    start = time.perf_counter()
+    model = RandomForestClassifier(random_state=42, n_jobs=n_jobs, **best['params'])
+    model.fit(X, y)
+    refit_seconds = time.perf_counter() - start
+    system.save_model(model, vectorizer, best['mean_accuracy'])
+
+    report = {
+        'dataset': os.path.abspath(csv_filename),
+        'rows': X.shape[0],
+        'features': X.shape[1],
+        'feature_cache': 'hit' if cache_hit else 'miss',
+        'feature_seconds': round(feature_seconds, 4),
+        'folds': folds,
+        'n_jobs': n_jobs,
+        'search_seconds': round(search_seconds, 4),
+        'refit_seconds': round(refit_seconds, 4),
+        'best_params': best['params'],
+        'candidates': summary,
+        'fold_results': fold_results
+    }
+    with open(report_file, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"📝 Training report written to: {report_file}")
+    return report
@@ -0,0 +1,290 @@
+import re
+import struct
+import sys
+from array import array
+from datetime import date
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from experience_timeline import merge_intervals, parse_date_range
+from skills_database import ALL_SKILLS, SKILL_IDS
+from text_extractor import segment_sections
+
+# Skill names as whole tokens: 'R' matches "R, SQL" but not every letter r
+_SKILL_PATTERN = re.compile(
+    r'(?<![\w+#.])(' + '|'.join(re.escape(skill.lower()) for skill in sorted(ALL_SKILLS, key=len, reverse=True)) +
+    r')(?![\w+#])'
+)
+_SKILL_LOOKUP = {skill.lower(): SKILL_IDS[skill] for skill in ALL_SKILLS}
+
+_DEGREE_PATTERN = re.compile(
+    r'\b(?:bachelor|master|doctor|ph\.?d|mba|b\.?s\.?c?|m\.?s\.?c?|b\.?a|m\.?a|b\.?tech|m\.?tech|'
+    r'b\.?eng|m\.?eng|associate|diploma|degree)\b',
+    re.IGNORECASE
+)
+_INSTITUTION_PATTERN = re.compile(r'\b(?:university|college|institute|school|academy|polytechnic)\b', re.IGNORECASE)
+_YEAR_PATTERN = re.compile(r'\b(?:19|20)\d\d\b')
+
+# Separators between title and employer on a role line
+_ROLE_SPLIT = re.compile(r'\s*(?:\||\s@\s|\sat\s|\s[-–—]\s|,)\s*')
+_FIELD_TRIM = ' |-,()•\t'
+
+def match_skill_ids(text: str) -> array:
+    """Return the sorted IDs of every database skill mentioned in text"""
+    found = {_SKILL_LOOKUP[match.group(1)] for match in _SKILL_PATTERN.finditer(text.lower())}
+    return array('H', sorted(found))
+
+class RoleRecord:
+    """One position from the experience section"""
+    __slots__ = ('title', 'employer', 'start', 'end', 'skill_ids')
+
+    def __init__(self, title: str, employer: str, start: int, end: int, skill_ids: array):
+        self.title = title
+        self.employer = employer
+        self.start = start          # Month index (year * 12 + month - 1), inclusive
+        self.end = end              # Month index, exclusive
+        self.skill_ids = skill_ids  # array('H') of skills_database.SKILL_IDS
+
+    @property
+    def months(self) -> int:
+        return self.end - self.start
+
+    @property
+    def skills(self) -> List[str]:
+        return [ALL_SKILLS[skill_id] for skill_id in self.skill_ids]
+
+    def __repr__(self):
+        return f"RoleRecord({self.title!r}, {self.employer!r}, {self.start}, {self.end}, {self.skills!r})"
+
+class EducationRecord:
+    """One degree from the education section"""
+    __slots__ = ('degree', 'institution', 'start', 'end')
+
+    def __init__(self, degree: str, institution: str, start: int, end: int):
+        self.degree = degree
+        self.institution = institution
+        self.start = start          # Month index, 0 when unknown
+        self.end = end              # Month index, 0 when unknown
+
+    def __repr__(self):
+        return f"EducationRecord({self.degree!r}, {self.institution!r}, {self.start}, {self.end})"
+
+class ParsedResume:
+    """Structured view of one resume"""
+    __slots__ = ('roles', 'education', 'skill_ids', 'total_months')
+
+    def __init__(self, roles: Tuple[RoleRecord, ...], education: Tuple[EducationRecord, ...],
+                 skill_ids: array, total_months: int):
+        self.roles = roles
+        self.education = education
+        self.skill_ids = skill_ids
+        self.total_months = total_months
+
+    @property
+    def skills(self) -> List[str]:
+        return [ALL_SKILLS[skill_id] for skill_id in self.skill_ids]
+
+    def __repr__(self):
+        return f"ParsedResume(roles={list(self.roles)!r}, education={list(self.education)!r}, " \
+               f"skills={self.skills!r}, total_months={self.total_months})"
+
+def _split_role_line(line: str) -> Tuple[str, str]:
+    """Split 'Title | Employer' style text into title and employer"""
+    parts = [part.strip(_FIELD_TRIM) for part in _ROLE_SPLIT.split(line)]
+    parts = [part for part in parts if part]
+    if not parts:
+        return '', ''
+    return sys.intern(parts[0]), sys.intern(parts[1]) if len(parts) > 1 else ''
+
+def _parse_roles(text: str, today: Optional[date]) -> List[RoleRecord]:
+    """Role headers are lines with a date range; the lines below them are the role's content"""
+    lines = text.split('\n')
+    headers = []
+    for index, line in enumerate(lines):
+        date_range = parse_date_range(line, today)
+        if date_range is None:
+            continue
+        start, end, match_start, match_end = date_range
+        role_text = (line[:match_start] + ' ' + line[match_end:]).strip(_FIELD_TRIM)
+        if not role_text and index > 0:
+            # Dates on their own line: the title is on the line above
+            role_text = lines[index - 1].strip(_FIELD_TRIM)
+        headers.append((index, role_text, start, end))
+
+    roles = []
+    for position, (index, role_text, start, end) in enumerate(headers):
+        block_end = headers[position + 1][0] if position + 1 < len(headers) else len(lines)
+        title, employer = _split_role_line(role_text)
+        skill_ids = match_skill_ids('\n'.join(lines[index:block_end]))
+        roles.append(RoleRecord(title, employer, start, end, skill_ids))
+    return roles
+
+def _parse_education(text: str, today: Optional[date]) -> List[EducationRecord]:
+    """Degree lines, with the institution and dates from the same or the next line"""
+    lines = [line.strip(_FIELD_TRIM) for line in text.split('\n')]
+    entries = []
+    for index, line in enumerate(lines):
+        if not _DEGREE_PATTERN.search(line) or _INSTITUTION_PATTERN.match(line):
+            continue
+        following = lines[index + 1] if index + 1 < len(lines) else ''
+        context = line + ' | ' + following
+
+        parts = [part for part in (part.strip(_FIELD_TRIM) for part in re.split(r'\s*[|,]\s*', context)) if part]
+        degree = parts[0] if parts else line
+        institution = next((part for part in parts if _INSTITUTION_PATTERN.search(part)), '')
+
+        start = end = 0
+        date_range = parse_date_range(context, today)
+        if date_range is not None:
+            start, end = date_range[0], date_range[1]
+        else:
+            years = _YEAR_PATTERN.findall(context)
+            if years:
+                end = int(years[-1]) * 12
+        entries.append(EducationRecord(sys.intern(degree), sys.intern(institution), start, end))
+    return entries
+
+def parse_resume(text: str, today: Optional[date] = None) -> ParsedResume:
+    """Parse resume text into role, education and skill records"""
+    spans = segment_sections(text)
+    experience = text[slice(*spans['experience'])] if 'experience' in spans else ''
+    education = text[slice(*spans['education'])] if 'education' in spans else ''
+
+    roles = _parse_roles(experience, today)
+    total_months = sum(end - start for start, end in merge_intervals((role.start, role.end) for role in roles))
+    return ParsedResume(
+        tuple(roles),
+        tuple(_parse_education(education, today)),
+        match_skill_ids(text),
+        total_months
+    )
+
+class ResumeStore:
+    """Column-oriented store of parsed resumes
+
+    Every field lives in a typed array and strings are interned once in a
+    shared table, so a large corpus costs a few dozen bytes per role instead
+    of a dict per record. Queries run over the columns with NumPy.
+    """
+
+    _MAGIC = b'ATSR'
+    _VERSION = 1
+    # Column name -> array typecode, in serialization order
+    _COLUMNS = (
+        ('total_months', 'H'), ('role_offsets', 'I'), ('education_offsets', 'I'), ('skill_offsets', 'I'),
+        ('skill_ids', 'H'),
+        ('role_title', 'I'), ('role_employer', 'I'), ('role_start', 'H'), ('role_end', 'H'),
+        ('role_skill_offsets', 'I'), ('role_skill_ids', 'H'),
+        ('education_degree', 'I'), ('education_institution', 'I'), ('education_start', 'H'), ('education_end', 'H'),
+    )
+
+    def __init__(self):
+        for name, typecode in self._COLUMNS:
+            setattr(self, name, array(typecode))
+        for name in ('role_offsets', 'education_offsets', 'skill_offsets', 'role_skill_offsets'):
+            getattr(self, name).append(0)
+        self.strings = ['']
+        self._string_ids = {'': 0}
+
+    def __len__(self) -> int:
+        return len(self.total_months)
+
+    def _string_id(self, value: str) -> int:
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = self._string_ids[value] = len(self.strings)
+            self.strings.append(value)
+        return string_id
+
+    def append(self, resume: ParsedResume) -> int:
+        """Add a parsed resume and return its index"""
+        for role in resume.roles:
+            self.role_title.append(self._string_id(role.title))
+            self.role_employer.append(self._string_id(role.employer))
+            self.role_start.append(role.start)
+            self.role_end.append(role.end)
+            self.role_skill_ids.extend(role.skill_ids)
+            self.role_skill_offsets.append(len(self.role_skill_ids))
+        for entry in resume.education:
+            self.education_degree.append(self._string_id(entry.degree))
+            self.education_institution.append(self._string_id(entry.institution))
+            self.education_start.append(entry.start)
+            self.education_end.append(entry.end)
+        self.skill_ids.extend(resume.skill_ids)
+
+        self.total_months.append(min(resume.total_months, 0xFFFF))
+        self.role_offsets.append(len(self.role_title))
+        self.education_offsets.append(len(self.education_degree))
+        self.skill_offsets.append(len(self.skill_ids))
+        return len(self) - 1
+
+    def extend(self, resumes: Iterable[ParsedResume]) -> None:
+        for resume in resumes:
+            self.append(resume)
+
+    def __getitem__(self, index: int) -> ParsedResume:
+        """Materialize one resume back into records"""
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        roles = []
+        for role in range(self.role_offsets[index], self.role_offsets[index + 1]):
+            skills = self.role_skill_ids[self.role_skill_offsets[role]:self.role_skill_offsets[role + 1]]
+            roles.append(RoleRecord(self.strings[self.role_title[role]], self.strings[self.role_employer[role]],
+                                    self.role_start[role], self.role_end[role], skills))
+        education = tuple(
+            EducationRecord(self.strings[self.education_degree[entry]],
+                            self.strings[self.education_institution[entry]],
+                            self.education_start[entry], self.education_end[entry])
+            for entry in range(self.education_offsets[index], self.education_offsets[index + 1])
+        )
+        skill_ids = self.skill_ids[self.skill_offsets[index]:self.skill_offsets[index + 1]]
+        return ParsedResume(tuple(roles), education, skill_ids, self.total_months[index])
+
+    def filter(self, min_months: int = 0, skills: Iterable[str] = ()) -> np.ndarray:
+        """Indexes of resumes with at least min_months of experience and every listed skill
+        
+        Skill names match case-insensitively; a skill not in the database matches no resume.
+        """
+        mask = np.frombuffer(self.total_months, dtype=np.uint16) >= min_months
+        skills = [skill.lower() for skill in skills]
+        if any(skill not in _SKILL_LOOKUP for skill in skills) or (skills and not len(self.skill_ids)):
+            mask[:] = False
+        elif skills:
+            resume_skills = np.frombuffer(self.skill_ids, dtype=np.uint16)
+            offsets = np.frombuffer(self.skill_offsets, dtype=np.uint32)
+            for skill in skills:
+                positions = np.flatnonzero(resume_skills == _SKILL_LOOKUP[skill])
+                has_skill = np.zeros(len(self), dtype=bool)
+                has_skill[np.searchsorted(offsets, positions, side='right') - 1] = True
+                mask &= has_skill
+        return np.flatnonzero(mask)
+
+    def to_bytes(self) -> bytes:
+        """Serialize the store as a header, the string table and the raw columns (native byte order)"""
+        strings = '\0'.join(self.strings).encode('utf-8')
+        columns = [getattr(self, name) for name, _ in self._COLUMNS]
+        header = struct.pack(f'<4sHI{len(columns)}I', self._MAGIC, self._VERSION, len(strings),
+                             *(len(column) for column in columns))
+        return header + strings + b''.join(column.tobytes() for column in columns)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'ResumeStore':
+        """Load a store written by to_bytes"""
+        header = struct.Struct(f'<4sHI{len(cls._COLUMNS)}I')
+        magic, version, strings_size, *lengths = header.unpack_from(data)
+        if magic != cls._MAGIC or version != cls._VERSION:
+            raise ValueError("Not a resume store or unsupported version")
+
+        store = cls()
+        offset = header.size
+        store.strings = data[offset:offset + strings_size].decode('utf-8').split('\0')
+        store._string_ids = {value: string_id for string_id, value in enumerate(store.strings)}
+        offset += strings_size
+        for (name, typecode), length in zip(cls._COLUMNS, lengths):
+            column = array(typecode)
+            size = length * column.itemsize
+            column.frombytes(data[offset:offset + size])
+            setattr(store, name, column)
+            offset += size
+        return store
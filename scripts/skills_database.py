@@ -66,6 +66,14 @@ INDUSTRY_KEYWORDS = {
     ]
 }
 
+# Every skill in the database, interned to a stable integer ID
+ALL_SKILLS = sorted({
+    skill
+    for field_data in SKILLS_DATABASE.values()
+    for skill in field_data['required'] + field_data['preferred']
+}, key=str.lower)
+SKILL_IDS = {skill: skill_id for skill_id, skill in enumerate(ALL_SKILLS)}
+
 def get_skills_for_field(field: str) -> dict:
     """Get skills for a specific field"""
     return SKILLS_DATABASE.get(field, {})
@@ -0,0 +1,58 @@
+# Test the scriptable ATS command line
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+
+from ats_cli import EXIT_FAILED, EXIT_NO_MODEL, EXIT_OK, EXIT_USAGE, main
+from test_ats_system import make_training_csv
+
+def run(*argv, stdin: str = ""):
+    """Exit code and parsed JSON lines of one CLI invocation"""
+    output = io.StringIO()
+    original_stdin = sys.stdin
+    sys.stdin = io.StringIO(stdin)
+    try:
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(io.StringIO()):
+            code = main(list(argv))
+    finally:
+        sys.stdin = original_stdin
+    return code, [json.loads(line) for line in output.getvalue().splitlines()]
+
+def test_cli():
+    """train, score (files, directories, stdin) and info emit JSON lines with meaningful exit codes"""
+    with tempfile.TemporaryDirectory() as directory:
+        model = ['--model-file', os.path.join(directory, 'model.pkl'), '--model-dir', os.path.join(directory, 'model')]
+        resumes = os.path.join(directory, 'resumes')
+        os.makedirs(resumes)
+        for name, text in (('analyst.txt', "Built tableau dashboards and sql reporting with pandas"),
+                           ('engineer.txt', "Designed java microservices with docker and kubernetes"),
+                           ('notes.md', "not a resume file")):
+            with open(os.path.join(resumes, name), 'w') as f:
+                f.write(text)
+
+        code, records = run(*model, 'score', resumes)
+        assert code == EXIT_NO_MODEL and records == []
+
+        csv_path = os.path.join(directory, 'training.csv')
+        make_training_csv(csv_path, rows=150)
+        code, records = run(*model, 'train', csv_path)
+        assert code == EXIT_OK and records[0]['trained'] and records[0]['artifact']
+
+        code, records = run(*model, 'score', resumes, '-', '--workers', '2', stdin="Ran client workshops on strategy")
+        assert code == EXIT_OK
+        assert [(os.path.basename(record['source']), record['predicted_category']) for record in records] == [
+            ('-', 'consultant'), ('analyst.txt', 'data_analyst'), ('engineer.txt', 'software_engineering')]
+
+        code, records = run(*model, 'score', '-', stdin="   ")
+        assert code == EXIT_FAILED and 'error' in records[0]
+        assert run(*model, 'score', os.path.join(directory, 'missing.pdf'))[0] == EXIT_USAGE
+
+        code, records = run(*model, 'info')
+        assert code == EXIT_OK and records[0]['trained'] and records[0]['categories']
+
+if __name__ == "__main__":
+    test_cli()
+    print("✅ CLI tests passed!")
@@ -0,0 +1,157 @@
+# Test training and scoring of the ML-based ATSSystem
+import os
+import random
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from ats_system_fixed import ATSSystem
+
+FIELD_WORDS = {
+    'Software_Engineer_Score': "python java react docker kubernetes microservices api backend git",
+    'Data_Analyst_Score': "sql tableau excel statistics dashboards pandas regression reporting",
+    'Consultant_Score': "strategy stakeholders clients workshops roadmap presentations business"
+}
+
+def make_training_csv(path: str, rows: int = 300, seed: int = 0):
+    """Write a labeled resume CSV where each row's best score matches its vocabulary"""
+    shuffle = random.Random(seed)
+    records = []
+    for number in range(rows):
+        best = list(FIELD_WORDS)[number % len(FIELD_WORDS)]
+        words = FIELD_WORDS[best].split()
+        text = "Experienced professional. " + " ".join(shuffle.choice(words) for _ in range(30))
+        scores = {column: shuffle.randint(20, 60) for column in FIELD_WORDS}
+        scores[best] = shuffle.randint(70, 95)
+        records.append({'Resume_Text': text, **scores})
+    pd.DataFrame(records).to_csv(path, index=False)
+
+def make_system(directory: str) -> ATSSystem:
+    return ATSSystem(os.path.join(directory, 'ats_model.pkl'), os.path.join(directory, 'ats_model'))
+
+def test_streaming_training():
+    """Chunked training learns the fields and saves a model that loads back"""
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'resumes.csv')
+        make_training_csv(csv_path)
+
+        system = make_system(directory)
+        assert system.train_model_streaming(csv_path, chunk_size=50)
+        assert system.accuracy > 0.9
+        assert sorted(system.categories) == ['consultant', 'data_analyst', 'software_engineering']
+
+        results = system.calculate_ats_score("Built tableau dashboards and sql reporting with pandas")
+        assert results['predicted_category'] == 'data_analyst'
+
+        reloaded = make_system(directory)
+        assert reloaded.is_trained and reloaded.categories == system.categories
+
+def test_update_model():
+    """New rows update a copy of the streamed model into a new artifact while the old one keeps serving"""
+    with tempfile.TemporaryDirectory() as directory:
+        history_path, new_path = os.path.join(directory, 'history.csv'), os.path.join(directory, 'new.csv')
+        make_training_csv(history_path, rows=150)
+        make_training_csv(new_path, rows=60, seed=1)
+        assert make_system(directory).train_model_streaming(history_path, chunk_size=50)
+
+        serving = make_system(directory)
+        before = serving.artifact
+        expected = serving.calculate_ats_score("Built tableau dashboards and sql reporting with pandas")
+
+        updater = make_system(directory)
+        assert updater.model is None
+        assert updater.update_model(new_path, chunk_size=20)
+        assert updater.artifact.version == 'v0002' and before.version == 'v0001'
+        assert updater.artifact.metadata['updated_from'] == 'v0001'
+        assert updater.artifact.metadata['update_rows'] == 60
+        assert updater.accuracy > 0.9
+
+        # The process serving the old version is unaffected; new loads get the update
+        assert serving.calculate_ats_score("Built tableau dashboards and sql reporting with pandas") == expected
+        reloaded = make_system(directory)
+        assert reloaded.artifact.version == 'v0002'
+        assert np.allclose(reloaded.artifact.predict_proba(["Designed java microservices with docker"]),
+                           updater.model.predict_proba(updater.vectorizer.transform(["designed java microservices with docker"])))
+
+        # A forest cannot be updated incrementally
+        assert updater.train_model_from_csv(history_path)
+        assert not updater.update_model(new_path)
+        assert updater.artifact.version == 'v0003'
+
+def test_streaming_training_rejects_bad_csv():
+    """A CSV without a text column is rejected before any chunk is read"""
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'bad.csv')
+        pd.DataFrame({'Body': ['x'], 'Data_Analyst_Score': [1], 'Consultant_Score': [2]}).to_csv(csv_path, index=False)
+        assert not make_system(directory).train_model_streaming(csv_path)
+
+def test_streaming_epochs_count_distinct_rows():
+    """Extra epochs do not count the same rows again towards the 10-resume minimum"""
+    from config import STREAMING_TRAINING
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'resumes.csv')
+        make_training_csv(csv_path, rows=6)
+        epochs = STREAMING_TRAINING['epochs']
+        STREAMING_TRAINING['epochs'] = 3
+        try:
+            assert not make_system(directory).train_model_streaming(csv_path)
+        finally:
+            STREAMING_TRAINING['epochs'] = epochs
+
+def test_vectorized_preprocessing_matches_rowwise():
+    """Column-wise cleaning and labels match the row-wise reference, including NaN and ties"""
+    system = ATSSystem()
+    texts = pd.Series(["Senior  Engineer, C++ & Python!", np.nan, "", None, 0, "Café\tnaïve résumé\n", "  MIXED\r\nCase  ",
+                       "\u212aelvin \u0130stanbul\u00a0x\x1cy", 3.5], dtype=object)
+    assert system.clean_text_series(texts).tolist() == [system.clean_text(text) for text in texts]
+
+    scores = pd.DataFrame({
+        'Software_Engineer_Score': [90, np.nan, 50, 50, 'n/a', 10],
+        'Data_Analyst_Score': [80, 70, 50, np.nan, 60, 10],
+        'Consultant_Score': [10, 95, 60, 40, 60, np.nan]
+    })
+    vectorized = system.create_labels_from_scores(scores.copy(), verbose=False)['category']
+    rowwise = system.create_labels_from_scores_rowwise(scores.copy(), verbose=False)['category']
+    assert vectorized.tolist() == rowwise.tolist()
+    assert vectorized.tolist()[:3] == ['software_engineering', 'software_engineering', 'consultant']
+
+def test_predict_batch():
+    """Chunked batch results match one-at-a-time scoring, from a list or a CSV, on both model paths;
+    a bare string is refused"""
+    texts = ["Built tableau dashboards and sql reporting with pandas", "", "Designed java microservices with docker",
+             None, "Ran client workshops on strategy"] * 3
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'resumes.csv')
+        make_training_csv(csv_path, rows=150)
+        system = make_system(directory)
+        assert system.train_model_from_csv(csv_path)
+
+        scores_path = os.path.join(directory, 'to_score.csv')
+        pd.DataFrame({'Resume_Text': texts}).to_csv(scores_path, index=False)
+        for artifact in (system.artifact, None):
+            system.artifact = artifact
+            expected = []
+            for row, text in enumerate(texts):
+                results = system.calculate_ats_score(text or "")
+                expected.append({'row': row, **results} if results else {'row': row, 'error': 'No valid text found in resume'})
+
+            assert list(system.predict_batch(texts, chunk_size=4)) == expected
+            assert list(system.predict_batch(iter(texts), chunk_size=100)) == expected
+            assert list(system.predict_batch(csv_path=scores_path, chunk_size=2)) == expected
+
+        # A single string is neither a list of texts nor taken as a CSV path
+        try:
+            list(system.predict_batch("Built tableau dashboards"))
+            assert False, "a bare string was scored"
+        except ValueError as e:
+            assert 'csv_path' in str(e)
+
+if __name__ == "__main__":
+    test_streaming_training()
+    test_update_model()
+    test_streaming_training_rejects_bad_csv()
+    test_streaming_epochs_count_distinct_rows()
+    test_vectorized_preprocessing_matches_rowwise()
+    test_predict_batch()
+    print("✅ ATS system tests passed!")
@@ -0,0 +1,54 @@
+# Test the validation gate and the bulk scoring pipeline
+from batch_pipeline import BatchScoringPipeline
+from utils import RejectionReason, screen_resume_text, validate_resume_text
+
+RESUME = """Jane Smith
+jane@email.com | (555) 987-6543
+SUMMARY
+Data analyst with experience in statistical analysis and business intelligence for retail clients.
+SKILLS
+Python, R, SQL, Excel, Tableau, Power BI, Statistics, Pandas, NumPy
+EXPERIENCE
+Data Analyst | Acme Corp | 2019 - 2024
+• Performed statistical analysis and data visualization for the sales team
+• Created dashboards and reports using Tableau and SQL
+• Ran A/B testing and predictive modeling for marketing campaigns
+EDUCATION
+MS Statistics, State University"""
+
+COVER_LETTER = ("Dear Hiring Manager,\nI am writing to apply for the data analyst role at your company. "
+                "I believe my background is a good fit for the team and I would welcome the chance to talk. "
+                "Thank you for your time and consideration of my application for this position.\n") * 2 + \
+               "Sincerely,\nJane Smith"
+
+def test_gate_reasons():
+    """Each kind of junk gets a typed rejection reason"""
+    assert screen_resume_text(RESUME) is None
+    assert screen_resume_text("   \n") is RejectionReason.EMPTY
+    assert screen_resume_text("%PDF-1.4 0x00 ###### //// 1234 5678 " * 20) is RejectionReason.GARBAGE
+    assert screen_resume_text("Python developer") is RejectionReason.TOO_SHORT
+    assert screen_resume_text("Experiencia profesional en desarrollo de software con Python y Java " * 10) \
+        is RejectionReason.NOT_ENGLISH
+    assert screen_resume_text(COVER_LETTER) is RejectionReason.COVER_LETTER
+
+    validation = validate_resume_text(RESUME)
+    assert validation['is_valid'] and validation['rejection_reason'] is None
+    assert validate_resume_text(COVER_LETTER)['rejection_reason'] is RejectionReason.COVER_LETTER
+
+def test_pipeline_short_circuits_junk():
+    """Rejected documents skip scoring and are counted separately"""
+    pipeline = BatchScoringPipeline('data_analyst')
+    results = pipeline.run([RESUME, "", COVER_LETTER, RESUME])
+
+    assert results[0]['overall_score'] > 0
+    assert results[1] == {'rejected': True, 'rejection_reason': 'empty'}
+    assert results[2]['rejection_reason'] == 'cover_letter'
+
+    stats = pipeline.stats()
+    assert stats['screened'] == 4 and stats['admitted'] == 2
+    assert stats['rejected']['empty'] == 1 and stats['rejected']['cover_letter'] == 1
+
+if __name__ == "__main__":
+    test_gate_reasons()
+    test_pipeline_short_circuits_junk()
+    print("✅ Batch pipeline tests passed!")
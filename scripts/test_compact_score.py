@@ -0,0 +1,56 @@
+# Test the compact score result and its conversion to the full result dict
+from ats_scorer import FORMAT_FLAGS, ATSScorer
+from field_recommender import get_field_recommendation
+from test_batch_pipeline import RESUME
+
+def test_compact_result_matches_dict():
+    """Lazily rebuilt fields match the dict returned by calculate_ats_score"""
+    scorer = ATSScorer('data_analyst')
+    compact = scorer.calculate_compact_score(RESUME)
+    results = scorer.calculate_ats_score(RESUME)
+
+    assert compact.to_dict() == results
+    assert compact.found_skills == results['found_skills']
+    assert compact.has_skill('Tableau') and not compact.has_skill('Looker')
+    assert compact.format_flags == sum(1 << bit for bit, flag in enumerate(FORMAT_FLAGS)
+                                       if results['format_details'][flag])
+    assert compact.recommendations == results['recommendations']
+
+def test_compact_result_is_small():
+    """No per-result dict, skill lists or recommendation strings are kept"""
+    compact = ATSScorer('software_engineering').calculate_compact_score(RESUME)
+    assert not hasattr(compact, '__dict__')
+    assert all(isinstance(getattr(compact, name), (int, str, tuple)) for name in compact.__slots__)
+
+def test_skill_in_required_and_preferred():
+    """A skill listed as both required and preferred is reported once, as the scorer does"""
+    import ats_scorer
+    original = ats_scorer._FIELD_SKILL_IDS['data_analyst']
+    required, preferred = original
+    ats_scorer._FIELD_SKILL_IDS['data_analyst'] = (required, required + preferred)
+    try:
+        scorer = ATSScorer('data_analyst')
+        compact = scorer.calculate_compact_score(RESUME)
+        assert compact.found_skills == scorer.calculate_ats_score(RESUME)['found_skills']
+        assert len(compact.found_skills) == len(set(compact.found_skills)) > 0
+    finally:
+        ats_scorer._FIELD_SKILL_IDS['data_analyst'] = original
+
+def test_score_stages():
+    """Stages arrive in display order and combine into the full result"""
+    scorer = ATSScorer('data_analyst')
+    stages = list(scorer.score_stages(RESUME))
+    assert [stage for stage, _ in stages] == ['skills', 'format', 'keywords', 'content']
+    assert 'Tableau' in stages[0][1][1]['found']
+
+    field_rec = get_field_recommendation(RESUME)
+    combined = scorer.combine_stages(RESUME, dict(stages), field_rec).to_dict()
+    assert combined == scorer.calculate_ats_score(RESUME)
+    assert scorer.calculate_ats_score(RESUME, field_rec) == combined
+
+if __name__ == "__main__":
+    test_compact_result_matches_dict()
+    test_compact_result_is_small()
+    test_skill_in_required_and_preferred()
+    test_score_stages()
+    print("✅ Compact score tests passed!")
@@ -0,0 +1,49 @@
+# Test the single-pass contact entity extractor
+from contact_extractor import extract_contacts, extract_contacts_batch
+from utils import extract_email, extract_phone, validate_resume_text
+
+HEADER = """John Doe | Austin, TX 78701
+john.doe@email.com | (555) 123-4567 | +44 20 7946 0958
+linkedin.com/in/johndoe | https://github.com/jdoe"""
+
+def test_extract_contacts():
+    """All entity kinds are found with their offsets in one pass"""
+    contacts = extract_contacts(HEADER)
+    assert [match.value for match in contacts['emails']] == ['john.doe@email.com']
+    assert [match.value for match in contacts['phones']] == ['(555) 123-4567', '+44 20 7946 0958']
+    assert [match.value for match in contacts['linkedin']] == ['linkedin.com/in/johndoe']
+    assert [match.value for match in contacts['github']] == ['https://github.com/jdoe']
+    assert [match.value for match in contacts['locations']] == ['Austin, TX 78701']
+
+    email = contacts['emails'][0]
+    assert HEADER[email.start:email.end] == email.value
+
+def test_years_are_not_phone_numbers():
+    """Date ranges, GPAs and skill lists are not contact details"""
+    text = "Developer | 2020-2024\nUniversity | 2012-2016 2018\nGPA: 3.8/4.0\nSkills: Python, Java"
+    contacts = extract_contacts(text)
+    assert contacts['phones'] == []
+    assert contacts['locations'] == []
+    assert not validate_resume_text(text)['has_contact']
+
+def test_phone_numbers_stop_before_years():
+    """Years after a number are not part of it, and year ranges are never phone numbers"""
+    text = "Phone: 555-123-4567 2019 2020"
+    phones = extract_contacts(text)['phones']
+    assert [phone.value for phone in phones] == ['555-123-4567']
+    assert text[phones[0].start:phones[0].end] == '555-123-4567'
+    assert extract_contacts("Acme 2015 2016 - 2019 2020")['phones'] == []
+
+def test_batch_and_helpers():
+    """The batch API and the utils helpers read from the same extractor"""
+    results = extract_contacts_batch([HEADER, "no contact here"])
+    assert len(results[0]['emails']) == 1 and results[1]['emails'] == []
+    assert extract_email(HEADER) == 'john.doe@email.com'
+    assert extract_phone(HEADER) == '(555) 123-4567'
+
+if __name__ == "__main__":
+    test_extract_contacts()
+    test_years_are_not_phone_numbers()
+    test_phone_numbers_stop_before_years()
+    test_batch_and_helpers()
+    print("✅ Contact extractor tests passed!")
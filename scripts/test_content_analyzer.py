@@ -0,0 +1,66 @@
+# Test the per-bullet content analyzer
+from content_analyzer import (BULLET, LEADING_VERB, LISTING, NUMBER, PERCENT, PROFESSIONAL,
+                              analyze_content, content_quality_score)
+from text_extractor import segment_sections
+
+RESUME = """Jane Smith
+jane@email.com | (555) 987-6543
+SKILLS
+• Python, SQL, Tableau
+EXPERIENCE
+Data Analyst | Acme Corp | 2019 - 2024
+• Led a team of 4 analysts building sales dashboards
+• Reduced reporting time by 40% for business clients
+• Worked on various projects
+1. Developed forecasting models in Python"""
+
+def test_per_bullet_flags():
+    """Each line gets its own flags; years are not figures and skills bullets are listings"""
+    analysis = analyze_content(RESUME, segment_sections(RESUME))
+    lines = [RESUME[start:end] for start, end in zip(analysis.line_starts, analysis.line_ends)]
+    flags = dict(zip(lines, analysis.flags))
+
+    assert flags["• Python, SQL, Tableau"] & LISTING
+    assert not flags["Data Analyst | Acme Corp | 2019 - 2024"] & NUMBER
+    assert flags["• Led a team of 4 analysts building sales dashboards"] & (BULLET | LEADING_VERB | NUMBER | PROFESSIONAL) \
+        == BULLET | LEADING_VERB | NUMBER | PROFESSIONAL
+    assert flags["• Reduced reporting time by 40% for business clients"] & PERCENT
+    assert flags["1. Developed forecasting models in Python"] & (BULLET | LEADING_VERB) == BULLET | LEADING_VERB
+
+    assert len(analysis.units) == 4
+    assert analysis.weak_bullets(RESUME) == ["• Worked on various projects"]
+    assert analysis.professional_terms == {'team', 'business', 'client', 'project'}
+
+def test_list_numbers_are_not_figures():
+    """The number of a numbered bullet does not count as quantified impact; figures after it do"""
+    text = "1. Led team meetings\n2) Cut costs by 15 percent\n12. Organized 2021 offsite"
+    analysis = analyze_content(text)
+    lines = [text[start:end] for start, end in zip(analysis.line_starts, analysis.line_ends)]
+    flags = dict(zip(lines, analysis.flags))
+
+    assert flags["1. Led team meetings"] & (BULLET | LEADING_VERB) == BULLET | LEADING_VERB
+    assert not flags["1. Led team meetings"] & NUMBER
+    assert flags["2) Cut costs by 15 percent"] & NUMBER
+    assert not flags["12. Organized 2021 offsite"] & NUMBER
+
+def test_offsets_of_original_text():
+    """Line offsets index the original text even where lowercasing changes its length; words match in any case"""
+    text = "İSTANBUL, İZMİR\n• DEVELOPED a reporting tool\n• Worked on various projects"
+    analysis = analyze_content(text)
+    assert [text[start:end] for start, end in zip(analysis.line_starts, analysis.line_ends)] == text.split('\n')
+    assert analysis.flags[1] & LEADING_VERB
+    assert analysis.weak_bullets(text) == ["• Worked on various projects"]
+
+def test_content_score():
+    """Strong, quantified bullets score higher than vague ones"""
+    strong = content_quality_score(analyze_content(RESUME))
+    weak = content_quality_score(analyze_content("Jane Smith\n• Worked on various things\n• Helped with tasks"))
+    assert strong == 20 + 25 + 20     # Three bullets lead with a verb, one has a percentage
+    assert weak == 0
+
+if __name__ == "__main__":
+    test_per_bullet_flags()
+    test_list_numbers_are_not_figures()
+    test_offsets_of_original_text()
+    test_content_score()
+    print("✅ Content analyzer tests passed!")
@@ -0,0 +1,78 @@
+# Test near-duplicate detection and cached score reuse in bulk runs
+from batch_pipeline import BatchScoringPipeline
+from dedup import MinHashLSH, estimate_similarity, minhash_signature
+from test_batch_pipeline import RESUME
+
+# Real resumes run to several hundred words; one small edit keeps them well above the threshold
+LONG_RESUME = RESUME + """
+Junior Data Analyst | Beta Retail | 2016 - 2019
+• Maintained weekly sales reports in Excel and migrated them to automated SQL queries
+• Cleaned and validated point-of-sale data from more than two hundred stores
+• Built forecasting models in R that reduced inventory waste across the northern region
+• Presented monthly findings on customer segments to regional managers and buyers
+• Documented data definitions and trained new analysts on the reporting workflow
+PROJECTS
+• Customer churn model in Python using scikit-learn, pandas and logistic regression
+• Open data dashboard of city transit usage published with Tableau Public"""
+
+EDITED_RESUME = LONG_RESUME.replace("Power BI, ", "Power BI, Looker, ")
+
+OTHER_RESUME = """John Doe
+john@email.com | (555) 123-4567
+SUMMARY
+Software engineer building web applications and cloud infrastructure for fintech startups.
+SKILLS
+JavaScript, React, Node.js, AWS, Docker, Kubernetes, Git
+EXPERIENCE
+Software Engineer | Beta Inc | 2018 - 2024
+• Developed REST APIs and microservices deployed on AWS
+• Led the migration of the frontend to React and TypeScript
+• Set up CI/CD pipelines with Docker and Jenkins
+EDUCATION
+BS Computer Science, Tech University"""
+
+def test_signatures():
+    """Signatures are deterministic and track shingle overlap"""
+    assert (minhash_signature("one two three") != minhash_signature("one two four")).any()
+    assert (minhash_signature(LONG_RESUME) == minhash_signature(LONG_RESUME)).all()
+    assert estimate_similarity(minhash_signature(LONG_RESUME), minhash_signature(EDITED_RESUME)) > 0.9
+    assert estimate_similarity(minhash_signature(LONG_RESUME), minhash_signature(OTHER_RESUME)) < 0.2
+
+def test_lsh_index():
+    """Only near-duplicates are returned by the index"""
+    index = MinHashLSH()
+    index.add('jane', minhash_signature(LONG_RESUME))
+    index.add('john', minhash_signature(OTHER_RESUME))
+
+    key, similarity = index.best_match(minhash_signature(EDITED_RESUME))
+    assert key == 'jane' and similarity > 0.9
+    assert index.best_match(minhash_signature("Completely unrelated text about gardening " * 5)) is None
+
+def test_pipeline_reuses_cached_scores():
+    """Near-duplicates skip scoring and carry the score of the first copy"""
+    pipeline = BatchScoringPipeline('data_analyst')
+    first, edited, other = pipeline.run([LONG_RESUME, EDITED_RESUME, OTHER_RESUME])
+
+    assert edited['duplicate_of'] == 0 and edited['overall_score'] == first['overall_score']
+    assert 'duplicate_of' not in other
+
+    stats = pipeline.stats()
+    assert stats['admitted'] == 3 and stats['duplicates'] == 1 and stats['scored'] == 2
+
+    results = BatchScoringPipeline('data_analyst', dedup=False).run([LONG_RESUME, EDITED_RESUME])
+    assert 'duplicate_of' not in results[1]
+
+def test_duplicate_of_is_input_position():
+    """duplicate_of points at the original's input position even when earlier documents were rejected"""
+    pipeline = BatchScoringPipeline('data_analyst')
+    rejected, first, other, edited = pipeline.run(['', LONG_RESUME, OTHER_RESUME, EDITED_RESUME])
+    assert rejected['rejected']
+    assert edited['duplicate_of'] == 1 and edited['overall_score'] == first['overall_score']
+    assert 'duplicate_of' not in other
+
+if __name__ == "__main__":
+    test_signatures()
+    test_lsh_index()
+    test_pipeline_reuses_cached_scores()
+    test_duplicate_of_is_input_position()
+    print("✅ Dedup tests passed!")
@@ -0,0 +1,41 @@
+# Test the experience timeline engine
+from datetime import date
+
+from experience_timeline import build_timeline, total_experience_months_batch
+from utils import extract_years_of_experience
+
+TODAY = date(2024, 6, 1)
+
+RESUME = """Jane Smith
+EXPERIENCE
+Senior Engineer | Acme | Jan 2019 – Present
+Engineer, Beta Corp (03/2016 - 06/2019)
+EDUCATION
+BS Computer Science | 2012-2016"""
+
+def test_build_timeline():
+    """Overlapping roles are merged and study dates are ignored"""
+    timeline = build_timeline(RESUME, TODAY)
+    assert [role.title for role in timeline['roles']] == ['Senior Engineer | Acme', 'Engineer, Beta Corp']
+    assert [role.months for role in timeline['roles']] == [66, 40]
+    # March 2016 through the current month, with the 2019 overlap counted once
+    assert timeline['total_months'] == 100
+    assert len(timeline['merged']) == 1
+
+def test_batch_matches_single():
+    """The vectorized batch merge gives the same totals as the per-resume timeline"""
+    texts = [RESUME, "No dates here", "Dev 2020-2024\nDev 2022 - 2023\nDev 2010 to 2011"]
+    totals = total_experience_months_batch(texts, TODAY)
+    assert list(totals) == [build_timeline(text, TODAY)['total_months'] for text in texts]
+    assert list(totals) == [100, 0, 60]
+
+def test_years_of_experience():
+    """Date ranges win over the first number before 'years'"""
+    assert extract_years_of_experience("Led 3 years of migrations\nExperience\nDev | 2010 - 2020") == 10
+    assert extract_years_of_experience("Engineer with 5+ years of experience") == 5
+
+if __name__ == "__main__":
+    test_build_timeline()
+    test_batch_matches_single()
+    test_years_of_experience()
+    print("✅ Experience timeline tests passed!")
@@ -0,0 +1,72 @@
+# Test the pure-NumPy forest predictor against scikit-learn
+import os
+import subprocess
+import sys
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from forest_predictor import ForestPredictor, flatten_model
+from test_model_artifact import TEXTS
+
+TRAINING_TEXTS = [
+    "python java docker kubernetes backend api", "react javascript frontend git api",
+    "sql tableau excel dashboards statistics", "pandas regression reporting excel sql",
+    "strategy clients workshops roadmap", "stakeholders business presentations strategy"
+]
+LABELS = ['software_engineering', 'software_engineering', 'data_analyst', 'data_analyst', 'consultant', 'consultant']
+
+def fit(texts=TRAINING_TEXTS, labels=LABELS, **params):
+    vectorizer = TfidfVectorizer(stop_words='english', **params)
+    model = RandomForestClassifier(n_estimators=40, random_state=0).fit(vectorizer.fit_transform(texts), labels)
+    return model, vectorizer
+
+def test_matches_scikit_learn():
+    """Probabilities and predictions match, including single-leaf trees from pure bootstrap samples"""
+    for texts, labels, params in ((TRAINING_TEXTS, LABELS, {}),
+                                  (TRAINING_TEXTS, LABELS, {'sublinear_tf': True, 'norm': 'l1'}),
+                                  (TRAINING_TEXTS[:3], LABELS[1:4], {})):
+        model, vectorizer = fit(texts, labels, **params)
+        predictor = ForestPredictor(*flatten_model(model, vectorizer))
+        texts = TRAINING_TEXTS + TEXTS
+        features = vectorizer.transform(texts)
+
+        predictions, probabilities = predictor.predict(texts)
+        assert np.allclose(probabilities, model.predict_proba(features))
+        assert predictions == list(model.predict(features))
+    assert any(estimator.tree_.node_count == 1 for estimator in model.estimators_)
+
+def test_rejects_other_models():
+    """Only TF-IDF vectorizers and forests can be flattened"""
+    model, vectorizer = fit()
+    for bad_model, bad_vectorizer in ((model.estimators_[0], vectorizer), (model, TfidfVectorizer(ngram_range=(1, 2)))):
+        try:
+            flatten_model(bad_model, bad_vectorizer)
+            assert False, "unsupported model was flattened"
+        except ValueError:
+            pass
+
+def test_rejects_unsupported_vectorizer_options():
+    """TF-IDF options the NumPy transform does not reproduce are refused instead of exported"""
+    for params in ({'binary': True}, {'strip_accents': 'unicode'}, {'use_idf': False}, {'dtype': np.float32}):
+        model, vectorizer = fit(**params)
+        try:
+            flatten_model(model, vectorizer)
+            assert False, f"vectorizer with {params} was flattened"
+        except ValueError:
+            pass
+
+def test_scoring_imports_no_scikit_learn():
+    """Loading the ATS system and an artifact does not import scikit-learn or pandas"""
+    code = "import sys, ats_system_fixed, model_artifact; print(sorted({'sklearn', 'pandas'} & set(sys.modules)))"
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+    assert output.strip().splitlines()[-1] == '[]'
+
+if __name__ == "__main__":
+    test_matches_scikit_learn()
+    test_rejects_other_models()
+    test_rejects_unsupported_vectorizer_options()
+    test_scoring_imports_no_scikit_learn()
+    print("✅ Forest predictor tests passed!")
@@ -0,0 +1,58 @@
+# Test the cascade of rule-based and ML field classification
+import os
+import tempfile
+
+from field_recommender import get_field_recommendation
+from hybrid_classifier import HybridFieldClassifier
+from test_ats_system import make_system, make_training_csv
+
+CLEAR_RESUME = """Software Engineer
+Experience
+Developed python and java microservices with docker and kubernetes.
+Built react frontends, rest api backends, git workflows and aws deployments.
+Skills: python, java, javascript, react, docker, kubernetes, aws, git, sql, api"""
+
+UNCLEAR_RESUME = "Ran sql reporting and client workshops on strategy"
+
+def test_cascade():
+    """Confident rule decisions skip the model; unsure ones are decided by it"""
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'resumes.csv')
+        make_training_csv(csv_path, rows=150)
+        system = make_system(directory)
+        assert system.train_model_from_csv(csv_path)
+
+        classifier = HybridFieldClassifier(system)
+        assert not classifier.needs_model(get_field_recommendation(CLEAR_RESUME))
+        assert classifier.needs_model(get_field_recommendation(UNCLEAR_RESUME))
+
+        clear, unclear = classifier.classify_batch([CLEAR_RESUME, UNCLEAR_RESUME])
+        assert clear['stage'] == 'rules' and clear['field'] == 'software_engineering' and clear['model_field'] is None
+        assert unclear['stage'] == 'model' and unclear['field'] == unclear['model_field']
+        assert unclear['model_confidence'] is not None
+
+        stats = classifier.stats()
+        assert (stats['decided_by_rules'], stats['decided_by_model']) == (1, 1)
+        assert stats['model_call_rate'] == 0.5
+        assert stats['agreement_rate'] == float(unclear['model_field'] == unclear['rule_field'])
+
+        # Audits run the model on rule decisions without changing them
+        auditing = HybridFieldClassifier(system, audit_every=1)
+        audited = auditing.classify(CLEAR_RESUME)
+        assert audited['stage'] == 'rules' and audited['model_field'] is not None
+        assert auditing.stats()['audits'] == 1 and auditing.stats()['agreement_rate'] is not None
+
+def test_untrained_model_falls_back_to_rules():
+    """Without a trained model escalated resumes keep the rule decision"""
+    with tempfile.TemporaryDirectory() as directory:
+        classifier = HybridFieldClassifier(make_system(directory))
+        result = classifier.classify(UNCLEAR_RESUME)
+        assert result['stage'] == 'rules' and result['escalated']
+        assert result['field'] == get_field_recommendation(UNCLEAR_RESUME)['recommended_field']
+        assert classifier.stats()['escalations_without_model'] == 1
+        assert classifier.stats()['agreement_rate'] is None
+
+if __name__ == "__main__":
+    test_cascade()
+    test_untrained_model_falls_back_to_rules()
+    print("✅ Hybrid classifier tests passed!")
@@ -1,5 +1,61 @@
 # Test the improved scoring system
 from ats_scorer import ATSScorer
+from config import SECTION_SKILL_WEIGHTS
+from skills_database import SKILL_IDS
+from text_extractor import segment_sections
+
+# Skills in sections of every weight: contact (0), education (0.5), summary (0.75) and skills/experience (1)
+SECTIONED_RESUME = """Alex Lee
+alex@email.com | github.com/alex | Git
+SUMMARY
+Analyst and engineer working with Tableau, Python, stakeholder management and strategy.
+SKILLS
+SQL, Excel, JavaScript, React, Docker, AWS, Power BI, project management
+EXPERIENCE
+Consultant | Acme | 2019 - 2024
+• Built statistics dashboards and ran client workshops on business analysis
+EDUCATION
+BS Computer Science, coursework in Java, R and machine learning"""
+
+def _list_scan_counts(scorer, resume_text):
+    """Skill counts and score of the list-scanning matcher that the bit masks replaced"""
+    sections = segment_sections(resume_text)
+    found, missing, weights = [], [], {}
+    for skill in scorer.required_skills + scorer.preferred_skills:
+        if skill in weights:
+            continue
+        weight, _ = scorer._find_skill_in_sections(skill, resume_text, sections)
+        if weight > 0:
+            found.append(skill)
+            weights[skill] = weight
+        elif skill in scorer.required_skills:
+            missing.append(skill)
+    required_found = sum(weights.get(skill, 0) for skill in scorer.required_skills)
+    preferred_found = sum(weights.get(skill, 0) for skill in scorer.preferred_skills)
+    score = 0
+    if scorer.required_skills:
+        score += required_found / len(scorer.required_skills) * 70
+    if scorer.preferred_skills:
+        score += preferred_found / len(scorer.preferred_skills) * 30
+    score += 10 if len(found) >= 8 else 5 if len(found) >= 5 else 0
+    return required_found, preferred_found, len(found), found, missing[:10], min(100, score)
+
+def test_bitset_skill_counts_match_list_scan():
+    """Bit mask counts equal the list-scan counts across fields, profiles and section weights"""
+    for profile in ('thorough', 'fast'):
+        for field in ('software_engineering', 'data_analyst', 'consultant'):
+            scorer = ATSScorer(field, profile)
+            for text in (SECTIONED_RESUME.lower(), "no skills here", ""):
+                score, details = scorer._calculate_skills_score_improved(text)
+                found_required = [skill for skill in details['found'] if scorer.required_mask >> SKILL_IDS[skill] & 1]
+                found_preferred = [skill for skill in details['found'] if scorer.preferred_mask >> SKILL_IDS[skill] & 1]
+                required_found = sum(SECTION_SKILL_WEIGHTS.get(details['sections'][skill], 1.0) for skill in found_required)
+                preferred_found = sum(SECTION_SKILL_WEIGHTS.get(details['sections'][skill], 1.0) for skill in found_preferred)
+
+                expected = _list_scan_counts(scorer, text)
+                assert (required_found, preferred_found, bin(details['found_bits']).count('1')) == expected[:3], (field, text)
+                assert (sorted(details['found']), details['missing']) == (sorted(expected[3]), expected[4])
+                assert abs(score - expected[5]) < 1e-9
 
 def test_improved_scoring():
     """Test the improved ATS scoring system"""
@@ -122,3 +178,4 @@ def test_improved_scoring():
 
 if __name__ == "__main__":
     test_improved_scoring()
+    test_bitset_skill_counts_match_list_scan()
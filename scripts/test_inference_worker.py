@@ -0,0 +1,87 @@
+# Test the warm inference worker: concurrent clients, micro-batches and stats
+import os
+import stat
+import tempfile
+import threading
+
+from multiprocessing import AuthenticationError
+
+from inference_worker import InferenceClient, InferenceWorker, load_authkey
+from test_ats_system import make_system, make_training_csv
+from test_model_artifact import TEXTS
+
+AUTHKEY = b'test-key'
+
+def test_concurrent_clients_share_batches():
+    """Concurrent requests are answered correctly and grouped into batches of the model's calls;
+    malformed requests are answered with an error"""
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'resumes.csv')
+        make_training_csv(csv_path, rows=150)
+        system = make_system(directory)
+        assert system.train_model_from_csv(csv_path)
+        expected = [system.calculate_ats_score(text) or {'error': 'No valid text found in resume'} for text in TEXTS]
+
+        worker = InferenceWorker(system, ('127.0.0.1', 0), batch_window_ms=200, max_batch_size=len(TEXTS),
+                                 authkey=AUTHKEY).start()
+        try:
+            start = threading.Barrier(len(TEXTS))
+            replies = [None] * len(TEXTS)
+
+            def request(index):
+                with InferenceClient(worker.address, AUTHKEY) as client:
+                    start.wait()
+                    replies[index] = client.predict(TEXTS[index])
+
+            threads = [threading.Thread(target=request, args=(index,)) for index in range(len(TEXTS))]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert replies == expected
+
+            with InferenceClient(worker.address, AUTHKEY) as client:
+                stats = client.stats()
+            assert stats['requests'] == len(TEXTS)
+            assert stats['batches'] < len(TEXTS) and max(stats['batch_sizes']) > 1
+            assert stats['latency_ms']['p50'] <= stats['latency_ms']['p99']
+
+            # Malformed requests get an error reply and the connection stays usable
+            with InferenceClient(worker.address, AUTHKEY) as client:
+                client.connection.send('not a request')
+                assert 'error' in client.connection.recv()
+                assert client.predict(TEXTS[0]) == expected[0]
+
+            try:
+                InferenceClient(worker.address, b'wrong-key')
+                assert False, "client with the wrong key was accepted"
+            except AuthenticationError:
+                pass
+        finally:
+            worker.close()
+
+def test_authkey_file():
+    """Without ATS_WORKER_AUTHKEY a user-only key file is generated once and reused; open files are refused"""
+    import inference_worker
+    original = inference_worker.INFERENCE_WORKER_AUTHKEY
+    inference_worker.INFERENCE_WORKER_AUTHKEY = None
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'key')
+            key = load_authkey(path)
+            assert len(key) == 64 and load_authkey(path) == key
+            assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+            os.chmod(path, 0o644)
+            try:
+                load_authkey(path)
+                assert False, "readable key file was accepted"
+            except ValueError as e:
+                assert 'owner only' in str(e)
+    finally:
+        inference_worker.INFERENCE_WORKER_AUTHKEY = original
+
+if __name__ == "__main__":
+    test_concurrent_clients_share_batches()
+    test_authkey_file()
+    print("✅ Inference worker tests passed!")
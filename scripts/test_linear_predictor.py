@@ -0,0 +1,47 @@
+# Test the pure-NumPy linear predictor against scikit-learn
+import random
+
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+from sklearn.utils import murmurhash3_32 as sklearn_murmurhash3_32
+
+from linear_predictor import LinearPredictor, flatten_linear_model, murmurhash3_32
+from test_forest_predictor import LABELS, TRAINING_TEXTS
+from test_model_artifact import TEXTS
+
+def test_murmurhash_matches_scikit_learn():
+    """Every tail length and multi-byte characters hash as scikit-learn hashes them"""
+    shuffle = random.Random(0)
+    tokens = ['', 'a', 'ab', 'abc', 'abcd', 'abcde', 'héllo', '日本語'] + [
+        ''.join(shuffle.choice('abxyzé') for _ in range(shuffle.randint(1, 12))) for _ in range(500)]
+    for token in tokens:
+        assert murmurhash3_32(token) == sklearn_murmurhash3_32(token, seed=0), token
+
+def test_matches_scikit_learn():
+    """Probabilities match for multiclass and binary models, signed, binary, l1 and unnormalized features"""
+    texts = TEXTS + ["the and of", "sql sql sql tableau", "python Python PYTHON java"]
+    for params in ({'alternate_sign': False}, {}, {'binary': True, 'n_features': 8},
+                   {'norm': 'l1', 'n_features': 16}, {'norm': None}):
+        vectorizer = HashingVectorizer(stop_words='english', **params)
+        for labels in (LABELS, [label == 'consultant' for label in LABELS]):
+            model = SGDClassifier(loss='log_loss', random_state=0).fit(vectorizer.transform(TRAINING_TEXTS), labels)
+            predictor = LinearPredictor(*flatten_linear_model(model, vectorizer))
+            expected = model.predict_proba(vectorizer.transform(texts))
+            assert np.allclose(predictor.predict_proba(texts), expected), params
+            assert predictor.predict(texts)[0] == [str(label) for label in model.predict(vectorizer.transform(texts))]
+
+def test_rejects_unsupported_models():
+    vectorizer = HashingVectorizer()
+    model = SGDClassifier(loss='hinge').fit(vectorizer.transform(TRAINING_TEXTS), LABELS)
+    try:
+        flatten_linear_model(model, vectorizer)
+        assert False, "hinge loss model was exported"
+    except ValueError as e:
+        assert 'logistic' in str(e)
+
+if __name__ == "__main__":
+    test_murmurhash_matches_scikit_learn()
+    test_matches_scikit_learn()
+    test_rejects_unsupported_models()
+    print("✅ Linear predictor tests passed!")
@@ -0,0 +1,97 @@
+# Test exported model artifacts: lazy memory-mapped loading, checksums and versions
+import os
+import tempfile
+
+import numpy as np
+
+from ats_system_fixed import ATSSystem
+from model_artifact import ModelArtifact, export_artifact, latest_version
+from test_ats_system import make_system, make_training_csv
+
+TEXTS = [
+    "Built tableau dashboards and sql reporting with pandas",
+    "Designed microservices in java and python with docker",
+    "Ran client workshops on strategy and roadmap presentations",
+    "",
+    "unrelated words only"
+]
+
+def train(directory: str):
+    csv_path = os.path.join(directory, 'resumes.csv')
+    make_training_csv(csv_path, rows=150)
+    system = make_system(directory)
+    assert system.train_model_from_csv(csv_path)
+    return system
+
+def test_artifact_matches_model():
+    """The artifact reproduces the forest's probabilities without scikit-learn objects"""
+    with tempfile.TemporaryDirectory() as directory:
+        system = train(directory)
+        expected = system.model.predict_proba(system.vectorizer.transform(TEXTS))
+        artifact = ModelArtifact.latest(system.model_dir)
+        assert artifact.classes == list(system.model.classes_)
+        assert np.allclose(artifact.predict_proba(TEXTS), expected)
+
+def test_linear_artifact_matches_model():
+    """A streamed hashing + SGD model is exported and reproduced without scikit-learn objects"""
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'resumes.csv')
+        make_training_csv(csv_path, rows=150)
+        system = make_system(directory)
+        assert system.train_model_streaming(csv_path, chunk_size=50)
+        expected = system.model.predict_proba(system.vectorizer.transform(TEXTS + ["The and of \u00e9t\u00e9 caf\u00e9"]))
+        artifact = ModelArtifact.latest(system.model_dir)
+        assert artifact.model_type == 'linear' and artifact.classes == list(system.model.classes_)
+        assert np.allclose(artifact.predict_proba(TEXTS + ["The and of \u00e9t\u00e9 caf\u00e9"]), expected)
+
+def test_lazy_loading_and_versions():
+    """Construction reads only the manifest; each export is a new version"""
+    with tempfile.TemporaryDirectory() as directory:
+        system = train(directory)
+        expected = system.calculate_ats_score(TEXTS[0])
+
+        reloaded = make_system(directory)
+        assert reloaded.is_trained and reloaded.model is None and not reloaded.artifact.is_loaded
+        assert reloaded.calculate_ats_score(TEXTS[0]) == expected
+        assert reloaded.artifact.is_loaded
+        assert isinstance(reloaded.artifact.arrays['threshold'], np.memmap)
+
+        assert latest_version(system.model_dir) == 'v0001'
+        export_artifact(system.model, system.vectorizer, system.model_dir)
+        assert latest_version(system.model_dir) == 'v0002'
+        assert os.path.exists(os.path.join(system.model_dir, 'v0001', 'manifest.json'))
+
+def test_artifacts_follow_model_file():
+    """Without a model_dir each model file has its own artifact directory"""
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'resumes.csv')
+        make_training_csv(csv_path, rows=150)
+        trained = ATSSystem(os.path.join(directory, 'a.pkl'))
+        assert trained.model_dir == os.path.join(directory, 'a')
+        assert trained.train_model_from_csv(csv_path)
+
+        other = ATSSystem(os.path.join(directory, 'b.pkl'))
+        assert not other.is_trained and other.artifact is None
+        assert ATSSystem(os.path.join(directory, 'a.pkl')).artifact.version == 'v0001'
+
+def test_checksum_mismatch():
+    """A corrupted array is refused on first use"""
+    with tempfile.TemporaryDirectory() as directory:
+        system = train(directory)
+        path = os.path.join(system.artifact.directory, 'threshold.npy')
+        with open(path, 'r+b') as f:
+            f.seek(-8, os.SEEK_END)
+            f.write(b'\xff' * 8)
+        try:
+            ModelArtifact(system.artifact.directory).predict_proba(TEXTS)
+            assert False, "corrupted artifact was loaded"
+        except ValueError as e:
+            assert 'Checksum mismatch' in str(e)
+
+if __name__ == "__main__":
+    test_artifact_matches_model()
+    test_linear_artifact_matches_model()
+    test_lazy_loading_and_versions()
+    test_artifacts_follow_model_file()
+    test_checksum_mismatch()
+    print("✅ Model artifact tests passed!")
@@ -0,0 +1,42 @@
+# Test cross-validated training on cached feature matrices
+import json
+import os
+import tempfile
+
+from model_training import parameter_candidates, train_with_cross_validation
+from test_ats_system import make_system, make_training_csv
+
+GRID = {'n_estimators': [5, 10], 'max_depth': [None, 4]}
+
+def test_cross_validated_training():
+    """Every candidate is scored on every fold, and the best forest is saved"""
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'resumes.csv')
+        report_path = os.path.join(directory, 'report.json')
+        cache_dir = os.path.join(directory, 'cache')
+        make_training_csv(csv_path, rows=120)
+        system = make_system(directory)
+
+        report = train_with_cross_validation(system, csv_path, folds=3, param_grid=GRID, n_jobs=2,
+                                             cache_dir=cache_dir, report_file=report_path)
+        assert report['feature_cache'] == 'miss'
+        assert len(report['fold_results']) == len(parameter_candidates(GRID)) * 3 == 12
+        assert all(result['fit_seconds'] >= 0 and 0 <= result['accuracy'] <= 1 for result in report['fold_results'])
+        assert report['best_params'] == report['candidates'][0]['params']
+        with open(report_path) as f:
+            assert json.load(f)['rows'] == 120
+
+        assert system.is_trained and system.accuracy == report['candidates'][0]['mean_accuracy']
+        results = system.calculate_ats_score("Built tableau dashboards and sql reporting with pandas")
+        assert results['predicted_category'] == 'data_analyst'
+
+        # The second run reuses the fitted vectorizer and matrix
+        again = train_with_cross_validation(system, csv_path, folds=3, param_grid=GRID, n_jobs=1,
+                                            cache_dir=cache_dir, report_file=report_path)
+        assert again['feature_cache'] == 'hit'
+        assert [result['accuracy'] for result in again['fold_results']] == \
+               [result['accuracy'] for result in report['fold_results']]
+
+if __name__ == "__main__":
+    test_cross_validated_training()
+    print("✅ Model training tests passed!")
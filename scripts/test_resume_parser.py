@@ -0,0 +1,61 @@
+# Test the structured resume parser and the compact resume store
+from datetime import date
+
+from resume_parser import ResumeStore, parse_resume
+
+TODAY = date(2024, 6, 1)
+
+RESUME = """Jane Smith
+jane@email.com
+EXPERIENCE
+Senior Data Analyst | Acme Corp | Jan 2020 - Present
+• Built Tableau dashboards and SQL pipelines
+Data Analyst at Beta Inc (2017 - 2020)
+• Automated Excel reports with Python
+EDUCATION
+MS Statistics, State University | 2015-2017
+SKILLS
+Python, R, SQL, Tableau, Excel"""
+
+def test_parse_resume():
+    """Roles, employers, dates, degrees and per-role skills are parsed"""
+    resume = parse_resume(RESUME, TODAY)
+    titles = [(role.title, role.employer) for role in resume.roles]
+    assert titles == [('Senior Data Analyst', 'Acme Corp'), ('Data Analyst', 'Beta Inc')]
+    assert resume.roles[0].skills == ['SQL', 'Tableau']
+    assert resume.roles[1].skills == ['Excel', 'Python']
+    assert resume.roles[0].months == 54
+    assert resume.total_months == 90
+
+    degree = resume.education[0]
+    assert (degree.degree, degree.institution) == ('MS Statistics', 'State University')
+    assert (degree.start, degree.end) == (2015 * 12, 2017 * 12)
+    assert set(resume.skills) == {'Excel', 'Python', 'R', 'SQL', 'Statistics', 'Tableau'}
+
+def test_resume_store_round_trip():
+    """The columnar store serializes compactly and answers filters"""
+    store = ResumeStore()
+    store.extend([parse_resume(RESUME, TODAY), parse_resume("Jane\nEXPERIENCE\nIntern | 2023 - 2024", TODAY)])
+
+    loaded = ResumeStore.from_bytes(store.to_bytes())
+    assert len(loaded) == 2
+    assert repr(loaded[0]) == repr(store[0])
+    assert list(loaded.filter(min_months=24)) == [0]
+    assert list(loaded.filter(skills=['Tableau'])) == [0]
+    assert list(loaded.filter(skills=['Java'])) == []
+
+def test_resume_store_filter_skill_names():
+    """Skill filters ignore case, accept generators and match nothing for unknown skills"""
+    store = ResumeStore()
+    store.extend([parse_resume(RESUME, TODAY), parse_resume("Jane\nEXPERIENCE\nIntern | 2023 - 2024", TODAY)])
+    assert list(store.filter(skills=['python', 'TABLEAU'])) == [0]
+    assert list(store.filter(skills=(skill for skill in ['sql']))) == [0]
+    assert list(store.filter(skills=iter(()))) == [0, 1]
+    assert list(store.filter(skills=['Basket Weaving'])) == []
+    assert list(ResumeStore().filter(skills=['python'])) == []
+
+if __name__ == "__main__":
+    test_parse_resume()
+    test_resume_store_round_trip()
+    test_resume_store_filter_skill_names()
+    print("✅ Resume parser tests passed!")
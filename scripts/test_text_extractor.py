@@ -0,0 +1,219 @@
+# Test format sniffing and text extraction
+import io
+import os
+import tempfile
+import zipfile
+
+import docx
+
+import config
+import text_extractor
+from text_extractor import (
+    DocumentRejected, admit_document, declared_pdf_page_count, detect_format,
+    clean_text, extract_sections, extract_text_from_bytes, extract_text_from_file, segment_sections
+)
+from ats_scorer import ATSScorer
+
+def make_pdf(pages):
+    """Build a minimal PDF with one line of text per page"""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None,
+               "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>")
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(pages)} >>"
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(f"{number} 0 obj\n{body}\nendobj\n".encode('latin-1'))
+    xref = out.tell()
+    out.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode())
+    for offset in offsets:
+        out.write(f"{offset:010d} 00000 n \n".encode())
+    out.write(f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode())
+    return out.getvalue()
+
+def make_docx(paragraphs):
+    """Build a DOCX document in memory"""
+    document = docx.Document()
+    for paragraph in paragraphs:
+        document.add_paragraph(paragraph)
+    out = io.BytesIO()
+    document.save(out)
+    return out.getvalue()
+
+def test_detect_format():
+    """Formats are detected from content, not file names"""
+    assert detect_format(make_pdf(["Python developer"])) == 'pdf'
+    assert detect_format(make_docx(["Python developer"])) == 'docx'
+    assert detect_format(b"{\\rtf1\\ansi Python developer}") == 'rtf'
+    assert detect_format(b"<!DOCTYPE html><html><body>Python</body></html>") == 'html'
+    assert detect_format("Python developer, Zürich".encode('utf-8')) == 'txt'
+    assert detect_format(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\x00" * 100) == 'doc'
+    assert detect_format(b"\x89PNG\r\n\x1a\n\x00\x00") == 'unknown'
+
+def test_fast_path_extraction():
+    """TXT, HTML and RTF are parsed without the PDF/DOCX libraries"""
+    html = b"<html><head><style>p {color: red}</style></head><body><h1>SKILLS</h1><p>Python &amp; SQL</p></body></html>"
+    assert extract_text_from_bytes(html) == "SKILLS\nPython & SQL"
+
+    rtf = b"{\\rtf1\\ansi{\\fonttbl{\\f0 Arial;}}\\f0 EXPERIENCE\\par Built caf\\'e9 APIs\\par}"
+    assert extract_text_from_bytes(rtf) == "EXPERIENCE\nBuilt café APIs"
+
+    assert extract_text_from_bytes(b"\xef\xbb\xbfPython  developer\n") == "Python developer"
+
+def test_pdf_and_docx_extraction():
+    """PDF and DOCX are routed to their parsers"""
+    assert "Python developer" in extract_text_from_bytes(make_pdf(["Python developer"]))
+    assert extract_text_from_bytes(make_docx(["EDUCATION", "BS Computer Science"])) == "EDUCATION\nBS Computer Science"
+
+def test_unsupported_format():
+    """Legacy .doc and unknown binaries are rejected"""
+    for data in (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\x00" * 100, b"\x89PNG\r\n\x1a\n\x00\x00"):
+        try:
+            extract_text_from_bytes(data)
+        except ValueError:
+            continue
+        raise AssertionError("unsupported format was not rejected")
+
+def test_extension_is_ignored():
+    """A DOCX saved with a .pdf name is still parsed as DOCX"""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
+        tmp_file.write(make_docx(["SKILLS", "Python"]))
+    try:
+        assert extract_text_from_file(tmp_file.name) == "SKILLS\nPython"
+    finally:
+        os.unlink(tmp_file.name)
+
+def assert_rejected(data, reason):
+    """Assert that admission rejects the document without invoking a parser"""
+    def fail_parser(_):
+        raise AssertionError("parser ran on a rejected document")
+
+    original = dict(text_extractor.EXTRACTORS)
+    text_extractor.EXTRACTORS.update({name: fail_parser for name in original})
+    try:
+        extract_text_from_bytes(data)
+    except DocumentRejected as e:
+        assert e.reason == reason, e.reason
+    else:
+        raise AssertionError(f"document was not rejected ({reason})")
+    finally:
+        text_extractor.EXTRACTORS.update(original)
+
+def test_admission_limits():
+    """Oversized, long, zip-bomb and unsupported documents never reach a parser"""
+    assert declared_pdf_page_count(make_pdf(["one", "two", "three"])) == 3
+    assert admit_document(make_pdf(["one"])) == 'pdf'
+
+    assert_rejected(b"x" * (config.MAX_FILE_SIZE_MB * 1024 * 1024 + 1), 'too_large')
+    assert_rejected(make_pdf(["page"] * (config.MAX_PAGES + 1)), 'too_many_pages')
+    assert_rejected(b"\x89PNG\r\n\x1a\n\x00\x00", 'unsupported_format')
+
+    bomb = io.BytesIO()
+    with zipfile.ZipFile(bomb, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', '<Types/>')
+        archive.writestr('word/document.xml', ' ' * (20 * 1024 * 1024))
+    assert_rejected(bomb.getvalue(), 'zip_bomb')
+
+SECTIONED_RESUME = """Jane Smith
+jane@email.com | github.com/jane
+PROFESSIONAL SUMMARY
+Experienced developer.
+Experience:
+Developer | Acme | 2020-2024
+CERTIFICATIONS
+AWS Certified
+Skills: Python, SQL
+Education
+BS Computer Science"""
+
+def test_segment_sections():
+    """Headings become character spans; 'other' headings close the previous section"""
+    spans = segment_sections(SECTIONED_RESUME)
+    assert list(spans) == ['contact', 'summary', 'experience', 'skills', 'education']
+    assert SECTIONED_RESUME[slice(*spans['experience'])].strip() == "Developer | Acme | 2020-2024"
+    assert SECTIONED_RESUME[slice(*spans['skills'])].strip() == "Python, SQL"
+
+    sections = extract_sections(SECTIONED_RESUME)
+    assert sections['contact'] == "Jane Smith\njane@email.com | github.com/jane"
+    assert sections['projects'] == ''
+
+def test_section_scoped_scoring():
+    """Contact comes from the header block and header links are not skills"""
+    results = ATSScorer('software_engineering').calculate_ats_score(SECTIONED_RESUME)
+    assert 'Git' not in results['found_skills']
+    assert 'Python' in results['found_skills']
+    assert results['format_details']['has_contact']
+    assert results['format_details']['has_summary']
+
+def test_normalization():
+    """Ligatures, soft hyphens, hyphenation, quotes, bullets and whitespace are normalized"""
+    raw = "  Proﬁcient in efﬁcient work\u00adﬂows \u2013 \u201cAPIs\u201d\r\n\r\n  Devel-\n  oped   tools\t\n\u25cf Led\u00a0team  "
+    assert clean_text(raw) == 'Proficient in efficient workflows - "APIs"\nDeveloped tools\n\u2022 Led team'
+    # Capitalized continuations are compounds, not hyphenation
+    assert clean_text("Node-\nJS") == "Node-\nJS"
+
+def test_parallel_pdf_matches_serial():
+    """Parallel page extraction returns the serial text byte-for-byte"""
+    original = (config.PDF_PARALLEL_MIN_PAGES, config.PDF_PARALLEL_WORKERS)
+    config.PDF_PARALLEL_MIN_PAGES, config.PDF_PARALLEL_WORKERS = 4, 3
+    try:
+        data = make_pdf([f"Page {number} Python SQL" for number in range(1, 21)])
+        serial = extract_text_from_bytes(data, parallel=False)
+        parallel = extract_text_from_bytes(data, parallel=True)
+        assert parallel == serial
+        assert serial.index("Page 2 ") < serial.index("Page 20 ")
+    finally:
+        config.PDF_PARALLEL_MIN_PAGES, config.PDF_PARALLEL_WORKERS = original
+
+def test_performance_profiles():
+    """The fast profile caps pages and words and skips DOCX tables and recommendation text"""
+    document = docx.Document()
+    document.add_paragraph("EXPERIENCE")
+    table = document.add_table(rows=1, cols=2)
+    table.cell(0, 0).text, table.cell(0, 1).text = "Data Analyst", "2019 - 2024"
+    out = io.BytesIO()
+    document.save(out)
+    assert extract_text_from_bytes(out.getvalue(), profile='thorough') == "EXPERIENCE\nData Analyst | 2019 - 2024"
+    assert extract_text_from_bytes(out.getvalue(), profile='fast') == "EXPERIENCE"
+
+    pdf = make_pdf([f"Page {number}" for number in range(1, 11)])
+    assert "Page 4" not in extract_text_from_bytes(pdf, profile='fast')
+    assert "Page 10" in extract_text_from_bytes(pdf, profile='thorough')
+
+    assert extract_text_from_bytes(b"Python developer\nSQL", profile='fast') == "Python developer\nSQL"
+    long_text = ("word " * 3000).encode()
+    assert len(extract_text_from_bytes(long_text, profile='fast').split()) == config.PERFORMANCE_PROFILES['fast']['max_words']
+
+    fast = ATSScorer('software_engineering', profile='fast').calculate_ats_score(SECTIONED_RESUME)
+    assert fast['recommendations'] == [] and fast['field_recommendation'] is None
+    assert 'Python' in fast['found_skills']
+
+    original = config.PERFORMANCE_PROFILE
+    config.PERFORMANCE_PROFILE = 'fast'
+    try:
+        assert ATSScorer('software_engineering').calculate_ats_score(SECTIONED_RESUME) == fast
+    finally:
+        config.PERFORMANCE_PROFILE = original
+
+if __name__ == "__main__":
+    test_detect_format()
+    test_fast_path_extraction()
+    test_pdf_and_docx_extraction()
+    test_unsupported_format()
+    test_extension_is_ignored()
+    test_admission_limits()
+    test_parallel_pdf_matches_serial()
+    test_normalization()
+    test_segment_sections()
+    test_section_scoped_scoring()
+    test_performance_profiles()
+    print("✅ Text extraction tests passed!")
@@ -1,17 +1,374 @@
-import PyPDF2
-import docx
+import io
+import os
 import re
-from typing import Optional
+import unicodedata
+import zipfile
+from html.parser import HTMLParser
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Tuple
 
-def extract_text_from_pdf(file_path: str) -> str:
-    """Extract text from PDF file"""
+import config
+
+# Number of leading bytes inspected when sniffing the document format
+SNIFF_BYTES = 2048
+
+def detect_format(data: bytes) -> str:
+    """Detect the document format from its leading bytes"""
+    head = data[:SNIFF_BYTES]
+    
+    if head.startswith(b'%PDF-'):
+        return 'pdf'
+    if head.startswith(b'PK\x03\x04'):
+        # DOCX is a zip container with a word/ part
+        try:
+            with zipfile.ZipFile(io.BytesIO(data)) as archive:
+                if any(name.startswith('word/') for name in archive.namelist()):
+                    return 'docx'
+        except zipfile.BadZipFile:
+            pass
+        return 'zip'
+    if head.startswith(b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'):
+        # Legacy OLE2 container (.doc), not parseable by python-docx
+        return 'doc'
+    
+    stripped = head.lstrip(b'\xef\xbb\xbf \t\r\n')
+    if stripped.startswith(b'{\\rtf'):
+        return 'rtf'
+    lowered = stripped[:512].lower()
+    if lowered.startswith((b'<!doctype html', b'<html')) or b'<html' in lowered or b'<body' in lowered:
+        return 'html'
+    
+    if b'\x00' not in head:
+        return 'txt'
+    if head.startswith((b'\xff\xfe', b'\xfe\xff')):
+        return 'txt'
+    return 'unknown'
+
+class DocumentRejected(ValueError):
+    """Raised when a document fails the admission checks before parsing"""
+    
+    def __init__(self, reason: str, message: str):
+        super().__init__(message)
+        self.reason = reason
+
+_PDF_TRAILER_ROOT = re.compile(rb'/Root\s+(\d+)\s+(\d+)\s+R')
+_PDF_PAGES_REF = re.compile(rb'/Pages\s+(\d+)\s+(\d+)\s+R')
+_PDF_COUNT = re.compile(rb'/Count\s+(\d+)')
+
+def _find_pdf_object(data: bytes, number: bytes, generation: bytes) -> Optional[bytes]:
+    """Return the body of the last definition of a PDF object"""
+    pattern = re.compile(rb'(?<!\d)' + number + rb'\s+' + generation + rb'\s+obj\b(.*?)endobj', re.DOTALL)
+    body = None
+    for match in pattern.finditer(data):
+        body = match.group(1)
+    return body
+
+def declared_pdf_page_count(data: bytes) -> Optional[int]:
+    """Read the page count declared by the PDF trailer's page tree root"""
+    # The last trailer (or xref stream dictionary) sits at the end of the file
+    roots = _PDF_TRAILER_ROOT.findall(data[-4096:])
+    if not roots:
+        return None
+    catalog = _find_pdf_object(data, *roots[-1])
+    if catalog is None:
+        return None
+    pages_ref = _PDF_PAGES_REF.search(catalog)
+    if not pages_ref:
+        return None
+    pages = _find_pdf_object(data, *pages_ref.groups())
+    if pages is None:
+        return None
+    count = _PDF_COUNT.search(pages)
+    return int(count.group(1)) if count else None
+
+def check_file_size(size: int) -> None:
+    """Reject documents above the configured byte size"""
+    if size > config.MAX_FILE_SIZE_MB * 1024 * 1024:
+        raise DocumentRejected(
+            'too_large', f"File is {size / (1024 * 1024):.1f} MB, the limit is {config.MAX_FILE_SIZE_MB} MB"
+        )
+
+def admit_document(data: bytes) -> str:
+    """Run the admission checks and return the detected format"""
+    check_file_size(len(data))
+    
+    file_format = detect_format(data)
+    if file_format not in config.ALLOWED_EXTENSIONS:
+        raise DocumentRejected('unsupported_format', f"Unsupported file format: {file_format}")
+    
+    if file_format == 'pdf':
+        page_count = declared_pdf_page_count(data)
+        if page_count is not None and page_count > config.MAX_PAGES:
+            raise DocumentRejected(
+                'too_many_pages', f"Document has {page_count} pages, the limit is {config.MAX_PAGES}"
+            )
+    elif file_format == 'docx':
+        # Only the zip central directory is read, nothing is decompressed
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            entries = archive.infolist()
+        uncompressed = sum(entry.file_size for entry in entries)
+        compressed = sum(entry.compress_size for entry in entries)
+        if uncompressed > config.MAX_DOCX_UNCOMPRESSED_MB * 1024 * 1024:
+            raise DocumentRejected(
+                'zip_bomb', f"DOCX expands to {uncompressed / (1024 * 1024):.1f} MB, "
+                            f"the limit is {config.MAX_DOCX_UNCOMPRESSED_MB} MB"
+            )
+        if compressed and uncompressed / compressed > config.MAX_DOCX_COMPRESSION_RATIO:
+            raise DocumentRejected('zip_bomb', "DOCX compression ratio is suspiciously high")
+    
+    return file_format
+
+def _decode_text(data: bytes) -> str:
+    """Decode text bytes, honoring a BOM and falling back to latin-1"""
+    if data.startswith((b'\xff\xfe', b'\xfe\xff')):
+        return data.decode('utf-16')
     try:
+        return data.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        return data.decode('latin-1')
+
+def _extract_pdf_pages(data: bytes, start: int, stop: int) -> List[str]:
+    """Extract the text of pages [start, stop) of a PDF, one string per page"""
+    import PyPDF2
+    
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(data))
+    return [pdf_reader.pages[index].extract_text() + "\n" for index in range(start, stop)]
+
+_pdf_pool = None
+_pdf_pool_workers = 0
+
+def _get_pdf_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the shared process pool used for parallel PDF extraction"""
+    global _pdf_pool, _pdf_pool_workers
+    if _pdf_pool is None or _pdf_pool_workers != workers:
+        _shutdown_pdf_pool()
+        _pdf_pool = ProcessPoolExecutor(max_workers=workers)
+        _pdf_pool_workers = workers
+    return _pdf_pool
+
+def _shutdown_pdf_pool() -> None:
+    """Shut down the shared PDF process pool, if any"""
+    global _pdf_pool, _pdf_pool_workers
+    if _pdf_pool is not None:
+        _pdf_pool.shutdown(wait=False)
+    _pdf_pool = None
+    _pdf_pool_workers = 0
+
+def _parse_pdf(data: bytes, parallel: Optional[bool] = None, max_pages: Optional[int] = None) -> str:
+    """Extract text from PDF bytes
+    
+    Only the first ``max_pages`` pages are read when a page cap is given.
+    With parallel extraction enabled, documents of at least
+    PDF_PARALLEL_MIN_PAGES pages are split into contiguous page ranges that
+    are extracted in a process pool and joined back in page order, giving
+    the same text as the serial path.
+    """
+    import PyPDF2
+    
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(data))
+    page_count = len(pdf_reader.pages)
+    # Catches documents whose page count was not declared in plain text
+    if page_count > config.MAX_PAGES:
+        raise DocumentRejected(
+            'too_many_pages', f"Document has {page_count} pages, the limit is {config.MAX_PAGES}"
+        )
+    
+    if max_pages is not None:
+        page_count = min(page_count, max_pages)
+    
+    if parallel is None:
+        parallel = config.PDF_PARALLEL_EXTRACTION
+    workers = min(config.PDF_PARALLEL_WORKERS or os.cpu_count() or 1, page_count)
+    
+    if not parallel or workers < 2 or page_count < config.PDF_PARALLEL_MIN_PAGES:
         text = ""
+        for page in pdf_reader.pages[:page_count]:
+            text += page.extract_text() + "\n"
+        return text
+    
+    chunk = -(-page_count // workers)
+    ranges = [(start, min(start + chunk, page_count)) for start in range(0, page_count, chunk)]
+    try:
+        pool = _get_pdf_pool(workers)
+        futures = [pool.submit(_extract_pdf_pages, data, start, stop) for start, stop in ranges]
+        return ''.join(''.join(future.result()) for future in futures)
+    except BrokenProcessPool:
+        # A crashed worker poisons the pool; drop it and fall back to the serial path
+        _shutdown_pdf_pool()
+        return ''.join(_extract_pdf_pages(data, 0, page_count))
+
+def _parse_docx(data: bytes, tables: bool = True) -> str:
+    """Extract text from DOCX bytes, with table rows in document order when ``tables`` is set"""
+    import docx
+    from docx.table import Table
+    from docx.text.paragraph import Paragraph
+    
+    doc = docx.Document(io.BytesIO(data))
+    if not tables:
+        return "".join(paragraph.text + "\n" for paragraph in doc.paragraphs)
+    
+    lines = []
+    for child in doc.element.body.iterchildren():
+        if child.tag.endswith('}p'):
+            lines.append(Paragraph(child, doc).text)
+        elif child.tag.endswith('}tbl'):
+            # Resumes often lay out sections in tables; one line per row.
+            # Merged cells repeat their text, so consecutive duplicates are dropped.
+            for row in Table(child, doc).rows:
+                cells = []
+                for cell in row.cells:
+                    if cell.text and (not cells or cells[-1] != cell.text):
+                        cells.append(cell.text)
+                lines.append(" | ".join(cells))
+    return "".join(line + "\n" for line in lines)
+
+def _parse_txt(data: bytes) -> str:
+    """Extract text from plain text bytes"""
+    return _decode_text(data)
+
+class _HTMLTextParser(HTMLParser):
+    """Collect visible text from an HTML document"""
+    
+    # Tags whose content is never rendered as text
+    SKIP_TAGS = {'script', 'style', 'head', 'title', 'noscript'}
+    # Tags that start a new line of text
+    BLOCK_TAGS = {'p', 'div', 'br', 'li', 'tr', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+                  'section', 'article', 'header', 'footer', 'ul', 'ol', 'table'}
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.skip_depth = 0
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self.skip_depth += 1
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append("\n")
+    
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS:
+            self.skip_depth = max(0, self.skip_depth - 1)
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append("\n")
+    
+    def handle_data(self, data):
+        if not self.skip_depth:
+            self.parts.append(data)
+
+def _parse_html(data: bytes) -> str:
+    """Extract visible text from HTML bytes"""
+    parser = _HTMLTextParser()
+    parser.feed(_decode_text(data))
+    parser.close()
+    return ''.join(parser.parts)
+
+# RTF tokens: escaped hex char, unicode escape, control word, escaped symbol, group braces, text
+_RTF_TOKEN = re.compile(
+    r"\\'([0-9a-fA-F]{2})|\\u(-?\d+) ?\??|\\([a-zA-Z]+)(-?\d+)? ?|\\([^a-zA-Z])|([{}])|([^\\{}\r\n]+)"
+)
+
+# Destinations whose content is metadata rather than document text
+_RTF_SKIP_DESTINATIONS = {
+    'fonttbl', 'colortbl', 'stylesheet', 'info', 'pict', 'header', 'footer',
+    'object', 'themedata', 'datastore', 'latentstyles', 'listtable', 'listoverridetable',
+    'rsidtbl', 'generator', 'xmlnstbl', 'mmathPr'
+}
+
+_RTF_SPECIAL_WORDS = {'par': "\n", 'line': "\n", 'tab': "\t", 'sect': "\n", 'row': "\n", 'cell': " "}
+
+def _parse_rtf(data: bytes) -> str:
+    """Extract text from RTF bytes with a single tokenizing pass"""
+    source = data.decode('latin-1')
+    parts = []
+    stack = []
+    skipping = False
+    
+    for match in _RTF_TOKEN.finditer(source):
+        hex_char, unicode_char, word, _, symbol, brace, text = match.groups()
+        if brace == '{':
+            stack.append(skipping)
+        elif brace == '}':
+            skipping = stack.pop() if stack else False
+        elif skipping:
+            continue
+        elif word is not None:
+            if word in _RTF_SKIP_DESTINATIONS:
+                skipping = True
+            elif word in _RTF_SPECIAL_WORDS:
+                parts.append(_RTF_SPECIAL_WORDS[word])
+        elif symbol is not None:
+            if symbol == '*':
+                # Ignorable destination
+                skipping = True
+            elif symbol in '\\{}':
+                parts.append(symbol)
+            elif symbol == '~':
+                parts.append(' ')
+        elif hex_char is not None:
+            parts.append(bytes([int(hex_char, 16)]).decode('cp1252', errors='replace'))
+        elif unicode_char is not None:
+            parts.append(chr(int(unicode_char) % 65536))
+        elif text is not None:
+            parts.append(text)
+    
+    return ''.join(parts)
+
+# Format registry: detected format -> parser taking the raw document bytes
+# (plus the keyword options from _parser_options)
+EXTRACTORS: Dict[str, Callable[..., str]] = {
+    'pdf': _parse_pdf,
+    'docx': _parse_docx,
+    'txt': _parse_txt,
+    'html': _parse_html,
+    'rtf': _parse_rtf,
+}
+
+def truncate_words(text: str, max_words: Optional[int]) -> str:
+    """Keep the first max_words words of text, with their line breaks"""
+    if not max_words or len(text.split()) <= max_words:
+        return text
+    # Each word must be followed by whitespace, so the match cannot backtrack into words
+    match = re.match(r'\s*(?:\S+\s+){%d}\S+' % (max_words - 1), text)
+    return text[:match.end()]
+
+def _parser_options(file_format: str, settings: Dict, parallel: Optional[bool]) -> Dict:
+    """Keyword arguments a parser takes from the performance profile"""
+    if file_format == 'pdf':
+        return {'parallel': parallel, 'max_pages': settings['max_pages']}
+    if file_format == 'docx':
+        return {'tables': settings['docx_tables']}
+    return {}
+
+def extract_text_from_bytes(data: bytes, parallel: Optional[bool] = None, profile: Optional[str] = None) -> str:
+    """Extract text from document bytes, routing on the sniffed format
+    
+    ``parallel`` overrides config.PDF_PARALLEL_EXTRACTION for PDF input.
+    ``profile`` names the performance profile that sets the page and word
+    caps and DOCX table parsing; the process profile is used by default.
+    """
+    settings = config.get_performance_profile(profile)
+    file_format = admit_document(data)
+    parser = EXTRACTORS.get(file_format)
+    if parser is None:
+        raise DocumentRejected('unsupported_format', f"Unsupported file format: {file_format}")
+    
+    try:
+        text = clean_text(parser(data, **_parser_options(file_format, settings, parallel)))
+        return truncate_words(text, settings['max_words'])
+    except DocumentRejected:
+        raise
+    except Exception as e:
+        print(f"Error extracting text from {file_format.upper()}: {e}")
+        return ""
+
+def extract_text_from_pdf(file_path: str, parallel: Optional[bool] = None) -> str:
+    """Extract text from PDF file"""
+    try:
+        check_file_size(os.path.getsize(file_path))
         with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-        return clean_text(text)
+            return clean_text(_parse_pdf(file.read(), parallel=parallel))
     except Exception as e:
         print(f"Error extracting text from PDF: {e}")
         return ""
@@ -19,71 +376,153 @@ def extract_text_from_pdf(file_path: str) -> str:
 def extract_text_from_docx(file_path: str) -> str:
     """Extract text from DOCX file"""
     try:
-        doc = docx.Document(file_path)
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return clean_text(text)
+        check_file_size(os.path.getsize(file_path))
+        with open(file_path, 'rb') as file:
+            return clean_text(_parse_docx(file.read()))
     except Exception as e:
         print(f"Error extracting text from DOCX: {e}")
         return ""
 
+# Characters rewritten during normalization: ligatures, invisible marks,
+# typographic quotes and dashes, and the many glyphs used as bullets
+_LIGATURES = {'\ufb00': 'ff', '\ufb01': 'fi', '\ufb02': 'fl', '\ufb03': 'ffi', '\ufb04': 'ffl',
+              '\ufb05': 'st', '\ufb06': 'st'}
+_INVISIBLE = '\u00ad\u200b\u200c\u200d\u2060\ufeff'
+_QUOTES = {'\u2018': "'", '\u2019': "'", '\u201a': "'", '\u201b': "'", '\u2032': "'",
+           '\u201c': '"', '\u201d': '"', '\u201e': '"', '\u201f': '"', '\u2033': '"'}
+_DASHES = '\u2010\u2011\u2012\u2013\u2014\u2015\u2212'
+_BULLETS = ('\u2022\u2023\u2043\u2219\u25aa\u25ab\u25cf\u25cb\u25e6\u25a0\u25a1\u25c6\u25c7'
+            '\u25ba\u25b8\u27a2\u27a4\u2714\u2713\u2756\u00b7\uf0b7\uf0a7\uf0d8\uf076')
+
+# Precomputed replacement table for the characters above
+_CHAR_REPLACEMENTS = {
+    **_LIGATURES,
+    **_QUOTES,
+    **{char: '' for char in _INVISIBLE},
+    **{char: '-' for char in _DASHES},
+    **{char: '\u2022' for char in _BULLETS}
+}
+
+_SPECIAL_CHARS = re.escape(''.join(_CHAR_REPLACEMENTS))
+
+# One pass over the text: join words hyphenated across a line break,
+# unify line endings and blank lines, collapse runs of spaces and
+# rewrite the special characters from the table. The leading lookahead
+# lets the scanner skip ordinary characters without trying each branch.
+_NORMALIZE_PASS = re.compile(
+    r'(?=[-\u00ad\s' + _SPECIAL_CHARS + r'])(?:'
+    r'(?P<hyphen>[-\u00ad](?<=[^\W\d_][-\u00ad])[^\S\r\n]*(?:\r\n?|\n)[^\S\r\n]*(?=[a-z]))'
+    r'|(?P<trailing>[^\S\r\n]+(?=[\r\n]))'
+    r'|(?P<newline>(?:\r\n?|\n)\s*)'
+    r'|(?P<space>[^\S\r\n]{2,}|[^\S\r\n ])'
+    r'|(?P<char>[' + _SPECIAL_CHARS + r']))'
+)
+_GROUP_REPLACEMENTS = {'hyphen': '', 'trailing': '', 'newline': '\n', 'space': ' '}
+
+def _replace_match(match) -> str:
+    group = match.lastgroup
+    if group == 'char':
+        return _CHAR_REPLACEMENTS[match.group()]
+    return _GROUP_REPLACEMENTS[group]
+
 def clean_text(text: str) -> str:
-    """Clean and normalize extracted text"""
-    # Remove extra whitespace and normalize
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
-    return text
-
-def extract_text_from_file(file_path: str) -> Optional[str]:
-    """Extract text from file based on extension"""
-    file_extension = file_path.lower().split('.')[-1]
-    
-    if file_extension == 'pdf':
-        return extract_text_from_pdf(file_path)
-    elif file_extension == 'docx':
-        return extract_text_from_docx(file_path)
-    else:
-        raise ValueError(f"Unsupported file format: {file_extension}")
+    """Normalize extracted text in a single pipeline
+    
+    Non-ASCII text gets Unicode NFKC (which also expands most ligatures),
+    then one regex pass de-hyphenates line breaks, collapses whitespace and
+    rewrites quotes, dashes, bullet glyphs and invisible characters from a
+    precomputed table. Line breaks are kept because section detection
+    relies on them.
+    """
+    if not text.isascii():
+        text = unicodedata.normalize('NFKC', text)
+    text = _NORMALIZE_PASS.sub(_replace_match, text)
+    return text.strip()
+
+def extract_text_from_file(file_path: str, parallel: Optional[bool] = None,
+                           profile: Optional[str] = None) -> Optional[str]:
+    """Extract text from file based on its content, not its extension"""
+    check_file_size(os.path.getsize(file_path))
+    with open(file_path, 'rb') as file:
+        data = file.read()
+    return extract_text_from_bytes(data, parallel=parallel, profile=profile)
+
+# Section heading vocabulary; 'other' headings only terminate the previous section
+SECTION_HEADINGS = {
+    'summary': ['summary', 'professional summary', 'career summary', 'objective', 'career objective',
+                'profile', 'professional profile', 'about me', 'overview', 'introduction'],
+    'experience': ['experience', 'professional experience', 'work experience', 'work history',
+                   'employment', 'employment history', 'career history', 'relevant experience'],
+    'education': ['education', 'academic background', 'academic qualifications', 'qualifications',
+                  'education and training', 'education & training'],
+    'skills': ['skills', 'technical skills', 'key skills', 'core skills', 'skills and tools',
+               'skills & tools', 'core competencies', 'competencies', 'technical proficiencies'],
+    'projects': ['projects', 'personal projects', 'key projects', 'academic projects', 'selected projects'],
+    'other': ['certifications', 'certificates', 'awards', 'honors', 'achievements', 'publications',
+              'languages', 'interests', 'hobbies', 'references', 'volunteer experience', 'volunteering',
+              'activities', 'courses', 'training']
+}
+
+SECTION_NAMES = ['contact', 'summary', 'experience', 'education', 'skills', 'projects']
+
+_HEADING_LOOKUP = {
+    heading: section for section, headings in SECTION_HEADINGS.items() for heading in headings
+}
+
+# A heading is a whole line, or a line prefix followed by a colon ("Skills: Python, SQL")
+_HEADING_LINE = re.compile(
+    r'^[ \t]*(' + '|'.join(sorted(map(re.escape, _HEADING_LOOKUP), key=len, reverse=True)) +
+    r')[ \t]*(?::[ \t]*|$)',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Lines kept as the header block when a document has no detectable headings
+CONTACT_BLOCK_LINES = 5
+
+def segment_sections(text: str) -> Dict[str, Tuple[int, int]]:
+    """Split resume text into (start, end) character spans per section
+    
+    Headings are classified in a single pass over the lines. The contact span
+    is the header block before the first heading. Only the first occurrence of
+    a section is kept.
+    """
+    spans = {}
+    current = 'contact'
+    start = 0
+    
+    for match in _HEADING_LINE.finditer(text):
+        if current not in spans and match.start() > start:
+            spans[current] = (start, match.start())
+        current = _HEADING_LOOKUP[match.group(1).lower()]
+        start = match.end()
+    
+    if current == 'contact':
+        # No headings: treat the first few lines as the header block
+        end = 0
+        for _ in range(CONTACT_BLOCK_LINES):
+            end = text.find('\n', end + 1)
+            if end == -1:
+                end = len(text)
+                break
+        if end > 0:
+            spans['contact'] = (0, end)
+    elif current not in spans and len(text) > start:
+        spans[current] = (start, len(text))
+    
+    spans.pop('other', None)
+    return spans
+
+def section_at(spans: Dict[str, Tuple[int, int]], position: int) -> str:
+    """Return the section containing a character position, or 'other'"""
+    for section, (start, end) in spans.items():
+        if start <= position < end:
+            return section
+    return 'other'
 
 def extract_sections(text: str) -> dict:
-    """Extract different sections from resume text - SIMPLIFIED VERSION"""
-    sections = {
-        'contact': '',
-        'summary': '',
-        'experience': '',
-        'education': '',
-        'skills': ''
+    """Extract the text of each resume section (empty string when absent)"""
+    spans = segment_sections(text)
+    return {
+        section: text[spans[section][0]:spans[section][1]].strip() if section in spans else ''
+        for section in SECTION_NAMES
     }
-    
-    # Simple section extraction based on common keywords
-    text_lower = text.lower()
-    
-    # Contact information - SIMPLIFIED DETECTION
-    if '@' in text and '.' in text:
-        sections['contact'] = 'Found'
-    elif any(char.isdigit() for char in text):
-        sections['contact'] = 'Found'
-    
-    # Experience section
-    exp_keywords = ['experience', 'work history', 'employment', 'professional experience']
-    for keyword in exp_keywords:
-        if keyword in text_lower:
-            sections['experience'] = 'Found'
-            break
-    
-    # Education section
-    edu_keywords = ['education', 'academic', 'degree', 'university', 'college']
-    for keyword in edu_keywords:
-        if keyword in text_lower:
-            sections['education'] = 'Found'
-            break
-    
-    # Skills section
-    skill_keywords = ['skills', 'technical skills', 'competencies', 'technologies']
-    for keyword in skill_keywords:
-        if keyword in text_lower:
-            sections['skills'] = 'Found'
-            break
-    
-    return sections
@@ -1,23 +1,20 @@
-from typing import List, Dict
+import re
+from enum import Enum
+from typing import List, Dict, Optional
 from datetime import datetime
+from config import VALIDATION_GATE
+from contact_extractor import extract_contacts
+from experience_timeline import years_of_experience
 
 def extract_email(text: str) -> str:
-    """Extract email address from text - SIMPLIFIED VERSION"""
-    words = text.split()
-    for word in words:
-        if '@' in word and '.' in word:
-            return word.strip('.,!?;')
-    return ""
+    """Extract the first email address from text"""
+    emails = extract_contacts(text)['emails']
+    return emails[0].value if emails else ""
 
 def extract_phone(text: str) -> str:
-    """Extract phone number from text - SIMPLIFIED VERSION"""
-    words = text.split()
-    for word in words:
-        # Look for words with digits and common phone separators
-        if any(char.isdigit() for char in word) and len(word) >= 10:
-            if any(sep in word for sep in ['-', '.', '(', ')']):
-                return word.strip('.,!?;')
-    return ""
+    """Extract the first phone number from text"""
+    phones = extract_contacts(text)['phones']
+    return phones[0].value if phones else ""
 
 def calculate_reading_time(text: str) -> int:
     """Calculate estimated reading time in minutes"""
@@ -26,21 +23,8 @@ def calculate_reading_time(text: str) -> int:
     return max(1, words // 200)
 
 def extract_years_of_experience(text: str) -> int:
-    """Extract years of experience from resume text - SIMPLIFIED"""
-    text_lower = text.lower()
-    
-    # Look for common patterns
-    if 'years' in text_lower:
-        words = text_lower.split()
-        for i, word in enumerate(words):
-            if word == 'years' and i > 0:
-                prev_word = words[i-1]
-                # Try to extract number from previous word
-                numbers = ''.join(filter(str.isdigit, prev_word))
-                if numbers:
-                    return int(numbers)
-    
-    return 0
+    """Extract years of experience from the merged employment timeline"""
+    return years_of_experience(text)
 
 def clean_skill_name(skill: str) -> str:
     """Clean and standardize skill names"""
@@ -121,14 +105,94 @@ def generate_report_summary(score_results: Dict) -> str:
     
     return summary.strip()
 
-def validate_resume_text(text: str) -> Dict[str, bool]:
-    """Validate if resume text contains essential elements - SIMPLIFIED"""
+class RejectionReason(Enum):
+    """Why the validation gate turned a document away"""
+    EMPTY = 'empty'
+    GARBAGE = 'garbage'
+    TOO_SHORT = 'too_short'
+    NOT_ENGLISH = 'not_english'
+    COVER_LETTER = 'cover_letter'
+    NO_RESUME_SIGNALS = 'no_resume_signals'
+
+# Word, number or symbol run; classified by the matching group
+_GATE_TOKEN = re.compile(r'(?P<word>[^\W\d_]+)|(?P<digit>\d+)|(?P<symbol>[^\w\s]+|_+)')
+
+_STOPWORDS = frozenset(
+    'a an and the of in on at to for with by from as is are was were be been i my me we our '
+    'you your it its this that these those or but not have has had will can'.split()
+)
+_SECTION_SIGNALS = frozenset(
+    'experience education skills summary objective profile projects employment certifications '
+    'qualifications competencies internship internships work'.split()
+)
+_COVER_LETTER_SIGNALS = frozenset('dear sincerely regards hiring applying enclosed faithfully'.split())
+
+def resume_text_stats(text: str) -> Dict[str, int]:
+    """Count the character classes and signal words the gate needs in one pass"""
+    stats = {
+        'words': 0, 'letters': 0, 'non_ascii_letters': 0, 'digits': 0, 'symbols': 0,
+        'stopwords': 0, 'cover_letter_signals': 0
+    }
+    sections = set()
+    
+    for match in _GATE_TOKEN.finditer(text):
+        kind = match.lastgroup
+        token = match.group()
+        if kind == 'word':
+            stats['words'] += 1
+            stats['letters'] += len(token)
+            if not token.isascii():
+                stats['non_ascii_letters'] += len(token)
+                continue
+            word = token.lower()
+            if word in _STOPWORDS:
+                stats['stopwords'] += 1
+            elif word in _SECTION_SIGNALS:
+                sections.add(word)
+            elif word in _COVER_LETTER_SIGNALS:
+                stats['cover_letter_signals'] += 1
+        elif kind == 'digit':
+            stats['digits'] += len(token)
+        else:
+            stats['symbols'] += len(token)
+    
+    stats['section_signals'] = len(sections)
+    return stats
+
+def screen_resume_text(text: str, stats: Optional[Dict[str, int]] = None) -> Optional[RejectionReason]:
+    """Fast first-stage gate: return why a document is not a resume, or None to admit it"""
+    if not text or text.isspace():
+        return RejectionReason.EMPTY
+    if stats is None:
+        stats = resume_text_stats(text)
+    
+    characters = stats['letters'] + stats['digits'] + stats['symbols']
+    if stats['letters'] < VALIDATION_GATE['min_letter_ratio'] * characters:
+        return RejectionReason.GARBAGE
+    if stats['words'] < VALIDATION_GATE['min_words']:
+        return RejectionReason.TOO_SHORT
+    if (stats['non_ascii_letters'] > VALIDATION_GATE['max_non_ascii_ratio'] * stats['letters'] or
+            stats['stopwords'] < VALIDATION_GATE['min_stopword_ratio'] * stats['words']):
+        return RejectionReason.NOT_ENGLISH
+    if (stats['cover_letter_signals'] >= VALIDATION_GATE['cover_letter_signals'] and
+            stats['section_signals'] <= VALIDATION_GATE['cover_letter_max_sections']):
+        return RejectionReason.COVER_LETTER
+    if stats['section_signals'] < VALIDATION_GATE['min_section_signals']:
+        return RejectionReason.NO_RESUME_SIGNALS
+    return None
+
+def validate_resume_text(text: str) -> Dict:
+    """Validate if resume text contains essential elements"""
+    stats = resume_text_stats(text)
+    reason = screen_resume_text(text, stats)
+    contacts = extract_contacts(text)
     validation = {
-        'has_text': len(text.strip()) > 0,
-        'min_length': len(text.split()) >= 50,
-        'has_contact': '@' in text or any(char.isdigit() for char in text),
-        'has_sections': any(keyword in text.lower() for keyword in ['experience', 'education', 'skills', 'summary'])
+        'has_text': reason is not RejectionReason.EMPTY,
+        'min_length': stats['words'] >= VALIDATION_GATE['min_words'],
+        'has_contact': bool(contacts['emails'] or contacts['phones']),
+        'has_sections': stats['section_signals'] > 0
     }
     
-    validation['is_valid'] = all(validation.values())
+    validation['is_valid'] = all(validation.values()) and reason is None
+    validation['rejection_reason'] = reason
     return validation